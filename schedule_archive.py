@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+Multi-Edition Schedule Archive for the Conference Schedule Generator
+Keeps every edition of the school in one SQLite file, so past programs can be
+queried across years and re-rendered without digging out old script copies.
+
+Usage:
+    python3 schedule_archive.py import NAME [schedule.json|.yaml|.csv|old_script.py] [--recordings CSV]
+    python3 schedule_archive.py query [--title GNN] [--presenter NAME] [--color session2]
+                                      [--from 2025-11-01] [--to 2025-12-31] [--edition NAME]
+    python3 schedule_archive.py render NAME [-o schedule-NAME.html]
+    python3 schedule_archive.py list
+    (all take --db PATH, default schedule_archive.sqlite)
+
+Tables:
+    editions     one row per edition: name, title, dates
+    days         day_name, date, iso_date, start_time, parallel tracks
+    events       one row per event, in track order, with its own fields
+    presenters   unique presenter names
+    materials    slides and recordings from recordings.csv, linked to the
+                 event they matched (event_id is NULL for unmatched rows)
+    event_terms  normalized title tokens, for indexed title lookups
+
+Titles, presenters, colors and dates are indexed: --title matches every
+word as a token prefix (so "gnn" finds "GNNs in Document Analysis"), and
+the other filters are exact. Importing a name that already exists replaces
+that edition. Old script copies are loaded by running them as modules and
+reading their SCHEDULE_METADATA, so only import scripts you trust.
+
+Rendering reads one day at a time from the cursors, so memory does not grow
+with the number of days; the output matches generate_full_html() for the
+imported metadata.
+"""
+
+import json
+import sqlite3
+from contextlib import closing
+from typing import Dict, Iterator, List, Optional
+
+import schedule_geneartor as generator
+from schedule_links import normalize_presenter, normalize_text
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+ARCHIVE_PATH = "schedule_archive.sqlite"
+SCHEMA_VERSION = 1
+
+# Event keys with their own column; every other key goes into events.extra
+EVENT_COLUMNS = ("title", "duration_minutes", "start_time", "color", "link", "video_link", "room")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS editions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    dates TEXT NOT NULL,
+    extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS days (
+    id INTEGER PRIMARY KEY,
+    edition_id INTEGER NOT NULL REFERENCES editions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    day_name TEXT NOT NULL,
+    date TEXT,
+    iso_date TEXT,
+    start_time TEXT,
+    tracks TEXT,
+    extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS presenters (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_norm TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    day_id INTEGER NOT NULL REFERENCES days(id) ON DELETE CASCADE,
+    track INTEGER,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    title_norm TEXT NOT NULL,
+    duration_minutes INTEGER,
+    start_time TEXT,
+    color TEXT,
+    link TEXT,
+    video_link TEXT,
+    room TEXT,
+    presenter_id INTEGER REFERENCES presenters(id),
+    extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS event_terms (
+    term TEXT NOT NULL,
+    event_id INTEGER NOT NULL REFERENCES events(id) ON DELETE CASCADE,
+    PRIMARY KEY (term, event_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS materials (
+    id INTEGER PRIMARY KEY,
+    edition_id INTEGER NOT NULL REFERENCES editions(id) ON DELETE CASCADE,
+    event_id INTEGER REFERENCES events(id) ON DELETE CASCADE,
+    presenter_id INTEGER REFERENCES presenters(id),
+    kind TEXT NOT NULL,
+    uri TEXT NOT NULL,
+    line INTEGER
+);
+CREATE INDEX IF NOT EXISTS days_by_edition ON days(edition_id, position);
+CREATE INDEX IF NOT EXISTS days_by_date ON days(iso_date);
+CREATE INDEX IF NOT EXISTS events_by_day ON events(day_id, track, position);
+CREATE INDEX IF NOT EXISTS events_by_title ON events(title_norm);
+CREATE INDEX IF NOT EXISTS events_by_presenter ON events(presenter_id);
+CREATE INDEX IF NOT EXISTS events_by_color ON events(color);
+CREATE INDEX IF NOT EXISTS event_terms_by_event ON event_terms(event_id);
+CREATE INDEX IF NOT EXISTS materials_by_event ON materials(event_id);
+CREATE INDEX IF NOT EXISTS materials_by_edition ON materials(edition_id);
+"""
+
+# ============================================================================
+# CONNECTION
+# ============================================================================
+
+def connect(path: str = ARCHIVE_PATH) -> sqlite3.Connection:
+    """Open (and if needed create) the archive."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version not in (0, SCHEMA_VERSION):
+        conn.close()
+        raise ValueError(f"{path}: archive schema version {version}, expected {SCHEMA_VERSION}")
+    conn.executescript(SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+def title_terms(title: str) -> List[str]:
+    """Distinct normalized words of a title, as stored in event_terms."""
+    return sorted(set(normalize_text(title).split()))
+
+# ============================================================================
+# IMPORT
+# ============================================================================
+
+def load_script_metadata(path: str) -> Dict:
+    """SCHEDULE_METADATA of an old copy of the generator script."""
+    import runpy
+    from schedule_sources import normalize_schedule, validate_schedule
+    namespace = runpy.run_path(path, run_name="schedule_archive_import")
+    metadata = namespace.get('SCHEDULE_METADATA')
+    if not isinstance(metadata, dict):
+        raise ValueError(f"{path}: no SCHEDULE_METADATA found")
+    errors = validate_schedule(metadata)
+    if errors:
+        raise ValueError(f"{path}: invalid schedule:\n  " + "\n  ".join(errors))
+    return normalize_schedule(metadata)
+
+def load_edition_source(path: str) -> Dict:
+    """Metadata from a schedule file or an old generator script."""
+    if path.lower().endswith(".py"):
+        return load_script_metadata(path)
+    from schedule_sources import load_schedule
+    return load_schedule(path)
+
+def _presenter_id(conn: sqlite3.Connection, name: Optional[str]) -> Optional[int]:
+    if not name:
+        return None
+    norm = normalize_presenter(name)
+    conn.execute("INSERT OR IGNORE INTO presenters (name, name_norm) VALUES (?, ?)", (name, norm))
+    return conn.execute("SELECT id FROM presenters WHERE name_norm = ?", (norm,)).fetchone()[0]
+
+def _insert_events(conn: sqlite3.Connection, day_id: int, track: Optional[int],
+                   events: List[Dict], matches: Dict[int, int], index) -> None:
+    for position, event in enumerate(events):
+        extra = {key: value for key, value in event.items()
+                 if key not in EVENT_COLUMNS and key != 'presenter'}
+        cursor = conn.execute(
+            "INSERT INTO events (day_id, track, position, title, title_norm, duration_minutes, start_time,"
+            " color, link, video_link, room, presenter_id, extra) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (day_id, track, position, event['title'], normalize_text(event['title']),
+             *(event.get(key) for key in EVENT_COLUMNS[1:]),
+             _presenter_id(conn, event.get('presenter')),
+             json.dumps(extra, ensure_ascii=False, sort_keys=True)))
+        event_id = cursor.lastrowid
+        conn.executemany("INSERT OR IGNORE INTO event_terms (term, event_id) VALUES (?, ?)",
+                         [(term, event_id) for term in title_terms(event['title'])])
+        if index is not None:
+            number = index.match(event)
+            if number is not None:
+                matches.setdefault(number, event_id)
+
+def _insert_materials(conn: sqlite3.Connection, edition_id: int, index, matches: Dict[int, int]) -> None:
+    rows = []
+    for number, row in enumerate(index.rows):
+        presenter_id = _presenter_id(conn, row['presenter'])
+        if row['slides']:
+            rows.append((edition_id, matches.get(number), presenter_id, 'slides',
+                         index.slide_href(number) or row['slides'], row['line']))
+        if row['video']:
+            rows.append((edition_id, matches.get(number), presenter_id, 'video', row['video'], row['line']))
+    conn.executemany("INSERT INTO materials (edition_id, event_id, presenter_id, kind, uri, line)"
+                     " VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+def import_edition(conn: sqlite3.Connection, name: str, metadata: Dict,
+                   recordings: Optional[str] = None) -> Dict:
+    """Store one edition (replacing any edition of the same name).
+
+    With a recordings CSV, event links are resolved from it first (as the
+    generator does) and its rows are stored as materials. Returns counts.
+    """
+    from schedule_feeds import day_dates
+    index = None
+    if recordings:
+        from schedule_links import load_recordings_index, resolve_links
+        index = load_recordings_index(recordings)
+        metadata, _ = resolve_links(metadata, index)
+    try:
+        dates = [value.isoformat() for value in day_dates(metadata)]
+    except ValueError:
+        dates = [metadata_day.get('iso_date') for metadata_day in metadata['days']]
+
+    matches: Dict[int, int] = {}
+    with conn:
+        conn.execute("DELETE FROM editions WHERE name = ?", (name,))
+        extra = {key: value for key, value in metadata.items()
+                 if key not in ('conference_title', 'conference_dates', 'days')}
+        edition_id = conn.execute(
+            "INSERT INTO editions (name, title, dates, extra) VALUES (?, ?, ?, ?)",
+            (name, metadata['conference_title'], metadata['conference_dates'],
+             json.dumps(extra, ensure_ascii=False, sort_keys=True))).lastrowid
+        for position, day in enumerate(metadata['days']):
+            tracks = [{key: value for key, value in track.items() if key != 'events'}
+                      for track in day.get('tracks', [])]
+            day_extra = {key: value for key, value in day.items()
+                         if key not in ('day_name', 'date', 'iso_date', 'start_time', 'events', 'tracks')}
+            day_id = conn.execute(
+                "INSERT INTO days (edition_id, position, day_name, date, iso_date, start_time, tracks, extra)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (edition_id, position, day['day_name'], day.get('date'), dates[position],
+                 day.get('start_time'), json.dumps(tracks, ensure_ascii=False) if 'tracks' in day else None,
+                 json.dumps(dict(day_extra, iso_date=day['iso_date']) if 'iso_date' in day else day_extra,
+                            ensure_ascii=False, sort_keys=True))).lastrowid
+            if 'events' in day:
+                _insert_events(conn, day_id, None, day['events'], matches, index)
+            for number, track in enumerate(day.get('tracks', [])):
+                _insert_events(conn, day_id, number, track['events'], matches, index)
+        if index is not None:
+            _insert_materials(conn, edition_id, index, matches)
+    conn.execute("PRAGMA optimize")
+    return {
+        'days': len(metadata['days']),
+        'events': conn.execute("SELECT COUNT(*) FROM events JOIN days ON days.id = events.day_id"
+                               " WHERE days.edition_id = ?", (edition_id,)).fetchone()[0],
+        'materials': conn.execute("SELECT COUNT(*) FROM materials WHERE edition_id = ?",
+                                  (edition_id,)).fetchone()[0],
+        'matched': len(matches),
+    }
+
+# ============================================================================
+# READING AND RENDERING
+# ============================================================================
+
+def _edition_row(conn: sqlite3.Connection, name: str) -> sqlite3.Row:
+    row = conn.execute("SELECT * FROM editions WHERE name = ?", (name,)).fetchone()
+    if row is None:
+        raise ValueError(f"no edition named {name!r} in the archive")
+    return row
+
+def _event_dict(row: sqlite3.Row) -> Dict:
+    event = {key: row[key] for key in EVENT_COLUMNS if row[key] is not None}
+    if row['presenter'] is not None:
+        event['presenter'] = row['presenter']
+    event.update(json.loads(row['extra']))
+    return event
+
+def _day_dict(row: sqlite3.Row) -> Dict:
+    day = {'day_name': row['day_name']}
+    if row['date'] is not None:
+        day['date'] = row['date']
+    if row['start_time'] is not None:
+        day['start_time'] = row['start_time']
+    day.update(json.loads(row['extra']))
+    return day
+
+def iter_days(conn: sqlite3.Connection, name: str) -> Iterator[Dict]:
+    """Yield the days of an edition in order, each with its events, one at a time."""
+    edition_id = _edition_row(conn, name)['id']
+    with closing(conn.execute("SELECT * FROM days WHERE edition_id = ? ORDER BY position",
+                              (edition_id,))) as days:
+        for row in days:
+            day = _day_dict(row)
+            tracks = json.loads(row['tracks']) if row['tracks'] is not None else None
+            events = conn.execute(
+                "SELECT events.*, presenters.name AS presenter FROM events"
+                " LEFT JOIN presenters ON presenters.id = events.presenter_id"
+                " WHERE day_id = ? ORDER BY track IS NOT NULL, track, position", (row['id'],))
+            for event_row in events:
+                event = _event_dict(event_row)
+                if event_row['track'] is None:
+                    day.setdefault('events', []).append(event)
+                else:
+                    tracks[event_row['track']].setdefault('events', []).append(event)
+            if tracks is not None:
+                day['tracks'] = [dict(track, events=track.get('events', [])) for track in tracks]
+            yield day
+
+def load_edition(conn: sqlite3.Connection, name: str) -> Dict:
+    """Full SCHEDULE_METADATA-shaped dict of an edition."""
+    edition = _edition_row(conn, name)
+    return dict(json.loads(edition['extra']), conference_title=edition['title'],
+                conference_dates=edition['dates'], days=list(iter_days(conn, name)))
+
+def iter_edition_html(conn: sqlite3.Connection, name: str, cache=None,
+                      stylesheet_href: Optional[str] = None) -> Iterator[str]:
+    """Yield an edition's page like iter_full_html, reading days from the store lazily."""
+    edition = _edition_row(conn, name)
+    values = generator.page_fields({'conference_title': edition['title'],
+                                    'conference_dates': edition['dates']}, stylesheet_href)
+    values['time_labels'] = generator.generate_time_labels()
+    columns = (column for day in iter_days(conn, name)
+               for column in generator.iter_day_columns([day], cache))
+    values['day_columns'] = generator.iter_joined(columns, generator.DAY_COLUMN_SEPARATOR)
+    return generator.iter_template(generator.COMPILED_HTML_TEMPLATE, values)
+
+def write_edition_html(stream, conn: sqlite3.Connection, name: str, cache=None,
+                       stylesheet_href: Optional[str] = None) -> int:
+    """Stream an edition's page to a text file-like object; return characters written."""
+    written = 0
+    for chunk in iter_edition_html(conn, name, cache, stylesheet_href):
+        stream.write(chunk)
+        written += len(chunk)
+    return written
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+def find_events(conn: sqlite3.Connection, title: Optional[str] = None, presenter: Optional[str] = None,
+                color: Optional[str] = None, date_from: Optional[str] = None,
+                date_to: Optional[str] = None, edition: Optional[str] = None) -> List[Dict]:
+    """Events matching every given filter, across editions, with their materials.
+
+    Each word of title must prefix-match a word of the event title. Dates
+    are ISO strings (inclusive). Results are ordered by date and position.
+    """
+    where, params = [], []
+    for term in title_terms(title or ""):
+        where.append("events.id IN (SELECT event_id FROM event_terms WHERE term >= ? AND term < ?)")
+        params += [term, term + "\uffff"]
+    if presenter:
+        where.append("presenters.name_norm = ?")
+        params.append(normalize_presenter(presenter))
+    if color:
+        where.append("events.color = ?")
+        params.append(color)
+    if date_from:
+        where.append("days.iso_date >= ?")
+        params.append(date_from)
+    if date_to:
+        where.append("days.iso_date <= ?")
+        params.append(date_to)
+    if edition:
+        where.append("editions.name = ?")
+        params.append(edition)
+
+    rows = conn.execute(
+        "SELECT events.*, presenters.name AS presenter, days.day_name, days.date, days.iso_date,"
+        " editions.name AS edition FROM events"
+        " JOIN days ON days.id = events.day_id"
+        " JOIN editions ON editions.id = days.edition_id"
+        " LEFT JOIN presenters ON presenters.id = events.presenter_id"
+        + (" WHERE " + " AND ".join(where) if where else "")
+        + " ORDER BY days.iso_date, editions.name, days.position, events.track IS NOT NULL,"
+          " events.track, events.position", params).fetchall()
+
+    materials: Dict[int, List[Dict]] = {}
+    ids = [row['id'] for row in rows]
+    for start in range(0, len(ids), 500):
+        chunk = ids[start:start + 500]
+        for material in conn.execute(
+                f"SELECT event_id, kind, uri FROM materials WHERE event_id IN ({','.join('?' * len(chunk))})"
+                " ORDER BY id", chunk):
+            materials.setdefault(material['event_id'], []).append({'kind': material['kind'],
+                                                                   'uri': material['uri']})
+    return [dict(_event_dict(row), edition=row['edition'], day_name=row['day_name'],
+                 date=row['iso_date'] or row['date'], materials=materials.get(row['id'], []))
+            for row in rows]
+
+def list_editions(conn: sqlite3.Connection) -> List[Dict]:
+    """Every stored edition with its day and event counts."""
+    return [dict(row) for row in conn.execute(
+        "SELECT editions.name, editions.title, editions.dates,"
+        " (SELECT COUNT(*) FROM days WHERE days.edition_id = editions.id) AS days,"
+        " (SELECT COUNT(*) FROM events JOIN days ON days.id = events.day_id"
+        "  WHERE days.edition_id = editions.id) AS events"
+        " FROM editions ORDER BY editions.name")]
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Store, query and render schedule editions in SQLite.")
+    parser.add_argument("--db", default=ARCHIVE_PATH, help=f"archive file (default: {ARCHIVE_PATH})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    importer = commands.add_parser("import", help="import an edition")
+    importer.add_argument("name", help="edition name, e.g. 2025")
+    importer.add_argument("source", nargs="?",
+                          help="schedule file or old generator script (default: SCHEDULE_METADATA)")
+    importer.add_argument("--recordings", metavar="CSV", default=None,
+                          help="slides/video index to resolve links and materials from")
+    query = commands.add_parser("query", help="find events across editions")
+    query.add_argument("--title", help="words that must prefix-match title words")
+    query.add_argument("--presenter")
+    query.add_argument("--color")
+    query.add_argument("--from", dest="date_from", metavar="YYYY-MM-DD")
+    query.add_argument("--to", dest="date_to", metavar="YYYY-MM-DD")
+    query.add_argument("--edition")
+    render = commands.add_parser("render", help="render an edition's schedule page")
+    render.add_argument("name")
+    render.add_argument("-o", "--output", help="output file (default: schedule-NAME.html)")
+    commands.add_parser("list", help="list stored editions")
+    args = parser.parse_args()
+
+    try:
+        with closing(connect(args.db)) as conn:
+            if args.command == "import":
+                metadata = load_edition_source(args.source) if args.source else generator.SCHEDULE_METADATA
+                counts = import_edition(conn, args.name, metadata, args.recordings)
+                print(f"✓ Imported {args.name}: {counts['days']} days, {counts['events']} events, "
+                      f"{counts['materials']} materials ({counts['matched']} matched to events)")
+            elif args.command == "query":
+                events = find_events(conn, args.title, args.presenter, args.color,
+                                     args.date_from, args.date_to, args.edition)
+                for event in events:
+                    who = f" — {event['presenter']}" if event.get('presenter') else ""
+                    print(f"{event['edition']}  {event['date']}  {event['title']}{who}")
+                    for material in event['materials']:
+                        print(f"    {material['kind']}: {material['uri']}")
+                print(f"  {len(events)} events")
+            elif args.command == "render":
+                output = args.output or f"schedule-{args.name}.html"
+                _edition_row(conn, args.name)
+                with open(output, "w", encoding="utf-8") as f:
+                    written = write_edition_html(f, conn, args.name)
+                print(f"✓ {output} ({written} characters)")
+            else:
+                for edition in list_editions(conn):
+                    print(f"{edition['name']}  {edition['title']} ({edition['dates']}): "
+                          f"{edition['days']} days, {edition['events']} events")
+    except (sqlite3.Error, OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
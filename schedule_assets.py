@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Asset Post-Processing for the Conference Schedule Generator
+Minifies generated HTML/CSS and writes precompressed .gz (and .br, when the
+optional brotli package is installed) siblings at maximum compression, so a
+static server can serve them without compressing per request.
+
+Usage:
+    python3 schedule_assets.py schedule.html schedule.1a2b3c4d5e.css [--no-minify]
+
+Minification is deliberately conservative: comments are dropped and
+whitespace runs are collapsed, but a run containing a newline stays a
+newline, so inline elements never lose the space between them. <pre>,
+<textarea> and <script> contents are left untouched.
+"""
+
+import gzip
+import os
+import re
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # optional; only .gz siblings are written without it
+    brotli = None
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+MINIFIABLE = ('.html', '.htm', '.css')
+ENCODING_SUFFIXES = {'gzip': '.gz', 'brotli': '.br'}
+COMPRESSIBLE = ('.html', '.htm', '.css', '.js', '.json', '.svg', '.ics', '.geojson', '.csv')
+
+CSS_TOKEN = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)|(\s+)''', re.S)
+CSS_TIGHT_BOTH = re.compile(r'\s*([{};,>])\s*')
+CSS_TIGHT_AFTER = re.compile(r':\s+')
+HTML_RAW_BLOCK = re.compile(r'(<(pre|textarea|script)\b.*?</\2\s*>)|(<style\b[^>]*>)(.*?)(</style\s*>)', re.S | re.I)
+HTML_COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.S)
+
+# ============================================================================
+# MINIFICATION
+# ============================================================================
+
+def _tighten_css(code: str) -> str:
+    code = CSS_TIGHT_BOTH.sub(r'\1', code)
+    code = CSS_TIGHT_AFTER.sub(':', code)
+    return code.replace(';}', '}')
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from CSS, keeping strings intact."""
+    parts: List[str] = []
+    code: List[str] = []
+    position = 0
+    for match in CSS_TOKEN.finditer(css):
+        code.append(css[position:match.start()])
+        position = match.end()
+        string, comment, space = match.groups()
+        if string:
+            parts.append(_tighten_css(''.join(code)))
+            parts.append(string)
+            code = []
+        elif space:
+            code.append(' ')
+    code.append(css[position:])
+    parts.append(_tighten_css(''.join(code)))
+    return ''.join(parts).strip()
+
+def _collapse_whitespace(html: str) -> str:
+    html = HTML_COMMENT.sub('', html)
+    return re.sub(r'\s+', lambda match: '\n' if '\n' in match.group() else ' ', html)
+
+def minify_html(html: str) -> str:
+    """Drop comments, collapse whitespace and minify inline <style> blocks."""
+    parts: List[str] = []
+    position = 0
+    for match in HTML_RAW_BLOCK.finditer(html):
+        parts.append(_collapse_whitespace(html[position:match.start()]))
+        if match.group(1):
+            parts.append(match.group(1))
+        else:
+            parts.append(match.group(3) + minify_css(match.group(4)) + match.group(5))
+        position = match.end()
+    parts.append(_collapse_whitespace(html[position:]))
+    return ''.join(parts).strip() + '\n'
+
+# ============================================================================
+# COMPRESSION
+# ============================================================================
+
+def compress_variants(data: bytes) -> Dict[str, bytes]:
+    """Precompressed encodings of data: gzip, and brotli if available."""
+    variants = {'gzip': gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        variants['brotli'] = brotli.compress(data, quality=BROTLI_QUALITY)
+    return variants
+
+def write_compressed(path: str, data: bytes) -> Dict[str, int]:
+    """Write .gz (and .br if available) siblings of path; return their sizes."""
+    sizes = {}
+    for encoding, compressed in compress_variants(data).items():
+        with open(path + ENCODING_SUFFIXES[encoding], "wb") as f:
+            f.write(compressed)
+        sizes[encoding] = len(compressed)
+    return sizes
+
+def postprocess(paths: List[str], minify: bool = True, compress: bool = True) -> List[Dict]:
+    """Minify and/or precompress files in place; return per-file byte sizes."""
+    reports = []
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        report: Dict[str, Optional[int]] = {'path': path, 'original': len(data)}
+
+        extension = os.path.splitext(path)[1].lower()
+        if minify and extension in MINIFIABLE:
+            text = data.decode("utf-8")
+            text = minify_css(text) + '\n' if extension == '.css' else minify_html(text)
+            data = text.encode("utf-8")
+            with open(path, "wb") as f:
+                f.write(data)
+        report['minified'] = len(data)
+
+        if compress and extension in COMPRESSIBLE:
+            report.update(write_compressed(path, data))
+        reports.append(report)
+    return reports
+
+def format_report(report: Dict) -> str:
+    """One-line human summary of a postprocess report."""
+    line = f"{report['path']}: {report['original']} → {report['minified']} bytes"
+    for key in ('gzip', 'brotli'):
+        if key in report:
+            line += f", {key} {report[key]}"
+    return line
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Minify and precompress generated assets.")
+    parser.add_argument("paths", nargs="+", help="files to process in place")
+    parser.add_argument("--no-minify", action="store_true", help="only write compressed siblings")
+    parser.add_argument("--no-compress", action="store_true", help="only minify")
+    args = parser.parse_args()
+
+    for report in postprocess(args.paths, not args.no_minify, not args.no_compress):
+        print(f"✓ {format_report(report)}")
+    if brotli is None and not args.no_compress:
+        print("  (install brotli to also write .br files)")
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Batch Variant Rendering for the Conference Schedule Generator
+Renders many views of the same program (full week, single days, per track,
+speakers only, ...) in parallel across a process pool.
+
+Usage:
+    python3 schedule_batch.py variants.json [schedule.json] [-j WORKERS]
+
+variants.json is a list of variant specs:
+
+    [
+        {"name": "week", "output": "schedule.html"},
+        {"name": "monday", "output": "schedule-monday.html", "days": ["Monday"]},
+        {"name": "labs", "output": "labs.html", "colors": ["session1"]},
+        {"name": "room-b", "output": "room-b.html", "tracks": ["Room B"]},
+        {"name": "talks", "output": "talks.html", "speakers_only": true}
+    ]
+
+Filters (all optional, combined with AND):
+    days            day names (case-insensitive) or 0-based day indexes
+    colors          event color keys to keep
+    exclude_colors  event color keys to drop
+    tracks          track names/rooms to keep ("main" is a day's own events)
+    speakers_only   keep only events with a presenter or speakers
+
+Start times are pinned before filtering, so dropping an event never shifts
+the ones after it. The pinned metadata is sent to each worker once, when the
+worker starts; tasks only carry their spec.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import schedule_geneartor as generator
+from schedule_cache import FragmentCache
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+MAIN_TRACK = "main"
+
+# ============================================================================
+# METADATA PREPARATION
+# ============================================================================
+
+def pin_start_times(metadata: Dict) -> Dict:
+    """Return a copy of metadata where every event has an explicit start_time."""
+    layout = generator.compile_layout(metadata['days'])
+    pinned = {id(event): generator.minutes_to_time(start)
+              for event, start in zip(layout['events'], layout['start'])}
+
+    def pin(events):
+        return [dict(event, start_time=pinned[id(event)]) for event in events]
+
+    days = []
+    for day in metadata['days']:
+        day_copy = dict(day, events=pin(day.get('events', [])))
+        if 'tracks' in day:
+            day_copy['tracks'] = [dict(track, events=pin(track['events'])) for track in day['tracks']]
+        days.append(day_copy)
+    return dict(metadata, days=days)
+
+def _keep_event(event: Dict, spec: Dict) -> bool:
+    color = event.get('color')
+    if 'colors' in spec and color not in spec['colors']:
+        return False
+    if color in spec.get('exclude_colors', ()):
+        return False
+    if spec.get('speakers_only') and not (event.get('presenter') or event.get('speakers')):
+        return False
+    return True
+
+def filter_metadata(metadata: Dict, spec: Dict) -> Dict:
+    """Apply a variant spec's filters to (pinned) metadata."""
+    wanted_days = spec.get('days')
+    if wanted_days is not None:
+        wanted_days = {value.lower() if isinstance(value, str) else value for value in wanted_days}
+    wanted_tracks = set(spec['tracks']) if 'tracks' in spec else None
+
+    days = []
+    for index, day in enumerate(metadata['days']):
+        if wanted_days is not None and index not in wanted_days \
+                and day['day_name'].lower() not in wanted_days:
+            continue
+        events = day.get('events', [])
+        if wanted_tracks is not None and MAIN_TRACK not in wanted_tracks:
+            events = []
+        day_copy = dict(day, events=[event for event in events if _keep_event(event, spec)])
+        if 'tracks' in day:
+            day_copy['tracks'] = [
+                dict(track, events=[event for event in track['events'] if _keep_event(event, spec)])
+                for track in day['tracks']
+                if wanted_tracks is None
+                or track.get('name') in wanted_tracks or track.get('room') in wanted_tracks
+            ]
+        days.append(day_copy)
+
+    variant = dict(metadata, days=days)
+    if spec.get('title'):
+        variant['conference_title'] = spec['title']
+    return variant
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+_worker_metadata: Optional[Dict] = None
+_worker_cache: Optional[FragmentCache] = None
+_worker_stylesheet: Optional[str] = None
+
+def _init_worker(metadata: Dict, cache_dir: Optional[str], stylesheet: Optional[str]) -> None:
+    global _worker_metadata, _worker_cache, _worker_stylesheet
+    _worker_metadata = metadata
+    _worker_cache = FragmentCache(cache_dir)
+    _worker_stylesheet = stylesheet
+
+def render_variant(spec: Dict, out_dir: str = ".") -> Dict:
+    """Render one variant with the worker's shared metadata; return a summary."""
+    variant = filter_metadata(_worker_metadata, spec)
+    output = os.path.join(out_dir, spec['output'])
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    stylesheet = None
+    if _worker_stylesheet:
+        # Link the shared stylesheet relative to this page's directory
+        stylesheet = os.path.relpath(os.path.join(out_dir, _worker_stylesheet),
+                                     os.path.dirname(output) or ".").replace(os.sep, "/")
+    with open(output, "w", encoding="utf-8") as f:
+        written = generator.write_full_html(f, _worker_cache, variant, stylesheet)
+    return {
+        'name': spec.get('name', spec['output']),
+        'output': output,
+        'bytes': written,
+        'events': sum(len(track['events']) for day in variant['days']
+                      for track in generator.iter_day_tracks(day)),
+    }
+
+def render_variants(specs: List[Dict], metadata: Optional[Dict] = None,
+                    workers: Optional[int] = None, out_dir: str = ".",
+                    cache_dir: Optional[str] = generator.FRAGMENT_CACHE_DIR) -> List[Dict]:
+    """Render every variant spec across a process pool; results keep spec order.
+
+    Every variant links to one content-hashed stylesheet written to out_dir.
+    workers=1 renders in-process, which is handy for debugging.
+    """
+    pinned = pin_start_times(metadata if metadata is not None else generator.SCHEDULE_METADATA)
+    os.makedirs(out_dir, exist_ok=True)
+    stylesheet = generator.write_stylesheet(out_dir)
+    if workers == 1 or len(specs) <= 1:
+        _init_worker(pinned, cache_dir, stylesheet)
+        return [render_variant(spec, out_dir) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(pinned, cache_dir, stylesheet)) as pool:
+        chunksize = max(1, len(specs) // (4 * (workers or os.cpu_count() or 1)))
+        return list(pool.map(render_variant, specs, [out_dir] * len(specs), chunksize=chunksize))
+
+def load_variants(path: str) -> List[Dict]:
+    """Read a JSON list of variant specs, checking each has an output path."""
+    with open(path, "r", encoding="utf-8") as f:
+        specs = json.load(f)
+    if not isinstance(specs, list):
+        raise ValueError(f"{path}: expected a list of variant specs")
+    for index, spec in enumerate(specs):
+        if not isinstance(spec, dict) or not isinstance(spec.get('output'), str):
+            raise ValueError(f"{path}: variant {index} needs an 'output' path")
+    return specs
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render schedule variants in parallel.")
+    parser.add_argument("variants", help="JSON file with a list of variant specs")
+    parser.add_argument("source", nargs="?", help="schedule file (default: SCHEDULE_METADATA)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("-d", "--out-dir", default=".", help="directory for the outputs")
+    args = parser.parse_args()
+
+    try:
+        specs = load_variants(args.variants)
+        metadata = None
+        if args.source:
+            from schedule_sources import load_schedule
+            metadata = load_schedule(args.source)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    for result in render_variants(specs, metadata, args.workers, args.out_dir):
+        print(f"✓ {result['name']}: {result['output']} ({result['events']} events, {result['bytes']} bytes)")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for the Conference Schedule Generator
+Measures how the rendering stages scale on synthetic programs and fails when
+a stage regresses against a stored baseline.
+
+Usage:
+    python3 schedule_bench.py [--sizes 10,100,1000,10000,100000] [--days 5] [--tracks 1]
+                              [-o bench.json] [--baseline bench_baseline.json]
+                              [--threshold 0.25] [--save-baseline]
+
+For every size (total events) and stage it records the best wall time over
+--repeat runs, the peak traced memory of one extra run, and the output size.
+Stages:
+    time_labels   generate_time_labels()
+    events_html   generate_events_html() for every day
+    day_column    generate_day_column() for every day
+    full_html     generate_full_html()
+    full_classes  generate_full_html(classes=True)
+
+A stage regresses when its time or peak memory exceeds the baseline by more
+than --threshold (a fraction); times under --noise-floor seconds are ignored.
+The exit status is 1 if anything regressed.
+"""
+
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+import schedule_geneartor as generator
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_NOISE_FLOOR = 0.005
+DURATIONS = (15, 30, 30, 45, 60, 60, 90, 120)
+WORDS = ("Document", "Vision", "Language", "Graph", "Lab", "Session", "Retrieval", "Models",
+         "Historical", "Archives", "Trustworthy", "Agentic", "Knowledge", "Open", "Analysis")
+
+# ============================================================================
+# SYNTHETIC PROGRAMS
+# ============================================================================
+
+def synthetic_metadata(days: int, events_per_day: int, tracks: int = 1, seed: int = 0) -> Dict:
+    """Build SCHEDULE_METADATA-shaped data with the given shape.
+
+    With tracks > 1 each day holds that many parallel rooms sharing its
+    events; the first room is the day's own event list.
+    """
+    rng = random.Random(seed)
+    colors = list(generator.COLOR_CLASSES)
+
+    def make_events(count: int) -> List[Dict]:
+        return [{
+            "title": " ".join(rng.sample(WORDS, 3)),
+            "duration_minutes": rng.choice(DURATIONS),
+            "color": rng.choice(colors),
+            "link": "TBA",
+        } for _ in range(count)]
+
+    per_track = [events_per_day // tracks + (1 if index < events_per_day % tracks else 0)
+                 for index in range(tracks)]
+    metadata = {"conference_title": "Synthetic Conference", "conference_dates": "", "days": []}
+    for index in range(days):
+        day = {
+            "day_name": f"Day {index + 1}",
+            "date": f"{index + 1}",
+            "start_time": generator.DEFAULT_DAY_START,
+            "events": make_events(per_track[0]),
+        }
+        if tracks > 1:
+            day["tracks"] = [{"name": f"Room {room + 1}", "room": f"Room {room + 1}",
+                              "events": make_events(per_track[room])}
+                             for room in range(1, tracks)]
+        metadata["days"].append(day)
+    return metadata
+
+def stages_for(metadata: Dict) -> Dict[str, Callable[[], object]]:
+    """Map stage names to zero-argument callables returning their output."""
+    days = metadata["days"]
+    return {
+        "time_labels": generator.generate_time_labels,
+        "events_html": lambda: [generator.generate_events_html(day["events"], day["start_time"])
+                                for day in days],
+        "day_column": lambda: [generator.generate_day_column(day) for day in days],
+        "full_html": lambda: generator.generate_full_html(metadata=metadata),
+        "full_classes": lambda: generator.generate_full_html(metadata=metadata, classes=True),
+    }
+
+def output_size(output) -> int:
+    if isinstance(output, str):
+        return len(output.encode("utf-8"))
+    return sum(output_size(part) for part in output)
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def measure(stage: Callable[[], object], repeat: int) -> Dict:
+    """Best wall time over repeat runs, then peak memory and size of one run."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        stage()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        output = stage()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak, "output_bytes": output_size(output)}
+
+def run_benchmarks(sizes=DEFAULT_SIZES, days: int = 5, tracks: int = 1,
+                   repeat: int = 3, seed: int = 0, log=None) -> Dict:
+    """Benchmark every stage at every size; return a JSON-serializable report."""
+    results = []
+    for size in sizes:
+        metadata = synthetic_metadata(days, max(1, size // days), tracks, seed)
+        for name, stage in stages_for(metadata).items():
+            # Large programs are slow enough that one timed run is representative
+            result = measure(stage, repeat if size <= 10000 else 1)
+            result.update(size=size, stage=name)
+            results.append(result)
+            if log:
+                log(f"  {size:>7} events  {name:<12} {result['seconds'] * 1000:10.2f} ms  "
+                    f"{result['peak_bytes'] / 1024:10.1f} KiB peak  {result['output_bytes']:>11} B")
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "days": days,
+        "tracks": tracks,
+        "results": results,
+    }
+
+def compare(report: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD,
+            noise_floor: float = DEFAULT_NOISE_FLOOR) -> List[str]:
+    """Return a message for every stage that regressed past threshold."""
+    previous = {(result["size"], result["stage"]): result for result in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        before = previous.get((result["size"], result["stage"]))
+        if before is None:
+            continue
+        where = f"{result['stage']} @ {result['size']} events"
+        if result["seconds"] >= noise_floor and result["seconds"] > before["seconds"] * (1 + threshold):
+            regressions.append(f"{where}: {before['seconds'] * 1000:.2f} ms → "
+                               f"{result['seconds'] * 1000:.2f} ms")
+        if result["peak_bytes"] > before["peak_bytes"] * (1 + threshold):
+            regressions.append(f"{where}: peak {before['peak_bytes']} B → {result['peak_bytes']} B")
+    return regressions
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the schedule generator stages.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated total event counts")
+    parser.add_argument("--days", type=int, default=5)
+    parser.add_argument("--tracks", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per stage (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="bench.json", help="where to write the JSON report")
+    parser.add_argument("--baseline", help="baseline report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction (0.25 = 25%%)")
+    parser.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR,
+                        help="ignore timing regressions of stages faster than this (seconds)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="also write the report to --baseline")
+    args = parser.parse_args(argv)
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline needs --baseline PATH to write to")
+    baseline = None
+    if args.baseline and not args.save_baseline:
+        # Read it up front, so a bad path fails before the benchmark instead of after it
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as exc:
+            parser.error(f"cannot read --baseline {args.baseline}: {exc}")
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    print(f"Benchmarking {len(sizes)} sizes × {len(stages_for({'days': []}))} stages ({args.days} days, {args.tracks} tracks)...")
+    report = run_benchmarks(sizes, args.days, args.tracks, args.repeat, args.seed, log=print)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"✓ Report written: {args.output}")
+
+    if not args.baseline:
+        return 0
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Baseline saved: {args.baseline}")
+        return 0
+
+    regressions = compare(report, baseline, args.threshold, args.noise_floor)
+    for message in regressions:
+        print(f"✗ Regression: {message}")
+    if not regressions:
+        print(f"✓ No stage regressed more than {args.threshold:.0%} against {args.baseline}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Fragment Cache for the Conference Schedule Generator
+Keeps rendered HTML fragments (one per day column) keyed by the content hash
+of the data they were rendered from, so a rebuild only re-renders what changed.
+
+Two tiers:
+    memory  bounded LRU, evicts the least recently used fragment
+    disk    optional directory of <key>.html files, shared between runs;
+            pruned least-recently-used first when it grows past its bound
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_DISK_ENTRIES = 4096
+FRAGMENT_SUFFIX = ".html"
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class FragmentCache:
+    """Two-tier (memory LRU + on-disk) cache of rendered fragments."""
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_entries: int = DEFAULT_MEMORY_ENTRIES,
+                 max_disk_entries: int = DEFAULT_DISK_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._disk_entries = 0
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._disk_entries = sum(1 for name in os.listdir(cache_dir)
+                                     if name.endswith(FRAGMENT_SUFFIX))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + FRAGMENT_SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the fragment stored under key, or None on a miss."""
+        fragment = self._memory.get(key)
+        if fragment is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+        if self.cache_dir:
+            path = self._path(key)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    fragment = f.read()
+            except FileNotFoundError:
+                pass
+            else:
+                # Touch the file so its mtime tracks last use for disk pruning
+                try:
+                    os.utime(path)
+                except FileNotFoundError:
+                    pass  # pruned by another worker since the read; the fragment is still valid
+                self._remember(key, fragment)
+                self.hits += 1
+                self.disk_hits += 1
+                return fragment
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, fragment: str) -> None:
+        """Store a fragment in memory and, if configured, on disk."""
+        self._remember(key, fragment)
+        if not self.cache_dir:
+            return
+
+        path = self._path(key)
+        if not os.path.exists(path):
+            self._disk_entries += 1
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(fragment)
+        os.replace(tmp_path, path)
+
+        if self._disk_entries > self.max_disk_entries:
+            self.prune_disk(self.max_disk_entries)
+
+    def _remember(self, key: str, fragment: str) -> None:
+        self._memory[key] = fragment
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def prune_disk(self, max_entries: int) -> int:
+        """Delete least recently used disk fragments down to max_entries."""
+        if not self.cache_dir:
+            return 0
+        # Other workers may prune the same directory, so fragments can vanish at any point
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(FRAGMENT_SUFFIX):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    entries.append((os.stat(path).st_mtime, path))
+                except FileNotFoundError:
+                    pass
+        entries.sort()
+
+        removed = vanished = 0
+        for _, path in entries[:max(0, len(entries) - max_entries)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                vanished += 1
+                continue
+            removed += 1
+        self._disk_entries = len(entries) - removed - vanished
+        self.disk_evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        """Drop every fragment from both tiers."""
+        self._memory.clear()
+        if self.cache_dir:
+            self.prune_disk(0)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current tier sizes."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_evictions": self.disk_evictions,
+            "memory_entries": len(self._memory),
+            "disk_entries": self._disk_entries,
+        }
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Conflict Index for the Conference Schedule Generator
+Detects room, speaker and attendee double-bookings across parallel tracks.
+
+Events are read from a compiled layout (see compile_layout), so explicit and
+chained start times are already resolved. Resources are taken from:
+    room       event "room", else its track's "room"
+    speaker    event "speakers" (list) or "presenter" (string)
+    attendee   event "attendees" (list)
+
+find_conflicts sweeps every resource's intervals in start order, which is
+O(n log n) plus the number of conflicts found. ConflictIndex keeps one
+interval tree per resource for the editor's save-and-preview loop, where a
+single edited session is checked against everything else.
+"""
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from schedule_geneartor import compile_layout, minutes_to_time
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+MINUTES_PER_DAY = 24 * 60
+RESOURCE_KINDS = ('room', 'speaker', 'attendee')
+
+# ============================================================================
+# INTERVAL TREE
+# ============================================================================
+
+class IntervalTree:
+    """Static interval tree over half-open [start, end) intervals.
+
+    Intervals are kept sorted by start in flat lists; the tree is the
+    implicit balanced binary tree over that order, with every node storing
+    the maximum end of its subtree. Queries prune subtrees that end before
+    the query window or start after it.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[int, int, object]]):
+        items = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self.starts = [item[0] for item in items]
+        self.ends = [item[1] for item in items]
+        self.payloads = [item[2] for item in items]
+        self.max_end = list(self.ends)
+        self._build(0, len(items))
+
+    def _build(self, lo: int, hi: int) -> int:
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        best = self.ends[mid]
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child >= 0 and self.max_end[child] > best:
+                best = self.max_end[child]
+        self.max_end[mid] = best
+        return mid
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def overlapping(self, start: int, end: int) -> List[object]:
+        """Return payloads of every interval overlapping [start, end)."""
+        found: List[object] = []
+        stack = [(0, len(self.starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self.max_end[mid] <= start:
+                continue
+            stack.append((lo, mid))
+            if self.starts[mid] < end:
+                if self.ends[mid] > start:
+                    found.append(self.payloads[mid])
+                stack.append((mid + 1, hi))
+        return found
+
+# ============================================================================
+# RESOURCE EXTRACTION
+# ============================================================================
+
+def event_resources(event: Dict, track: Optional[Dict] = None) -> List[Tuple[str, str]]:
+    """Return the (kind, name) resources an event occupies."""
+    resources = []
+    room = event.get('room') or (track or {}).get('room')
+    if room:
+        resources.append(('room', room))
+    speakers = event.get('speakers') or ([event['presenter']] if event.get('presenter') else [])
+    resources.extend(('speaker', name) for name in speakers)
+    resources.extend(('attendee', name) for name in event.get('attendees', ()))
+    return resources
+
+def resource_intervals(layout: Dict) -> Dict[Tuple[str, str], List[Tuple[int, int, int]]]:
+    """Group layout rows by resource as (absolute start, absolute end, row)."""
+    by_resource: Dict[Tuple[str, str], List[Tuple[int, int, int]]] = {}
+    tracks = layout['tracks']
+    for row, event in enumerate(layout['events']):
+        offset = layout['day_id'][row] * MINUTES_PER_DAY
+        interval = (offset + layout['start'][row], offset + layout['end'][row], row)
+        for resource in event_resources(event, tracks[layout['track_id'][row]]):
+            by_resource.setdefault(resource, []).append(interval)
+    return by_resource
+
+def _conflict(layout: Dict, days: List[Dict], resource: Tuple[str, str],
+              first: int, second: int) -> Dict:
+    events = layout['events']
+    start = max(layout['start'][first], layout['start'][second])
+    end = min(layout['end'][first], layout['end'][second])
+    return {
+        'kind': resource[0],
+        'resource': resource[1],
+        'day': days[layout['day_id'][first]]['day_name'],
+        'first': events[first]['title'],
+        'second': events[second]['title'],
+        'start': minutes_to_time(start),
+        'end': minutes_to_time(end),
+    }
+
+# ============================================================================
+# CONFLICT DETECTION
+# ============================================================================
+
+def find_conflicts(days: List[Dict], layout: Optional[Dict] = None) -> List[Dict]:
+    """Find every pair of events that double-books a room, speaker or attendee."""
+    if layout is None:
+        layout = compile_layout(days)
+
+    conflicts = []
+    for resource, intervals in resource_intervals(layout).items():
+        if len(intervals) < 2:
+            continue
+        intervals.sort()
+        active: List[Tuple[int, int]] = []   # (end, row) heap
+        for start, end, row in intervals:
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for _, other in active:
+                conflicts.append(_conflict(layout, days, resource, other, row))
+            heapq.heappush(active, (end, row))
+    return conflicts
+
+class ConflictIndex:
+    """Interval trees per resource, for checking single edits quickly."""
+
+    def __init__(self, days: List[Dict]):
+        self.days = days
+        self.layout = compile_layout(days)
+        self.trees = {resource: IntervalTree(intervals)
+                      for resource, intervals in resource_intervals(self.layout).items()}
+
+    def conflicts_for(self, day_index: int, start_time: str, duration_minutes: int,
+                      event: Dict, track: Optional[Dict] = None) -> List[Dict]:
+        """Return existing events the given (new or moved) event would clash with."""
+        hours, minutes = map(int, start_time.split(':'))
+        start = day_index * MINUTES_PER_DAY + hours * 60 + minutes
+        end = start + duration_minutes
+        clashes = []
+        for resource in event_resources(event, track):
+            tree = self.trees.get(resource)
+            if tree is None:
+                continue
+            for row in tree.overlapping(start, end):
+                if self.layout['events'][row] is event:
+                    continue
+                clashes.append({
+                    'kind': resource[0],
+                    'resource': resource[1],
+                    'day': self.days[day_index]['day_name'],
+                    'event': self.layout['events'][row]['title'],
+                    'start': minutes_to_time(self.layout['start'][row]),
+                    'end': minutes_to_time(self.layout['end'][row]),
+                })
+        return clashes
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Watch-Mode Dev Server for the Conference Schedule Generator
+Serves schedule.html from memory, re-renders it when the schedule source
+changes and tells open browser tabs to reload over Server-Sent Events.
+
+Usage:
+    python3 schedule_devserver.py [schedule.json] [--port 8000] [--recordings CSV]
+
+Without a source file the server watches schedule_geneartor.py itself and
+re-reads SCHEDULE_METADATA from it. Like render, it resolves Slides and
+Recording links from slides/recordings.csv (see schedule_links.py) and
+watches that file too. Re-renders go through an in-memory fragment cache,
+so only the day columns that actually changed are rendered again. The
+watched files are polled every POLL_INTERVAL seconds, which keeps
+edit-to-preview latency well under 100 ms.
+
+Routes:
+    /, /schedule.html   rendered page (ETag + Cache-Control: no-cache)
+    /schedule.<hash>.css  stylesheet (immutable, cached for a year)
+    /__reload           SSE stream; sends a "reload" event after each re-render
+    anything else       static files below the site root (images, slides, ...)
+"""
+
+import asyncio
+import hashlib
+import html
+import mimetypes
+import os
+import runpy
+import time
+from typing import Dict, Optional, Set, Tuple
+
+import schedule_geneartor as generator
+from schedule_cache import FragmentCache
+from schedule_links import RECORDINGS_CSV
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+POLL_INTERVAL = 0.05
+HEARTBEAT_INTERVAL = 15
+RELOAD_PATH = "/__reload"
+SITE_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+RELOAD_SCRIPT = f'''<script>
+new EventSource("{RELOAD_PATH}").addEventListener("reload", function () {{ location.reload(); }});
+</script>
+'''
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+class DevServer:
+    """In-memory renderer plus the asyncio HTTP handlers that serve it."""
+
+    def __init__(self, source: Optional[str] = None, site_root: str = SITE_ROOT,
+                 recordings: Optional[str] = RECORDINGS_CSV):
+        self.source = source or os.path.abspath(generator.__file__)
+        self.recordings = recordings
+        self.site_root = site_root
+        self.cache = FragmentCache(None)
+        self.version = 0
+        self.mtime_ns: Optional[Tuple[Optional[int], ...]] = None
+        self.page = b""
+        self.page_etag = ""
+        self.stylesheet_name = ""
+        self.stylesheet = b""
+        self.listeners: Set[asyncio.Queue] = set()
+
+    def load_metadata(self) -> Dict:
+        if self.source.endswith(".py"):
+            metadata = runpy.run_path(self.source)['SCHEDULE_METADATA']
+        else:
+            from schedule_sources import parse_schedule
+            metadata = parse_schedule(self.source)
+        if self.recordings and os.path.exists(self.recordings):
+            from schedule_links import load_recordings_index, resolve_links
+            metadata, _ = resolve_links(metadata, load_recordings_index(self.recordings))
+        return metadata
+
+    def watched_mtimes(self) -> Tuple[Optional[int], ...]:
+        """mtime of the source and the recordings CSV (None for a missing file)."""
+        mtimes = []
+        for path in (self.source, self.recordings):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns if path else None)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def render(self) -> float:
+        """Re-render the page from the source; return the time it took (s)."""
+        started = time.perf_counter()
+        try:
+            metadata = self.load_metadata()
+            css = generator.render_stylesheet()
+            self.stylesheet_name = generator.stylesheet_filename(css)
+            self.stylesheet = css.encode("utf-8")
+            page = generator.generate_full_html(self.cache, metadata, self.stylesheet_name)
+        except Exception as exc:  # show any editing mistake in the browser
+            page = (f"<!DOCTYPE html><html><body><h1>Schedule error</h1>"
+                    f"<pre>{html.escape(f'{type(exc).__name__}: {exc}')}</pre></body></html>")
+        page = page.replace("</body>", RELOAD_SCRIPT + "</body>", 1)
+        self.page = page.encode("utf-8")
+        self.page_etag = f'"{hashlib.sha256(self.page).hexdigest()[:32]}"'
+        self.version += 1
+        return time.perf_counter() - started
+
+    async def watch(self) -> None:
+        """Poll the watched files' mtimes and re-render + notify listeners on change."""
+        while True:
+            mtime_ns = self.watched_mtimes()
+            if mtime_ns != self.mtime_ns:
+                first = self.mtime_ns is None
+                self.mtime_ns = mtime_ns
+                elapsed = self.render()
+                if not first:
+                    print(f"↻ Re-rendered in {elapsed * 1000:.1f} ms "
+                          f"(cache: {self.cache.hits} hits, {self.cache.misses} misses)")
+                    for queue in list(self.listeners):
+                        queue.put_nowait(self.version)
+            await asyncio.sleep(POLL_INTERVAL)
+
+    # ========================================================================
+    # HTTP
+    # ========================================================================
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] not in ("GET", "HEAD"):
+                await self.respond(writer, 405, b"Method Not Allowed")
+                return
+            method, path = parts[0], parts[1].split("?", 1)[0]
+
+            if path == RELOAD_PATH:
+                await self.stream_reloads(writer)
+            elif path in ("/", "/schedule.html"):
+                await self.respond(writer, 200, self.page, "text/html; charset=utf-8",
+                                   self.page_etag, "no-cache", headers, method)
+            elif path == "/" + self.stylesheet_name:
+                await self.respond(writer, 200, self.stylesheet, "text/css; charset=utf-8",
+                                   None, "public, max-age=31536000, immutable", headers, method)
+            else:
+                await self.serve_static(writer, path, headers, method)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer: asyncio.StreamWriter, status: int, body: bytes,
+                      content_type: str = "text/plain; charset=utf-8", etag: Optional[str] = None,
+                      cache_control: str = "no-cache", request_headers: Optional[Dict] = None,
+                      method: str = "GET") -> None:
+        if etag and request_headers and request_headers.get("if-none-match") == etag:
+            status, body = 304, b""
+        reason = {200: "OK", 304: "Not Modified", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        head = [f"HTTP/1.1 {status} {reason}", f"Content-Type: {content_type}",
+                f"Content-Length: {len(body)}", f"Cache-Control: {cache_control}",
+                "Connection: close"]
+        if etag:
+            head.append(f"ETag: {etag}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+        if method != "HEAD":
+            writer.write(body)
+        await writer.drain()
+
+    async def serve_static(self, writer: asyncio.StreamWriter, path: str,
+                           headers: Dict, method: str) -> None:
+        from urllib.parse import unquote
+        full_path = os.path.realpath(os.path.join(self.site_root, unquote(path).lstrip("/")))
+        if not full_path.startswith(os.path.realpath(self.site_root) + os.sep) \
+                or not os.path.isfile(full_path):
+            await self.respond(writer, 404, b"Not Found")
+            return
+        with open(full_path, "rb") as f:
+            body = f.read()
+        stat = os.stat(full_path)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        await self.respond(writer, 200, body, content_type, etag, "no-cache", headers, method)
+
+    async def stream_reloads(self, writer: asyncio.StreamWriter) -> None:
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-store\r\nConnection: keep-alive\r\n\r\n")
+        await writer.drain()
+        queue: asyncio.Queue = asyncio.Queue()
+        self.listeners.add(queue)
+        try:
+            while True:
+                try:
+                    version = await asyncio.wait_for(queue.get(), HEARTBEAT_INTERVAL)
+                    writer.write(f"event: reload\ndata: {version}\n\n".encode("ascii"))
+                except asyncio.TimeoutError:
+                    writer.write(b": keep-alive\n\n")
+                await writer.drain()
+        finally:
+            self.listeners.discard(queue)
+
+async def serve(source: Optional[str], host: str, port: int,
+                recordings: Optional[str] = RECORDINGS_CSV) -> None:
+    """Render once, then serve and watch until cancelled."""
+    dev = DevServer(source, recordings=recordings)
+    server = await asyncio.start_server(dev.handle, host, port)
+    watcher = asyncio.create_task(dev.watch())
+    print(f"Serving {os.path.relpath(dev.source)} on http://{host}:{port}/ (Ctrl+C to stop)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        watcher.cancel()
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the schedule with live reload.")
+    parser.add_argument("source", nargs="?",
+                        help="schedule file to watch (default: SCHEDULE_METADATA in schedule_geneartor.py)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--recordings", metavar="CSV", default=RECORDINGS_CSV,
+                        help="slides/video index to resolve event links from ('' to skip)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.source, args.host, args.port, args.recordings))
+    except KeyboardInterrupt:
+        print()
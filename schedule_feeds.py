@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Machine-Readable Feeds for the Conference Schedule Generator
+Emits an iCalendar feed and a compact JSON feed of the program, plus a
+manifest with ETags and a delta listing what changed since the last build.
+
+Outputs (in the feeds directory):
+    schedule.ics     iCalendar feed, one VEVENT per event
+    schedule.json    compact JSON feed
+    delta.json       events added/changed and UIDs removed since the previous build
+    manifest.json    ETag and size per feed, hash/SEQUENCE/last change per event
+
+Every event keeps a stable UID built from its event id (see
+layout_event_ids), so moving a session updates it in calendar apps instead
+of duplicating it; give an event an explicit "id" to keep its UID across
+retitles. Its SEQUENCE and DTSTAMP only change when the event's content
+does, so unchanged builds produce byte-identical feeds and ETags.
+
+Dates come from a day's "iso_date" (YYYY-MM-DD) when present, otherwise
+from its "date" ("25th") and the month and year in "conference_dates".
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import date
+from typing import Dict, List, Optional
+
+import schedule_geneartor as generator
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+FEEDS_DIR = "feeds"
+ICS_FILENAME = "schedule.ics"
+JSON_FILENAME = "schedule.json"
+DELTA_FILENAME = "delta.json"
+MANIFEST_FILENAME = "manifest.json"
+FEED_VERSION = 1
+PRODID = "-//CVC-DAG//SSDA schedule generator//EN"
+
+MONTHS = {name: index for index, name in enumerate(
+    ("january", "february", "march", "april", "may", "june", "july",
+     "august", "september", "october", "november", "december"), start=1)}
+
+# ============================================================================
+# DATES AND IDENTITY
+# ============================================================================
+
+def day_dates(metadata: Dict) -> List[date]:
+    """Resolve the calendar date of every day.
+
+    Day numbers that go backwards (e.g. "30th" then "1st") roll over into
+    the next month.
+    """
+    text = metadata.get('conference_dates', '')
+    month_match = re.search(r'([A-Za-z]+)', text)
+    year_match = re.search(r'(\d{4})', text)
+    month = MONTHS.get(month_match.group(1).lower()) if month_match else None
+    year = int(year_match.group(1)) if year_match else None
+
+    dates = []
+    previous_day = 0
+    for day in metadata['days']:
+        if day.get('iso_date'):
+            resolved = date.fromisoformat(day['iso_date'])
+            year, month, previous_day = resolved.year, resolved.month, resolved.day
+            dates.append(resolved)
+            continue
+        number = re.match(r'\s*(\d+)', day.get('date', ''))
+        if not (number and month and year):
+            raise ValueError(f"{day['day_name']}: cannot resolve a date; add an 'iso_date' (YYYY-MM-DD)")
+        day_number = int(number.group(1))
+        if day_number < previous_day:
+            month, year = (1, year + 1) if month == 12 else (month + 1, year)
+        previous_day = day_number
+        dates.append(date(year, month, day_number))
+    return dates
+
+def uid_domain(metadata: Dict) -> str:
+    return metadata.get('uid_domain') or f"{generator.slugify(metadata['conference_title'])}.schedule"
+
+def feed_events(metadata: Dict) -> List[Dict]:
+    """Flatten the program into feed records, in layout order."""
+    days = metadata['days']
+    layout = generator.compile_layout(days)
+    ids = generator.layout_event_ids(layout, days)
+    dates = day_dates(metadata)
+    domain = uid_domain(metadata)
+
+    records = []
+    for row, event in enumerate(layout['events']):
+        track = layout['tracks'][layout['track_id'][row]]
+        day_index = layout['day_id'][row]
+        record = {
+            'uid': f"{ids[row]}@{domain}",
+            'date': dates[day_index].isoformat(),
+            'start': generator.minutes_to_time(layout['start'][row]),
+            'end': generator.minutes_to_time(layout['end'][row]),
+            'title': event['title'],
+            'color': event['color'],
+            'link': event['link'],
+        }
+        room = event.get('room') or track.get('room')
+        if room:
+            record['room'] = room
+        if event.get('presenter'):
+            record['presenter'] = event['presenter']
+        records.append(record)
+    return records
+
+def record_hash(record: Dict) -> str:
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+# ============================================================================
+# ICALENDAR
+# ============================================================================
+
+def ics_escape(text: str) -> str:
+    return (text.replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\n', '\\n'))
+
+def ics_fold(line: str) -> str:
+    """Fold a content line at 75 octets as RFC 5545 requires."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte UTF-8 sequence
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74
+    return "\r\n ".join(parts)
+
+def ics_datetime(day: str, hhmm: str) -> str:
+    """Floating local time, e.g. 20251125T093000; times past 24:00 roll over."""
+    minutes = generator.time_to_minutes(hhmm)
+    moment = date.fromisoformat(day).toordinal() + minutes // (24 * 60)
+    minutes %= 24 * 60
+    return f"{date.fromordinal(moment):%Y%m%d}T{minutes // 60:02d}{minutes % 60:02d}00"
+
+def render_ics(metadata: Dict, records: List[Dict], state: Dict[str, Dict]) -> str:
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{ics_escape(metadata['conference_title'])}",
+    ]
+    if metadata.get('timezone'):
+        lines.append(f"X-WR-TIMEZONE:{metadata['timezone']}")
+    for record in records:
+        entry = state[record['uid']]
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{record['uid']}",
+            f"SEQUENCE:{entry['sequence']}",
+            f"DTSTAMP:{entry['updated']}",
+            f"DTSTART:{ics_datetime(record['date'], record['start'])}",
+            f"DTEND:{ics_datetime(record['date'], record['end'])}",
+            f"SUMMARY:{ics_escape(record['title'])}",
+            f"CATEGORIES:{ics_escape(record['color'])}",
+        ]
+        if record.get('room'):
+            lines.append(f"LOCATION:{ics_escape(record['room'])}")
+        if record['link'].startswith(('http://', 'https://')):
+            lines.append(f"URL:{record['link']}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "".join(ics_fold(line) + "\r\n" for line in lines)
+
+# ============================================================================
+# FEEDS, MANIFEST AND DELTA
+# ============================================================================
+
+def _dump(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def _etag(text: str) -> Dict:
+    data = text.encode("utf-8")
+    return {'etag': f'"{hashlib.sha256(data).hexdigest()[:32]}"', 'bytes': len(data)}
+
+def load_manifest(out_dir: str) -> Dict:
+    try:
+        with open(os.path.join(out_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def build_feeds(metadata: Optional[Dict] = None, out_dir: str = FEEDS_DIR):
+    """Feed files for out_dir without writing them; return (name -> text, new manifest).
+
+    The files include the manifest itself and the delta, which is carried
+    over unchanged when the program did not change.
+    """
+    metadata = metadata if metadata is not None else generator.SCHEDULE_METADATA
+    previous = load_manifest(out_dir)
+    previous_events = previous.get('events', {})
+    now = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+
+    records = feed_events(metadata)
+    state: Dict[str, Dict] = {}
+    changed = []
+    for record in records:
+        digest = record_hash(record)
+        before = previous_events.get(record['uid'])
+        if before and before['hash'] == digest:
+            state[record['uid']] = before
+            continue
+        state[record['uid']] = {
+            'hash': digest,
+            'sequence': before['sequence'] + 1 if before else 0,
+            'updated': now,
+        }
+        changed.append(record)
+    removed = sorted(set(previous_events) - set(state))
+
+    feed = {
+        'version': FEED_VERSION,
+        'title': metadata['conference_title'],
+        'dates': metadata['conference_dates'],
+        'events': [dict(record, seq=state[record['uid']]['sequence']) for record in records],
+    }
+    outputs = {ICS_FILENAME: render_ics(metadata, records, state), JSON_FILENAME: _dump(feed)}
+    files = {name: _etag(text) for name, text in outputs.items()}
+
+    previous_etag = previous.get('files', {}).get(JSON_FILENAME, {}).get('etag')
+    if previous_etag == files[JSON_FILENAME]['etag']:
+        # Nothing changed: keep the previous delta so clients still catching up can use it
+        try:
+            with open(os.path.join(out_dir, DELTA_FILENAME), "r", encoding="utf-8") as f:
+                outputs[DELTA_FILENAME] = f.read()
+        except OSError:
+            pass
+    else:
+        delta = {
+            'since': previous_etag,
+            'etag': files[JSON_FILENAME]['etag'],
+            'changed': [dict(record, seq=state[record['uid']]['sequence']) for record in changed],
+            'removed': removed,
+        }
+        outputs[DELTA_FILENAME] = _dump(delta)
+    if DELTA_FILENAME in outputs:
+        files[DELTA_FILENAME] = _etag(outputs[DELTA_FILENAME])
+
+    manifest = {'version': FEED_VERSION, 'files': files, 'events': state,
+                'changed': len(changed), 'removed': len(removed)}
+    outputs[MANIFEST_FILENAME] = json.dumps(manifest, indent=1, ensure_ascii=False, sort_keys=True)
+    return outputs, manifest
+
+def write_feeds(metadata: Optional[Dict] = None, out_dir: str = FEEDS_DIR) -> Dict:
+    """Write the feeds, delta and manifest into out_dir atomically; return the new manifest.
+
+    To publish them together with other outputs, add the files of
+    build_feeds to a schedule_publish.Publisher instead.
+    """
+    from schedule_publish import atomic_write
+    outputs, manifest = build_feeds(metadata, out_dir)
+    # The manifest goes last, so it never describes feeds that are not in place yet
+    for name in sorted(outputs, key=lambda name: name == MANIFEST_FILENAME):
+        atomic_write(os.path.join(out_dir, name), outputs[name])
+    return manifest
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write iCalendar/JSON feeds with ETags and deltas.")
+    parser.add_argument("source", nargs="?", help="schedule file (default: SCHEDULE_METADATA)")
+    parser.add_argument("-d", "--out-dir", default=FEEDS_DIR, help="directory for the feeds")
+    args = parser.parse_args()
+
+    try:
+        metadata = None
+        if args.source:
+            from schedule_sources import load_schedule
+            metadata = load_schedule(args.source)
+        manifest = write_feeds(metadata, args.out_dir)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    for name, info in sorted(manifest['files'].items()):
+        print(f"✓ {args.out_dir}/{name} ({info['bytes']} bytes, ETag {info['etag']})")
+    print(f"  {manifest['changed']} events changed, {manifest['removed']} removed since last build")
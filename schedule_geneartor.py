@@ -3,15 +3,34 @@
 Conference Schedule Generator - OPTIMIZED VERSION
 Generates HTML schedule from metadata. Events automatically calculate their start times 
 from previous event end times. You only specify the first event time for each day!
+Days can also run parallel tracks (rooms); overlapping events are laid out side by side.
 
 Usage:
-    python3 schedule_generator.py
-
-This will create schedule.html based on the metadata in SCHEDULE_METADATA.
+    python3 schedule_geneartor.py [render] [schedule.json|schedule.yaml|schedule.csv]
+                                  [--day tuesday] [--only] [-o schedule.html|-]
+    python3 schedule_geneartor.py validate [source] [--strict]
+    python3 schedule_geneartor.py export [source] [-f json|events|ics] [-o -]
+    python3 schedule_geneartor.py bench [schedule_bench.py options]
+
+render (the default) creates schedule.html based on the metadata in
+SCHEDULE_METADATA, or on an external schedule file when one is given.
+Outputs are published atomically, with a hash manifest and a diff for cache
+purges (see schedule_publish.py). --day renders just the named days and
+--only just their day columns; both write to stdout unless -o is given.
+Each command imports only the modules it needs.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict
+import hashlib
+import heapq
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from array import array
+from contextlib import nullcontext
+from typing import List, Dict, Optional
 
 # ============================================================================
 # CONSTANTS AND CONFIGURATION
@@ -24,9 +43,22 @@ SCHEDULE_START_MINUTE = 30
 SCHEDULE_END_HOUR = 22
 SCHEDULE_END_MINUTE = 0
 
-TOTAL_MINUTES = (SCHEDULE_END_HOUR * 60 + SCHEDULE_END_MINUTE) - (SCHEDULE_START_HOUR * 60 + SCHEDULE_START_MINUTE)
+SCHEDULE_START_MINUTES = SCHEDULE_START_HOUR * 60 + SCHEDULE_START_MINUTE
+SCHEDULE_END_MINUTES = SCHEDULE_END_HOUR * 60 + SCHEDULE_END_MINUTE
+TOTAL_MINUTES = SCHEDULE_END_MINUTES - SCHEDULE_START_MINUTES
 TOTAL_HEIGHT_PX = 900
 
+# Rendered day columns are cached here between runs
+FRAGMENT_CACHE_DIR = ".schedule_cache"
+
+# Bump whenever rendering changes, so cached fragments from older builds are ignored
+FRAGMENT_FORMAT_VERSION = 2
+
+EVENT_SEPARATOR = '\n                    '
+
+DEFAULT_DAY_START = "09:30"
+DEFAULT_COLOR_CLASS = 'bg-monday'
+
 COLOR_CLASSES = {
     'monday': 'bg-monday', 'tuesday': 'bg-tuesday', 'wednesday': 'bg-wednesday',
     'thursday': 'bg-thursday', 'friday': 'bg-friday', 'coffee': 'bg-coffee',
@@ -182,26 +214,407 @@ def duration_to_height_px(duration_minutes: int) -> float:
     """Convert duration in minutes to height in pixels."""
     return duration_minutes * PX_PER_MINUTE
 
+def minutes_to_time(minutes: int) -> str:
+    """Convert minutes since start of day to HH:MM format."""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
 def calculate_event_position(event_start_time: str) -> tuple:
     """Calculate the top position (px) and time offset for an event."""
     event_minutes = time_to_minutes(event_start_time)
-    schedule_start_minutes = time_to_minutes(f"{SCHEDULE_START_HOUR:02d}:{SCHEDULE_START_MINUTE:02d}")
-    minutes_since_start = event_minutes - schedule_start_minutes
+    minutes_since_start = event_minutes - SCHEDULE_START_MINUTES
     top_px = minutes_to_offset_px(minutes_since_start)
     return top_px, minutes_since_start
 
+# ============================================================================
+# INSTRUMENTATION
+# ============================================================================
+
+class _Span:
+    """Context manager adding its elapsed time to a profiler span."""
+
+    __slots__ = ('totals', 'name', 'started')
+
+    def __init__(self, totals: Dict, name: str):
+        self.totals = totals
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        entry = self.totals.get(self.name)
+        if entry is None:
+            entry = self.totals[self.name] = [0.0, 0]
+        entry[0] += time.perf_counter() - self.started
+        entry[1] += 1
+        return False
+
+_NULL_SPAN = nullcontext()
+
+class Profiler:
+    """Per-stage timing spans, counters and optional cProfile capture.
+
+    Disabled by default; span() then returns a shared no-op context manager
+    and count() returns immediately, so instrumented code pays one
+    attribute check per call.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: Dict[str, list] = {}
+        self.counters: Dict[str, int] = {}
+        self._cprofile = None
+        self._started = 0.0
+        self._elapsed = 0.0
+
+    def start(self, cprofile: bool = False) -> None:
+        """Reset and enable collection; with cprofile also capture a cProfile."""
+        self.spans = {}
+        self.counters = {}
+        self.enabled = True
+        self._started = time.perf_counter()
+        if cprofile:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self._elapsed = time.perf_counter() - self._started
+        self.enabled = False
+
+    def span(self, name: str):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self.spans, name)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self, top: int = 25) -> Dict:
+        """Machine-readable summary of the last start()/stop() window."""
+        report = {
+            'total_seconds': self._elapsed,
+            'spans': {name: {'seconds': seconds, 'calls': calls}
+                      for name, (seconds, calls) in sorted(self.spans.items())},
+            'counters': dict(sorted(self.counters.items())),
+        }
+        if self._cprofile is not None:
+            import pstats
+            stats = pstats.Stats(self._cprofile)
+            functions = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+            report['cprofile'] = [{
+                'function': f"{filename}:{line}({name})",
+                'calls': calls,
+                'total_seconds': total,
+                'cumulative_seconds': cumulative,
+            } for (filename, line, name), (_, calls, total, cumulative, _) in functions[:top]]
+        return report
+
+PROFILER = Profiler()
+
+# ============================================================================
+# LAYOUT COMPILATION
+# ============================================================================
+
+def iter_day_tracks(day: Dict):
+    """Yield the tracks of a day.
+
+    A day's own ``events`` list is its main track. Parallel tracks (rooms)
+    go in an optional ``tracks`` list; each track may set its own
+    ``start_time``, ``name`` and ``room``.
+    """
+    if day.get('events'):
+        yield {'start_time': day.get('start_time', DEFAULT_DAY_START), 'events': day['events']}
+    for track in day.get('tracks', ()):
+        yield track
+
+def assign_lanes(start, end, lane, lanes, lo: int, hi: int) -> None:
+    """Place overlapping events of rows ``lo:hi`` side by side.
+
+    Rows are swept in start order; each event takes the lowest free lane
+    and every event in a cluster of transitively overlapping events gets
+    that cluster's lane count.
+    """
+    rows = sorted(range(lo, hi), key=lambda row: (start[row], end[row]))
+    active: List[tuple] = []      # (end, lane) heap of events still running
+    free_lanes: List[int] = []    # heap of lanes released inside the cluster
+    cluster: List[int] = []
+    cluster_end = -1
+
+    def close_cluster():
+        width = max(lane[row] for row in cluster) + 1
+        for row in cluster:
+            lanes[row] = width
+
+    for row in rows:
+        if cluster and start[row] >= cluster_end:
+            close_cluster()
+            cluster, active, free_lanes = [], [], []
+        while active and active[0][0] <= start[row]:
+            heapq.heappush(free_lanes, heapq.heappop(active)[1])
+        lane[row] = heapq.heappop(free_lanes) if free_lanes else len(active)
+        heapq.heappush(active, (end[row], lane[row]))
+        cluster.append(row)
+        cluster_end = max(cluster_end, end[row])
+    if cluster:
+        close_cluster()
+
+def compile_layout(days: List[Dict]) -> Dict:
+    """Compile days into flat, array-backed layout columns.
+
+    Every event becomes one row. Rows of the same day are contiguous, so
+    ``day_offsets[d]:day_offsets[d + 1]`` selects the rows of day ``d``.
+    Times stay integer minutes since midnight; nothing is formatted as
+    HH:MM until the events are rendered.
+
+    Within a track each event starts when the previous one ends, unless it
+    sets an explicit ``start_time``. Overlapping events get a ``lane`` out
+    of ``lanes`` so they can be rendered side by side.
+    """
+    day_id = array('i')
+    track_id = array('i')
+    start = array('i')
+    end = array('i')
+    duration = array('i')
+    color_id = array('i')
+    day_offsets = array('i', [0])
+    colors: List[str] = []
+    color_ids: Dict[str, int] = {}
+    events: List[Dict] = []
+    tracks: List[Dict] = []
+
+    for index, day in enumerate(days):
+        day_start = day.get('start_time', DEFAULT_DAY_START)
+        for track in iter_day_tracks(day):
+            current_minutes = time_to_minutes(track.get('start_time', day_start))
+            tid = len(tracks)
+            tracks.append(track)
+            for event in track['events']:
+                if event.get('start_time'):
+                    current_minutes = time_to_minutes(event['start_time'])
+                minutes = event['duration_minutes']
+                color_class = COLOR_CLASSES.get(event['color'], DEFAULT_COLOR_CLASS)
+                cid = color_ids.get(color_class)
+                if cid is None:
+                    cid = color_ids[color_class] = len(colors)
+                    colors.append(color_class)
+
+                day_id.append(index)
+                track_id.append(tid)
+                start.append(current_minutes)
+                end.append(current_minutes + minutes)
+                duration.append(minutes)
+                color_id.append(cid)
+                events.append(event)
+
+                # Next event starts when this one ends
+                current_minutes += minutes
+        day_offsets.append(len(events))
+
+    lane = array('i', bytes(4 * len(events)))
+    lanes = array('i', [1]) * len(events)
+    for index in range(len(days)):
+        assign_lanes(start, end, lane, lanes, day_offsets[index], day_offsets[index + 1])
+
+    return {
+        'day_id': day_id,
+        'track_id': track_id,
+        'start': start,
+        'end': end,
+        'duration': duration,
+        'color_id': color_id,
+        'lane': lane,
+        'lanes': lanes,
+        'day_offsets': day_offsets,
+        'colors': colors,
+        'events': events,
+        'tracks': tracks,
+    }
+
+def compute_geometry(layout: Dict) -> Dict:
+    """Compute top and height (px) of every event in one pass over the columns."""
+    layout['top_px'] = array('d', [(minutes - SCHEDULE_START_MINUTES) * PX_PER_MINUTE
+                                   for minutes in layout['start']])
+    layout['height_px'] = array('d', [minutes * PX_PER_MINUTE for minutes in layout['duration']])
+    return layout
+
+def geometry_classes(start: int, duration: int, lane: int, lanes: int) -> str:
+    """Class names carrying an event's geometry (see compile_geometry_css)."""
+    names = f"s{start} d{duration}"
+    if lanes > 1:
+        names += f" l{lane}-{lanes}"
+    return names
+
+def compile_geometry_css(layout: Dict) -> str:
+    """One rule per distinct start, duration and lane split in the layout.
+
+    The rules hold exactly the values the inline styles would, so an event
+    rendered with geometry_classes looks the same as one with a style
+    attribute. Class names use minutes, not pixels, so they stay the same
+    from build to build.
+    """
+    rules = []
+    for minutes in sorted(set(layout['start'])):
+        rules.append(f".s{minutes} {{ top: {(minutes - SCHEDULE_START_MINUTES) * PX_PER_MINUTE:.1f}px; }}")
+    for minutes in sorted(set(layout['duration'])):
+        rules.append(f".d{minutes} {{ height: {minutes * PX_PER_MINUTE:.2f}px; }}")
+    for lane, lanes in sorted(set(zip(layout['lane'], layout['lanes']))):
+        if lanes > 1:
+            width = 100 / lanes
+            rules.append(f".event.l{lane}-{lanes} {{ left: {lane * width:.3f}%; right: auto; width: {width:.3f}%; }}")
+    return "\n".join(rules) + "\n"
+
+def render_layout_event_divs(layout: Dict, lo: int, hi: int, classes: bool = False) -> List[str]:
+    """Render the event divs of layout rows ``lo:hi``, one string per row.
+
+    With classes, top/height/lane geometry is written as classes from
+    compile_geometry_css instead of a per-event style attribute, and
+    identical events (the same coffee break at the same time on several
+    days) are rendered once and shared through ``layout['interned']``.
+    """
+    start = layout['start']
+    end = layout['end']
+    top_px = layout['top_px']
+    height_px = layout['height_px']
+    duration = layout['duration']
+    color_id = layout['color_id']
+    lane = layout['lane']
+    lanes = layout['lanes']
+    colors = layout['colors']
+    events = layout['events']
+    time_strings: Dict[int, str] = {}
+    interned = layout.setdefault('interned', {}) if classes else None
+
+    event_divs = []
+    for row in range(lo, hi):
+        event = events[row]
+        if classes:
+            key = (event['title'], event['link'], event.get('video_link'), event.get('font_weight'),
+                   event.get('font_size'), color_id[row], start[row], duration[row], lane[row], lanes[row])
+            event_html = interned.get(key)
+            if event_html is not None:
+                event_divs.append(event_html)
+                continue
+
+        start_time = time_strings.get(start[row])
+        if start_time is None:
+            start_time = time_strings[start[row]] = minutes_to_time(start[row])
+        end_time = time_strings.get(end[row])
+        if end_time is None:
+            end_time = time_strings[end[row]] = minutes_to_time(end[row])
+
+        # Build style attribute
+        if classes:
+            style_parts = []
+        else:
+            style_parts = [f"top: {top_px[row]:.1f}px", f"height: {height_px[row]:.2f}px"]
+
+            # Overlapping events share the column width
+            if lanes[row] > 1:
+                width = 100 / lanes[row]
+                style_parts.append(f"left: {lane[row] * width:.3f}%; right: auto; width: {width:.3f}%")
+
+        # Add optional styling
+        if event.get('font_weight'):
+            style_parts.append(f"font-weight: {event['font_weight']}")
+        if event.get('font_size'):
+            style_parts.append(f"font-size: {event['font_size']}")
+
+        style = "; ".join(style_parts)
+
+        # Recording link resolved from recordings.csv (see schedule_links)
+        video_html = ''
+        if event.get('video_link'):
+            video_html = f'<a class="event-video" href="{event["video_link"]}">▶ Recording</a>'
+
+        if classes:
+            class_names = f"{colors[color_id[row]]} {geometry_classes(start[row], duration[row], lane[row], lanes[row])}"
+            style_html = f' style="{style};"' if style else ''
+            event_html = f'''<div class="event {class_names}"{style_html}><a href="{event['link']}">{event['title']}</a>{video_html}<div class="event-time">{start_time} – {end_time}</div></div>'''
+            interned[key] = event_html
+        else:
+            event_html = f'''<div class="event {colors[color_id[row]]}" style="{style};"><a href="{event['link']}">{event['title']}</a>{video_html}<div class="event-time">{start_time} – {end_time}</div></div>'''
+        event_divs.append(event_html)
+
+    return event_divs
+
+def render_layout_events(layout: Dict, lo: int, hi: int, classes: bool = False) -> str:
+    """Render the event divs of layout rows ``lo:hi``."""
+    return EVENT_SEPARATOR.join(render_layout_event_divs(layout, lo, hi, classes))
+
+def slugify(text: str) -> str:
+    """Lower-case ASCII slug of text, e.g. 'Lab Session - VLMs' -> 'lab-session-vlms'."""
+    ascii_text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', ascii_text.lower()).strip('-')
+
+def layout_event_ids(layout: Dict, days: List[Dict]) -> List[str]:
+    """Return a stable id for every layout row.
+
+    An event's own ``id`` wins; otherwise the id is ``<day>-<title>``, with
+    ``-2``, ``-3``... appended to repeated titles within a day (e.g. the
+    second coffee break). Ids do not depend on times, so moving an event
+    keeps its id.
+    """
+    ids = []
+    seen: Dict[str, int] = {}
+    day_slugs = [slugify(day['day_name']) for day in days]
+    for row, event in enumerate(layout['events']):
+        if event.get('id'):
+            ids.append(str(event['id']))
+            continue
+        base = f"{day_slugs[layout['day_id'][row]]}-{slugify(event['title'])}"
+        seen[base] = seen.get(base, 0) + 1
+        ids.append(base if seen[base] == 1 else f"{base}-{seen[base]}")
+    return ids
+
+# ============================================================================
+# TEMPLATE ENGINE
+# ============================================================================
+
+TEMPLATE_FIELD = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+def compile_template(text: str) -> List[tuple]:
+    """Split a template into (literal, field) segments once.
+
+    Fields are written ``{{name}}``; every other brace is literal, so CSS
+    and scripts need no escaping. The last segment's field is None.
+    """
+    segments = []
+    position = 0
+    for match in TEMPLATE_FIELD.finditer(text):
+        segments.append((text[position:match.start()], match.group(1)))
+        position = match.end()
+    segments.append((text[position:], None))
+    return segments
+
+def iter_template(segments: List[tuple], values: Dict):
+    """Yield a compiled template's literals and values in order.
+
+    A value may be a string or any iterable of strings, which is streamed
+    through chunk by chunk.
+    """
+    for literal, field in segments:
+        yield literal
+        if field is not None:
+            value = values[field]
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+def render_template(segments: List[tuple], values: Dict) -> str:
+    """Render a compiled template to a single string."""
+    return ''.join(iter_template(segments, values))
+
 # ============================================================================
 # HTML GENERATION
 # ============================================================================
 
-HTML_TEMPLATE = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-:root {{
+SCHEDULE_CSS = ''':root {
   --color-white: rgba(255, 255, 255, 1);
   --color-black: rgba(0, 0, 0, 1);
   --color-cream-50: rgba(252, 252, 249, 1);
@@ -301,48 +714,48 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
   --duration-fast: 150ms;
   --duration-normal: 250ms;
   --ease-standard: cubic-bezier(0.16, 1, 0.3, 1);
-}}
+}
 
-@font-face {{
+@font-face {
   font-family: 'FKGroteskNeue';
   src: url('https://r2cdn.perplexity.ai/fonts/FKGroteskNeue.woff2') format('woff2');
-}}
+}
 
-* {{
+* {
   box-sizing: border-box;
   margin: 0;
   padding: 0;
-}}
+}
 
-body {{
+body {
   font-family: var(--font-family-base);
   background-color: var(--color-background);
   color: var(--color-text);
   line-height: var(--line-height-normal);
   padding: var(--space-20);
   -webkit-font-smoothing: antialiased;
-}}
+}
 
-.header {{
+.header {
   text-align: center;
   margin-bottom: var(--space-32);
-}}
+}
 
-.header h1 {{
+.header h1 {
   font-size: var(--font-size-4xl);
   font-weight: var(--font-weight-bold);
   color: var(--color-text);
   margin-bottom: var(--space-8);
   letter-spacing: var(--letter-spacing-tight);
-}}
+}
 
-.header p {{
+.header p {
   font-size: var(--font-size-lg);
   color: var(--color-text-secondary);
   font-weight: var(--font-weight-medium);
-}}
+}
 
-.schedule-container {{
+.schedule-container {
   max-width: 1400px;
   margin: 0 auto;
   overflow-x: auto;
@@ -350,20 +763,20 @@ body {{
   border-radius: var(--radius-lg);
   box-shadow: var(--shadow-lg);
   padding: var(--space-20);
-}}
+}
 
-.schedule-grid {{
+.schedule-grid {
   display: grid;
   grid-template-columns: 105px repeat(5, 1fr);
   gap: var(--space-8);
   min-width: 900px;
-}}
+}
 
-.time-column {{
+.time-column {
   position: relative;
-}}
+}
 
-.time-label {{
+.time-label {
   height: 45px;
   display: flex;
   align-items: center;
@@ -374,14 +787,14 @@ body {{
   background: rgba(var(--color-brown-600-rgb), 0.03);
   border-radius: var(--radius-sm);
   margin-bottom: var(--space-2);
-}}
+}
 
-.day-column {{
+.day-column {
   position: relative;
-  min-height: {total_height_px}px;
-}}
+  min-height: {{total_height_px}}px;
+}
 
-.day-header {{
+.day-header {
   position: sticky;
   top: 0;
   background: #114e71;
@@ -394,16 +807,16 @@ body {{
   margin-bottom: var(--space-16);
   z-index: 10;
   box-shadow: var(--shadow-sm);
-}}
+}
 
-.events-container {{
+.events-container {
   position: relative;
-  height: {total_height_px}px;
+  height: {{total_height_px}}px;
   background: rgba(var(--color-brown-600-rgb), 0.02);
   border-radius: var(--radius-base);
-}}
+}
 
-.event {{
+.event {
   position: absolute;
   left: 0;
   right: 0;
@@ -416,154 +829,167 @@ body {{
   overflow: hidden;
   transition: transform var(--duration-fast) var(--ease-standard), box-shadow var(--duration-fast) var(--ease-standard);
   cursor: pointer;
-}}
+}
 
-.event:hover {{
+.event:hover {
   transform: translateX(2px);
   box-shadow: var(--shadow-md);
   z-index: 5;
-}}
+}
 
-.event a {{
+.event a {
   color: inherit;
   text-decoration: none;
   display: block;
-}}
+}
 
-.event a:hover {{
+.event a:hover {
   text-decoration: underline;
-}}
+}
+
+.event .event-video {
+  display: inline-block;
+  margin-top: var(--space-4);
+  font-size: var(--font-size-xs);
+  font-weight: var(--font-weight-semibold);
+}
 
-.event-time {{
+.event-time {
   display: none;
   font-size: calc(var(--font-size-xs) - 1px);
   opacity: 0.8;
   margin-top: var(--space-4);
   font-weight: var(--font-weight-semibold);
-}}
+}
 
-.event:hover .event-time {{
+.event:hover .event-time {
   display: block;
-}}
-
-.bg-monday {{ background: #e8f4f8; color: #114e71; }}
-.bg-tuesday {{ background: #fef3e8; color: #8b5a00; }}
-.bg-wednesday {{ background: #e8f8f0; color: #0d5c2e; }}
-.bg-thursday {{ background: #f5e8f8; color: #5a1070; }}
-.bg-friday {{ background: #ffeef0; color: #8b1a2e; }}
-.bg-coffee {{ background: #f5f0e8; color: #6b5a3d; }}
-.bg-lunch {{ background: #ffe8dc; color: #8b4000; }}
-.bg-session1 {{ background: #ffe8f0; color: #8b0040; }}
-.bg-session2 {{ background: #e0f0ff; color: #00457a; }}
-.bg-break {{ background: #fffae8; color: #8b7500; }}
-.bg-evening {{ background: #f0e8ff; color: #4a0080; }}
-.bg-checkin {{ background: #eeeeee; color: #4a4a4a; }}
-.bg-transport {{ background: #f8f8f8; color: #666666; }}
-.bg-presentation {{ background: #fff9e0; color: #8b7000; }}
-
-@media (max-width: 1024px) {{
-  .schedule-grid {{ grid-template-columns: 90px repeat(5, 1fr); min-width: 800px; }}
-  .time-label {{ font-size: var(--font-size-xs); padding-left: var(--space-4); }}
-  .day-header {{ font-size: var(--font-size-sm); padding: var(--space-8); }}
-  .event {{ font-size: var(--font-size-xs); padding: var(--space-6) var(--space-8); }}
-}}
-
-@media (max-width: 768px) {{
-  body {{ padding: var(--space-12); }}
-  .header h1 {{ font-size: var(--font-size-3xl); }}
-  .header p {{ font-size: var(--font-size-base); }}
-  .schedule-container {{ padding: var(--space-12); }}
-  .schedule-grid {{ grid-template-columns: 75px repeat(5, 1fr); min-width: 700px; gap: var(--space-4); }}
-}}
-    </style>
+}
+
+.bg-monday { background: #e8f4f8; color: #114e71; }
+.bg-tuesday { background: #fef3e8; color: #8b5a00; }
+.bg-wednesday { background: #e8f8f0; color: #0d5c2e; }
+.bg-thursday { background: #f5e8f8; color: #5a1070; }
+.bg-friday { background: #ffeef0; color: #8b1a2e; }
+.bg-coffee { background: #f5f0e8; color: #6b5a3d; }
+.bg-lunch { background: #ffe8dc; color: #8b4000; }
+.bg-session1 { background: #ffe8f0; color: #8b0040; }
+.bg-session2 { background: #e0f0ff; color: #00457a; }
+.bg-break { background: #fffae8; color: #8b7500; }
+.bg-evening { background: #f0e8ff; color: #4a0080; }
+.bg-checkin { background: #eeeeee; color: #4a4a4a; }
+.bg-transport { background: #f8f8f8; color: #666666; }
+.bg-presentation { background: #fff9e0; color: #8b7000; }
+
+@media (max-width: 1024px) {
+  .schedule-grid { grid-template-columns: 90px repeat(5, 1fr); min-width: 800px; }
+  .time-label { font-size: var(--font-size-xs); padding-left: var(--space-4); }
+  .day-header { font-size: var(--font-size-sm); padding: var(--space-8); }
+  .event { font-size: var(--font-size-xs); padding: var(--space-6) var(--space-8); }
+}
+
+@media (max-width: 768px) {
+  body { padding: var(--space-12); }
+  .header h1 { font-size: var(--font-size-3xl); }
+  .header p { font-size: var(--font-size-base); }
+  .schedule-container { padding: var(--space-12); }
+  .schedule-grid { grid-template-columns: 75px repeat(5, 1fr); min-width: 700px; gap: var(--space-4); }
+}
+'''
+
+HTML_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{title}}</title>
+    {{stylesheet}}
 </head>
 <body>
     <div class="header">
-        <h1>{title}</h1>
-        <p>{dates}</p>
+        <h1>{{title}}</h1>
+        <p>{{dates}}</p>
     </div>
 
     <div class="schedule-container">
         <div class="schedule-grid">
             <div class="time-column">
                 <div class="day-header" style="visibility: hidden;">Time</div>
-                {time_labels}
+                {{time_labels}}
             </div>
-            {day_columns}
+            {{day_columns}}
         </div>
     </div>
 </body>
 </html>
 '''
 
+COMPILED_CSS = compile_template(SCHEDULE_CSS)
+COMPILED_HTML_TEMPLATE = compile_template(HTML_TEMPLATE)
+DAY_COLUMN_SEPARATOR = '\n\n            '
+STYLESHEET_PREFIX = "schedule"
+
+def render_stylesheet() -> str:
+    """Render the schedule stylesheet."""
+    return render_template(COMPILED_CSS, {'total_height_px': str(TOTAL_HEIGHT_PX)})
+
+def stylesheet_filename(css: str) -> str:
+    """Content-hashed file name for a stylesheet, e.g. schedule.1a2b3c4d5e.css."""
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:10]
+    return f"{STYLESHEET_PREFIX}.{digest}.css"
+
+def write_stylesheet(directory: str = ".", transform=None) -> str:
+    """Write the hashed stylesheet into directory (once) and return its file name.
+
+    transform (e.g. schedule_assets.minify_css) is applied before hashing.
+    """
+    css = render_stylesheet()
+    if transform is not None:
+        css = transform(css)
+    filename = stylesheet_filename(css)
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(css)
+    return filename
+
+def stylesheet_tag(href: Optional[str] = None) -> str:
+    """Link to an external stylesheet, or inline the stylesheet when href is None."""
+    if href:
+        return f'<link rel="stylesheet" href="{href}">'
+    return f"<style>\n{render_stylesheet()}    </style>"
+
+def page_fields(metadata: Dict, stylesheet_href: Optional[str] = None) -> Dict:
+    """Values for every static field of HTML_TEMPLATE."""
+    return {
+        'title': metadata['conference_title'],
+        'dates': metadata['conference_dates'],
+        'stylesheet': stylesheet_tag(stylesheet_href),
+    }
+
 def generate_time_labels() -> str:
     """Generate time labels for the schedule."""
     labels = []
-    current_minutes = time_to_minutes(f"{SCHEDULE_START_HOUR:02d}:{SCHEDULE_START_MINUTE:02d}")
-    end_minutes = time_to_minutes(f"{SCHEDULE_END_HOUR:02d}:{SCHEDULE_END_MINUTE:02d}")
+    current_minutes = SCHEDULE_START_MINUTES
 
-    while current_minutes <= end_minutes:
-        hours = current_minutes // 60
-        mins = current_minutes % 60
-        label = f'<div class="time-label">{hours:02d}:{mins:02d}</div>'
+    while current_minutes <= SCHEDULE_END_MINUTES:
+        label = f'<div class="time-label">{minutes_to_time(current_minutes)}</div>'
         labels.append(label)
         current_minutes += 30
 
     return '\n                '.join(labels)
 
-def generate_events_html(events: List[Dict], day_start_time: str = "09:30") -> str:
+def generate_events_html(events: List[Dict], day_start_time: str = DEFAULT_DAY_START) -> str:
     """Generate event divs for a single day.
 
     Automatically calculates each event's start time from the previous event's end time.
     First event uses day_start_time.
     """
-    event_divs = []
-    current_time_minutes = time_to_minutes(day_start_time)
-
-    for event in events:
-        # Current time is this event's start time
-        start_minutes = current_time_minutes
-        duration = event['duration_minutes']
-        end_minutes = start_minutes + duration
-
-        # Convert minutes back to HH:MM format
-        start_hours = start_minutes // 60
-        start_mins = start_minutes % 60
-        start_time = f"{start_hours:02d}:{start_mins:02d}"
-
-        end_hours = end_minutes // 60
-        end_mins = end_minutes % 60
-        end_time = f"{end_hours:02d}:{end_mins:02d}"
-
-        # Calculate position and height
-        top_px, _ = calculate_event_position(start_time)
-        height_px = duration_to_height_px(duration)
-        color_class = COLOR_CLASSES.get(event['color'], 'bg-monday')
-
-        # Build style attribute
-        style_parts = [f"top: {top_px:.1f}px", f"height: {height_px:.2f}px"]
-
-        # Add optional styling
-        if event.get('font_weight'):
-            style_parts.append(f"font-weight: {event['font_weight']}")
-        if event.get('font_size'):
-            style_parts.append(f"font-size: {event['font_size']}")
-
-        style = "; ".join(style_parts)
-
-        event_html = f'''<div class="event {color_class}" style="{style};"><a href="{event['link']}">{event['title']}</a><div class="event-time">{start_time} – {end_time}</div></div>'''
-        event_divs.append(event_html)
-
-        # Next event starts when this one ends
-        current_time_minutes = end_minutes
-
-    return '\n                    '.join(event_divs)
-
-def generate_day_column(day: Dict) -> str:
-    """Generate a complete day column."""
-    day_start_time = day.get('start_time', "09:30")
-    events_html = generate_events_html(day['events'], day_start_time)
+    layout = compute_geometry(compile_layout([{'start_time': day_start_time, 'events': events}]))
+    return render_layout_events(layout, 0, len(events))
 
+def render_day_column(day: Dict, events_html: str) -> str:
+    """Wrap already rendered event divs into a day column."""
     day_column = f'''<!-- {day['day_name']} Column -->
             <div class="day-column">
                 <div class="day-header">{day['day_name']} {day['date']}</div>
@@ -574,52 +1000,493 @@ def generate_day_column(day: Dict) -> str:
 
     return day_column
 
-def generate_full_html() -> str:
+def generate_day_column(day: Dict) -> str:
+    """Generate a complete day column."""
+    layout = compute_geometry(compile_layout([day]))
+    return render_day_column(day, render_layout_events(layout, 0, len(layout['events'])))
+
+def fragment_key_salt(classes: bool = False) -> str:
+    """Serialize every setting that affects how a day column renders."""
+    settings = [FRAGMENT_FORMAT_VERSION, PX_PER_MINUTE, SCHEDULE_START_MINUTES,
+                DEFAULT_DAY_START, COLOR_CLASSES]
+    if classes:
+        settings.append('classes')
+    return json.dumps(settings, sort_keys=True)
+
+def day_fragment_key(day: Dict, salt: Optional[str] = None) -> str:
+    """Content hash of a day dict, used as its fragment cache key."""
+    if salt is None:
+        salt = fragment_key_salt()
+    payload = json.dumps(day, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{salt}\n{payload}".encode("utf-8")).hexdigest()
+
+def iter_day_columns(days: List[Dict], cache=None, classes: bool = False):
+    """Yield the day columns in order, re-rendering only days missing from the cache.
+
+    cache is any object with ``get(key)``/``put(key, fragment)`` such as
+    schedule_cache.FragmentCache. Cached columns are spliced in unchanged.
+    Stale days share one compiled layout; each column is rendered only when
+    it is about to be yielded. classes selects class-based geometry (see
+    render_layout_event_divs).
+    """
+    columns: List[Optional[str]] = [None] * len(days)
+    keys: List[Optional[str]] = [None] * len(days)
+    stale = list(range(len(days)))
+
+    if cache is not None:
+        with PROFILER.span('cache_lookup'):
+            salt = fragment_key_salt(classes)
+            stale = []
+            for index, day in enumerate(days):
+                keys[index] = day_fragment_key(day, salt)
+                columns[index] = cache.get(keys[index])
+                if columns[index] is None:
+                    stale.append(index)
+
+    with PROFILER.span('layout'):
+        layout = compute_geometry(compile_layout([days[index] for index in stale]))
+    offsets = layout['day_offsets']
+    layout_row = {index: row for row, index in enumerate(stale)}
+    PROFILER.count('days_cached', len(days) - len(stale))
+
+    for index, day in enumerate(days):
+        column = columns[index]
+        if column is None:
+            row = layout_row[index]
+            with PROFILER.span('render_events'):
+                column = render_day_column(day, render_layout_events(layout, offsets[row], offsets[row + 1],
+                                                                     classes))
+            PROFILER.count('days_rendered')
+            PROFILER.count('events_rendered', offsets[row + 1] - offsets[row])
+            if cache is not None:
+                cache.put(keys[index], column)
+        columns[index] = None
+        yield column
+
+def generate_day_columns(days: List[Dict], cache=None, classes: bool = False) -> List[str]:
+    """Generate all day columns (see iter_day_columns)."""
+    return list(iter_day_columns(days, cache, classes))
+
+def iter_full_html(cache=None, metadata: Optional[Dict] = None,
+                   stylesheet_href: Optional[str] = None, classes: bool = False):
+    """Yield the complete HTML document as a sequence of string chunks.
+
+    The header comes first, then the time labels, then one chunk per day
+    column, so only one column is held in memory at a time. metadata
+    defaults to SCHEDULE_METADATA. With stylesheet_href the page links to
+    that stylesheet (see write_stylesheet) instead of inlining it. With
+    classes, event geometry goes into a small generated <style> block
+    instead of one style attribute per event.
+    """
+    if metadata is None:
+        metadata = SCHEDULE_METADATA
+    values = page_fields(metadata, stylesheet_href)
+    if classes:
+        with PROFILER.span('geometry_css'):
+            # Covers every day, including columns that come from the cache
+            geometry_css = compile_geometry_css(compile_layout(metadata['days']))
+        values['stylesheet'] += f"\n    <style>\n{geometry_css}    </style>"
+    with PROFILER.span('time_labels'):
+        values['time_labels'] = generate_time_labels()
+    values['day_columns'] = iter_joined(iter_day_columns(metadata['days'], cache, classes),
+                                        DAY_COLUMN_SEPARATOR)
+    return iter_template(COMPILED_HTML_TEMPLATE, values)
+
+def iter_joined(chunks, separator: str):
+    """Yield chunks with separator between them, like a lazy str.join."""
+    for index, chunk in enumerate(chunks):
+        if index:
+            yield separator
+        yield chunk
+
+def write_full_html(stream, cache=None, metadata: Optional[Dict] = None,
+                    stylesheet_href: Optional[str] = None, classes: bool = False) -> int:
+    """Stream the complete HTML document to a text file-like object.
+
+    Works with anything exposing ``write(str)``, e.g. an open file or
+    ``socket.makefile('w')``. Returns the number of characters written.
+    """
+    written = 0
+    with PROFILER.span('write_full_html'):
+        for chunk in iter_full_html(cache, metadata, stylesheet_href, classes):
+            with PROFILER.span('stream_write'):
+                stream.write(chunk)
+            written += len(chunk)
+    PROFILER.count('characters_written', written)
+    return written
+
+def generate_full_html(cache=None, metadata: Optional[Dict] = None,
+                       stylesheet_href: Optional[str] = None, classes: bool = False) -> str:
     """Generate the complete HTML document."""
-    time_labels = generate_time_labels()
-    day_columns = '\n\n            '.join([
-        generate_day_column(day) for day in SCHEDULE_METADATA['days']
-    ])
+    return ''.join(iter_full_html(cache, metadata, stylesheet_href, classes))
+
 
-    html = HTML_TEMPLATE.format(
-        title=SCHEDULE_METADATA['conference_title'],
-        dates=SCHEDULE_METADATA['conference_dates'],
-        total_height_px=TOTAL_HEIGHT_PX,
-        time_labels=time_labels,
-        day_columns=day_columns
-    )
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
 
-    return html
+COMMANDS = ("render", "validate", "export", "bench")
+EXPORT_FORMATS = ("json", "events", "ics")
+
+def select_days(metadata: Dict, targets: Optional[List[str]]) -> Dict:
+    """Copy of metadata keeping only the days named by targets.
+
+    A target is a day name ("tuesday"), a date ("26th"), an ISO date or a
+    1-based position; targets may also be comma-separated. Raises
+    ValueError for targets that match no day.
+    """
+    wanted = {target.strip().lower() for value in targets or () for target in value.split(',') if target.strip()}
+    if not wanted:
+        return metadata
+    days, matched = [], set()
+    for position, day in enumerate(metadata['days'], start=1):
+        names = {day['day_name'].lower(), str(day.get('date', '')).lower(),
+                 str(day.get('iso_date', '')).lower(), str(position)} & wanted
+        if names:
+            days.append(day)
+            matched |= names
+    if wanted - matched:
+        raise ValueError(f"no day matches {', '.join(sorted(wanted - matched))}")
+    return dict(metadata, days=days)
+
+def load_source(args) -> Dict:
+    """The schedule named on the command line, or SCHEDULE_METADATA."""
+    if not args.source:
+        return SCHEDULE_METADATA
+    from schedule_sources import load_schedule
+    with PROFILER.span('load_metadata'):
+        return load_schedule(args.source)
+
+def load_metadata(args) -> Dict:
+    """The schedule named on the command line (see load_source), narrowed to --day."""
+    return select_days(load_source(args), args.day)
+
+def _write_output(path: str, content: str, stdout) -> None:
+    if path == "-":
+        stdout.write(content)
+        stdout.flush()
+    else:
+        from schedule_publish import atomic_write
+        atomic_write(path, content)
+
+def _write_profile(args, stats: Dict[str, int], written: int) -> None:
+    if not args.profile:
+        return
+    PROFILER.stop()
+    PROFILER.counters['bytes_written'] = written
+    PROFILER.counters.update({f"cache_{key}": value for key, value in stats.items()})
+    with open(args.profile, "w", encoding="utf-8") as f:
+        json.dump(PROFILER.report(), f, indent=2)
+    print(f"✓ Profile written: {args.profile}")
+
+def run_render(args, parser) -> int:
+    """render: write the schedule page (or, with --only, just the day columns)."""
+    output = args.output
+    to_stdout = output == "-"
+    if to_stdout and (args.compress or args.videos or args.feeds or args.check_links):
+        parser.error("--compress, --videos, --feeds and --check-links need a file output")
+    if args.virtual and args.classes:
+        parser.error("--virtual renders events in the browser and cannot be combined with --classes")
+    if args.profile:
+        PROFILER.start(cprofile=args.cprofile)
+    try:
+        metadata = load_source(args)
+        # Checked before links are resolved, but applied after: recordings match the whole program
+        select_days(metadata, args.day)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    recordings = None
+    if not args.no_recordings:
+        from schedule_links import RECORDINGS_CSV, describe_row, load_recordings_index, resolve_links
+        recordings = args.recordings or RECORDINGS_CSV
+        if os.path.exists(recordings):
+            with PROFILER.span('resolve_links'):
+                metadata, links = resolve_links(metadata, load_recordings_index(recordings))
+            print(f"✓ Links resolved from {os.path.relpath(recordings)}: {links['matched_rows']} rows matched")
+            for row in links['unmatched_rows']:
+                print(f"⚠ Unmatched recording ({describe_row(row)})")
+            for row in links['missing_slides']:
+                print(f"⚠ Missing slide file ({describe_row(row)})")
+        elif args.recordings:
+            parser.exit(1, f"✗ {recordings}: not found\n")
+        else:
+            recordings = None
+    # Feeds always describe the whole program: a partial feed would tell calendars to delete the rest
+    program = metadata
+    metadata = select_days(metadata, args.day)
+
+    from schedule_cache import FragmentCache
+    cache = FragmentCache(FRAGMENT_CACHE_DIR)
+    if args.minify or args.compress:
+        import schedule_assets
+
+    if args.only:
+        fragment = DAY_COLUMN_SEPARATOR.join(iter_day_columns(metadata['days'], cache, args.classes)) + '\n'
+        if args.classes:
+            fragment = f"<style>\n{compile_geometry_css(compile_layout(metadata['days']))}</style>\n{fragment}"
+        try:
+            _write_output(output, schedule_assets.minify_html(fragment) if args.minify else fragment, args.stdout)
+        except OSError as exc:
+            parser.exit(1, f"✗ {exc}\n")
+        stats = cache.stats()
+        print(f"✓ Day columns written to {'stdout' if to_stdout else output}: "
+              f"{stats['hits']} cached, {stats['misses']} rendered")
+        _write_profile(args, stats, len(fragment.encode("utf-8")))
+        return 0
+
+    # Sizes before minification, for the report
+    original: Dict[str, int] = {}
+    with PROFILER.span('stylesheet'):
+        css = render_stylesheet()
+        if args.minify:
+            css_bytes = len(css.encode("utf-8"))
+            css = schedule_assets.minify_css(css)
+        stylesheet = stylesheet_filename(css)
+    root, name = os.path.split(output)
+    if args.minify:
+        original[stylesheet] = css_bytes
+    if args.virtual:
+        from schedule_virtual import write_virtual_html
+        page = lambda stream: write_virtual_html(stream, metadata, None if to_stdout else stylesheet)
+        fragments = None
+    elif to_stdout:
+        page = lambda stream: write_full_html(stream, cache, metadata, None, args.classes)
+        fragments = None
+    else:
+        # Day fragments are hashed as the page is written, so each column renders once
+        from schedule_publish import FragmentRecorder
+        recorder = FragmentRecorder(metadata, cache, args.classes)
+        fragments = recorder.fragments
+        page = lambda stream: write_full_html(stream, recorder, metadata, stylesheet, args.classes)
+    if args.minify:
+        from io import StringIO
+        buffer = StringIO()
+        page(buffer)
+        original["stdout" if to_stdout else name] = len(buffer.getvalue().encode("utf-8"))
+        with PROFILER.span('minify'):
+            page = schedule_assets.minify_html(buffer.getvalue())
+
+    if to_stdout:
+        # A page on stdout has nowhere to put the stylesheet, so it is inlined
+        with PROFILER.span('write_stdout'):
+            written = page(args.stdout) if callable(page) else args.stdout.write(page)
+            args.stdout.flush()
+        stats = cache.stats()
+        print(f"✓ Schedule written to stdout ({len(metadata['days'])} days)")
+        if args.minify:
+            report = {'path': "stdout", 'original': original["stdout"], 'minified': len(page.encode("utf-8"))}
+            print(f"  {schedule_assets.format_report(report)}")
+        print(f"  Day columns: {stats['hits']} cached, {stats['misses']} rendered")
+        _write_profile(args, stats, written)
+        return 0
+
+    if args.videos:
+        from schedule_links import RECORDINGS_CSV
+        from schedule_video import RECORDINGS_FILENAME, prepare_recordings, write_recordings_html
+        try:
+            with PROFILER.span('videos'):
+                videos = prepare_recordings(metadata, recordings or args.recordings or RECORDINGS_CSV)
+        except OSError as exc:
+            parser.exit(1, f"✗ {exc}\n")
+        if videos[2]:
+            print(f"⚠ {videos[2]}")
+
+    if args.feeds:
+        from schedule_feeds import build_feeds
+        with PROFILER.span('feeds'):
+            feed_files, feeds = build_feeds(program, args.feeds)
+
+    from schedule_publish import MANIFEST_FILENAME, Publisher, format_diff
+    try:
+        with PROFILER.span('publish'), Publisher(root or ".") as publisher:
+            publisher.add(stylesheet, css, args.compress)
+            publisher.add(name, page, args.compress, fragments)
+            if args.videos:
+                publisher.add(RECORDINGS_FILENAME, lambda stream: write_recordings_html(
+                    stream, metadata, videos[0], videos[1]), args.compress)
+            if args.feeds:
+                for feed_name, text in feed_files.items():
+                    publisher.add(os.path.relpath(os.path.join(args.feeds, feed_name), root or "."), text)
+    except OSError as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    published = publisher.manifest
+    stats = cache.stats()
+    print(f"✓ Schedule generated: {output} ({published['outputs'][name]['bytes']} bytes) + {stylesheet}")
+    reported = {name, stylesheet}
+    for path, size in original.items():
+        report = {'path': path, 'original': size, 'minified': published['outputs'][path]['bytes']}
+        for encoding, suffix in schedule_assets.ENCODING_SUFFIXES.items():
+            if path + suffix in published['outputs']:
+                report[encoding] = published['outputs'][path + suffix]['bytes']
+                reported.add(path + suffix)
+        print(f"  {schedule_assets.format_report(report)}")
+    for path in sorted(set(published['outputs']) - reported):
+        print(f"  {path}: {published['outputs'][path]['bytes']} bytes")
+    print(f"✓ Published {len(published['written'])} changed outputs, manifest in {MANIFEST_FILENAME}")
+    print(f"  Outputs: {format_diff(published['diff']['outputs'])}; "
+          f"day fragments: {format_diff(published['diff']['fragments'])}")
+    if args.feeds:
+        print(f"✓ Feeds written: {args.feeds}/ ({feeds['changed']} events changed, "
+              f"{feeds['removed']} removed)")
+    print(f"  Day columns: {stats['hits']} cached, {stats['misses']} rendered")
+    from schedule_conflicts import find_conflicts
+    with PROFILER.span('conflicts'):
+        conflicts = find_conflicts(metadata['days'])
+    for conflict in conflicts:
+        print(f"⚠ {conflict['kind']} conflict ({conflict['resource']}) on {conflict['day']} "
+              f"{conflict['start']}–{conflict['end']}: "
+              f"{conflict['first']!r} / {conflict['second']!r}")
+
+    broken = []
+    if args.check_links:
+        from schedule_linkcheck import LinkChecker, check_recordings, format_problem, site_pages
+        with PROFILER.span('check_links'):
+            pages = sorted(set(site_pages()) | {os.path.abspath(output)})
+            broken = LinkChecker().check(pages)
+            if recordings:
+                broken += check_recordings(recordings)
+        for problem in broken:
+            print(f"✗ {format_problem(problem)}")
+        print(f"{'✗' if broken else '✓'} Links checked: {len(broken)} broken references")
+
+    _write_profile(args, stats, published['outputs'][name]['bytes'])
+    print("  Tip: only each day's start_time is needed; event times follow from duration_minutes.")
+    return 1 if broken else 0
+
+def run_validate(args, parser) -> int:
+    """validate: check the schema, the computed layout and double bookings."""
+    from schedule_sources import validate_schedule
+    try:
+        metadata = load_metadata(args)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+    errors = validate_schedule(metadata)
+    for error in errors:
+        print(f"✗ {error}")
+    if errors:
+        return 1
+    try:
+        layout = compile_layout(metadata['days'])
+    except (KeyError, TypeError, ValueError) as exc:
+        print(f"✗ Cannot lay out the schedule: {exc!r}")
+        return 1
+
+    from schedule_conflicts import find_conflicts
+    conflicts = find_conflicts(metadata['days'], layout)
+    for conflict in conflicts:
+        print(f"⚠ {conflict['kind']} conflict ({conflict['resource']}) on {conflict['day']} "
+              f"{conflict['start']}–{conflict['end']}: "
+              f"{conflict['first']!r} / {conflict['second']!r}")
+    print(f"{'⚠' if conflicts else '✓'} {len(metadata['days'])} days, {len(layout['events'])} events, "
+          f"{len(conflicts)} conflicts")
+    return 1 if conflicts and args.strict else 0
+
+def run_export(args, parser) -> int:
+    """export: write the schedule as JSON metadata, flat event records or iCalendar."""
+    try:
+        metadata = load_metadata(args)
+        if args.format == "json":
+            content = json.dumps(metadata, indent=1, ensure_ascii=False) + "\n"
+        else:
+            from schedule_feeds import feed_events, render_ics
+            records = feed_events(metadata)
+            if args.format == "events":
+                content = json.dumps(records, indent=1, ensure_ascii=False) + "\n"
+            else:
+                stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+                content = render_ics(metadata, records, {record['uid']: {'sequence': 0, 'updated': stamp}
+                                                         for record in records})
+        _write_output(args.output, content, args.stdout)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+    if args.output != "-":
+        print(f"✓ {args.output} ({args.format}, {len(metadata['days'])} days)")
+    return 0
+
+def build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Generate, check and export the conference schedule.",
+        epilog="Without a command, 'render' is assumed: schedule_geneartor.py [source] [options].")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="{" + ",".join(COMMANDS) + "}")
+    source = argparse.ArgumentParser(add_help=False)
+    source.add_argument("source", nargs="?",
+                        help="JSON, YAML or CSV schedule file (default: SCHEDULE_METADATA in this script)")
+    source.add_argument("--day", action="append", metavar="DAY",
+                        help="only these days: name, date, ISO date or 1-based position (repeatable)")
+
+    render = commands.add_parser("render", parents=[source], help="write the schedule page")
+    render.add_argument("-o", "--output", default=None,
+                        help="page to write, or - for stdout (default: schedule.html; stdout with --day/--only)")
+    render.add_argument("--only", action="store_true",
+                        help="write only the day columns, without the page around them")
+    render.add_argument("--minify", action="store_true", help="minify the HTML and CSS outputs")
+    render.add_argument("--compress", action="store_true",
+                        help="also write precompressed .gz/.br siblings of the outputs")
+    render.add_argument("--recordings", metavar="CSV", default=None,
+                        help="slides/video index to resolve event links from (default: slides/recordings.csv)")
+    render.add_argument("--no-recordings", action="store_true",
+                        help="keep event links exactly as written in the metadata")
+    render.add_argument("--virtual", action="store_true",
+                        help="write a compact layout payload plus a virtualized renderer instead of one div per event")
+    render.add_argument("--classes", action="store_true",
+                        help="write event geometry as generated CSS classes instead of inline styles")
+    render.add_argument("--videos", action="store_true",
+                        help="also write recordings.html with click-to-load video facades")
+    render.add_argument("--feeds", metavar="DIR",
+                        help="also write iCalendar/JSON feeds, a delta and a manifest to DIR")
+    render.add_argument("--check-links", action="store_true",
+                        help="check links and assets of the generated page and the other site pages")
+    render.add_argument("--profile", metavar="REPORT.json",
+                        help="write per-stage timings and counters as JSON")
+    render.add_argument("--cprofile", action="store_true",
+                        help="include a cProfile function summary in the --profile report")
+    render.set_defaults(handler=run_render, parser=render)
+
+    validate = commands.add_parser("validate", parents=[source],
+                                   help="check the schedule without rendering it")
+    validate.add_argument("--strict", action="store_true", help="also fail on double bookings")
+    validate.set_defaults(handler=run_validate, parser=validate)
+
+    export = commands.add_parser("export", parents=[source], help="write the schedule as data")
+    export.add_argument("-f", "--format", choices=EXPORT_FORMATS, default="json",
+                        help="json metadata, flat event records, or iCalendar (default: json)")
+    export.add_argument("-o", "--output", default="-", help="file to write, or - for stdout (default)")
+    export.set_defaults(handler=run_export, parser=export)
+
+    # Dispatched to schedule_bench.main by main(); listed here for --help
+    commands.add_parser("bench", help="benchmark the rendering stages (see schedule_bench.py)")
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse the command line and run one command; return the exit status."""
+    from contextlib import redirect_stdout
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "render")
+    if argv[0] == "bench":
+        # Every option belongs to schedule_bench, which argparse.REMAINDER cannot pass on reliably
+        import schedule_bench
+        return schedule_bench.main(argv[1:])
+    args = build_parser().parse_args(argv)
+    if args.command == "render" and args.output is None:
+        args.output = "-" if args.day or args.only else "schedule.html"
+    args.stdout = sys.stdout
+    if getattr(args, "output", None) != "-":
+        return args.handler(args, args.parser)
+    # Output goes to stdout, so progress messages go to stderr
+    with redirect_stdout(sys.stderr):
+        return args.handler(args, args.parser)
 
 # ============================================================================
 # MAIN - EXECUTION
 # ============================================================================
 
 if __name__ == "__main__":
-    print("Generating schedule...")
-    html_output = generate_full_html()
-
-    with open("schedule.html", "w", encoding="utf-8") as f:
-        f.write(html_output)
-
-    print(f"✓ Schedule generated: schedule.html ({len(html_output)} bytes)")
-    print()
-    print("IMPORTANT CHANGES IN THIS VERSION:")
-    print("  • Each day now has a 'start_time' property")
-    print("  • Events NO LONGER need 'start_time' - they're calculated!")
-    print("  • Just specify 'duration_minutes' for each event")
-    print("  • Times auto-calculate: previous_end_time → next_start_time")
-    print()
-    print("Example:")
-    print("""
-    {
-        "day_name": "Monday",
-        "date": "25th",
-        "start_time": "09:30",     ← Only time you specify!
-        "events": [
-            {"title": "Event 1", "duration_minutes": 90, ...},  ← 09:30-11:00
-            {"title": "Event 2", "duration_minutes": 60, ...},  ← 11:00-12:00 (auto!)
-            {"title": "Event 3", "duration_minutes": 30, ...},  ← 12:00-12:30 (auto!)
-        ]
-    }
-    """)
+    # Let the schedule_* modules reuse this module instead of importing the script a second time
+    sys.modules.setdefault("schedule_geneartor", sys.modules[__name__])
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Responsive Image Pipeline for the Conference Schedule Generator
+Produces resized WebP (and AVIF, when Pillow supports it) variants of the
+Team/ portraits and Media/ backgrounds, plus srcset metadata for the pages.
+
+Usage:
+    python3 schedule_images.py [Team Media] [-d img] [--widths 160,320,640,1280] [-j WORKERS]
+
+Outputs go to <out>/<source dir>/<name>-<ext>-<width>.<format> (e.g.
+img/Team/adri-png-320.webp, so adri.png and adri.jpg stay apart), and
+<out>/manifest.json records, per source image, its content hash, size and a
+ready-to-use srcset string per format. Images whose hash matches the
+manifest (and whose variants all exist) are skipped; the rest are resized
+on a process pool. Widths larger than the source are dropped, but every
+image gets at least one variant.
+
+Needs Pillow (pip install pillow); AVIF output additionally needs a Pillow
+build with AVIF support.
+"""
+
+import hashlib
+import html
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+SITE_ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIRS = ("Team", "Media")
+OUTPUT_DIR = "img"
+MANIFEST_FILENAME = "manifest.json"
+DEFAULT_WIDTHS = (160, 320, 640, 1280)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+QUALITY = {"webp": 80, "avif": 55}
+# Bump whenever encoding settings or variant names change, so every variant is rebuilt
+PIPELINE_VERSION = 2
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def _require_pillow():
+    try:
+        from PIL import Image, ImageOps, features
+    except ImportError:
+        raise RuntimeError("the image pipeline needs Pillow (pip install pillow)") from None
+    return Image, ImageOps, features
+
+def available_formats() -> List[str]:
+    """Output formats this Pillow build can encode, best compression first."""
+    _, _, features = _require_pillow()
+    return [name for name in ("avif", "webp") if features.check(name)]
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def find_images(root: str, dirs: Sequence[str]) -> List[str]:
+    """Source images below root/dirs, as root-relative paths."""
+    found = []
+    for directory in dirs:
+        for current, _, names in os.walk(os.path.join(root, directory)):
+            for name in sorted(names):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    found.append(os.path.relpath(os.path.join(current, name), root))
+    return sorted(found)
+
+# ============================================================================
+# RESIZING (WORKER)
+# ============================================================================
+
+def render_variants(root: str, source: str, digest: str, out_dir: str,
+                    widths: Sequence[int], formats: Sequence[str]) -> Dict:
+    """Resize one image into every width/format; return its manifest entry."""
+    Image, ImageOps, _ = _require_pillow()
+    with Image.open(os.path.join(root, source)) as original:
+        image = ImageOps.exif_transpose(original)
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "P") else "RGB")
+
+    targets = sorted({width for width in widths if width < image.width} | {min(min(widths), image.width)})
+    base, extension = os.path.splitext(source)
+    stem = os.path.join(out_dir, f"{base}-{extension[1:]}")
+    os.makedirs(os.path.dirname(stem), exist_ok=True)
+
+    variants: Dict[str, List[Dict]] = {name: [] for name in formats}
+    for width in targets:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for name in formats:
+            path = f"{stem}-{width}.{name}"
+            resized.save(path, name.upper(), quality=QUALITY[name])
+            variants[name].append({"width": width, "height": height,
+                                   "path": os.path.relpath(path, out_dir).replace(os.sep, "/"),
+                                   "bytes": os.path.getsize(path)})
+    return {
+        "hash": digest,
+        "width": image.width,
+        "height": image.height,
+        "bytes": os.path.getsize(os.path.join(root, source)),
+        "variants": variants,
+    }
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+def srcset(entry: Dict, name: str, base: str = OUTPUT_DIR + "/") -> str:
+    """srcset attribute value for one format of a manifest entry."""
+    return ", ".join(f"{base}{variant['path']} {variant['width']}w" for variant in entry["variants"][name])
+
+def picture_html(source: str, entry: Dict, alt: str, sizes: str = "100vw",
+                 base: str = OUTPUT_DIR + "/") -> str:
+    """<picture> markup with one <source> per format, falling back to the original."""
+    sources = "".join(f'<source type="image/{name}" srcset="{srcset(entry, name, base)}" sizes="{sizes}">'
+                      for name in entry["variants"])
+    return (f'<picture>{sources}<img src="{html.escape(source)}" alt="{html.escape(alt)}" '
+            f'width="{entry["width"]}" height="{entry["height"]}" loading="lazy" decoding="async"></picture>')
+
+def _up_to_date(entry: Optional[Dict], digest: str, out_dir: str, widths, formats) -> bool:
+    if not entry or entry.get("hash") != digest or entry.get("widths") != list(widths) \
+            or sorted(entry["variants"]) != sorted(formats):
+        return False
+    return all(os.path.exists(os.path.join(out_dir, variant["path"]))
+               for variants in entry["variants"].values() for variant in variants)
+
+def build_images(root: str = SITE_ROOT, dirs: Sequence[str] = SOURCE_DIRS,
+                 out_dir: Optional[str] = None, widths: Sequence[int] = DEFAULT_WIDTHS,
+                 workers: Optional[int] = None) -> Dict:
+    """Build every changed image's variants; return a summary with the manifest."""
+    out_dir = out_dir or os.path.join(root, OUTPUT_DIR)
+    formats = available_formats()
+    if not formats:
+        raise RuntimeError("this Pillow build can encode neither WebP nor AVIF")
+    manifest_path = os.path.join(out_dir, MANIFEST_FILENAME)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != PIPELINE_VERSION:
+            manifest = {}
+    except (OSError, ValueError):
+        manifest = {}
+    images = manifest.get("images", {})
+
+    sources = find_images(root, dirs)
+    digests = dict(zip(sources, map(file_hash, [os.path.join(root, source) for source in sources])))
+    stale = [source for source in sources
+             if not _up_to_date(images.get(source), digests[source], out_dir, widths, formats)]
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {source: pool.submit(render_variants, root, source, digests[source],
+                                           out_dir, widths, formats) for source in stale}
+            for source, future in futures.items():
+                images[source] = dict(future.result(), widths=list(widths))
+
+    manifest = {"version": PIPELINE_VERSION, "formats": formats,
+                "images": {source: images[source] for source in sources}}
+    os.makedirs(out_dir, exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return {"built": stale, "skipped": len(sources) - len(stale), "manifest": manifest}
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build responsive WebP/AVIF image variants.")
+    parser.add_argument("dirs", nargs="*", default=list(SOURCE_DIRS), help="source directories")
+    parser.add_argument("-d", "--out-dir", default=None, help=f"output directory (default: {OUTPUT_DIR}/)")
+    parser.add_argument("--widths", default=",".join(map(str, DEFAULT_WIDTHS)),
+                        help="comma-separated variant widths in pixels")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    try:
+        widths = sorted({int(width) for width in args.widths.split(",") if width})
+        summary = build_images(SITE_ROOT, args.dirs, args.out_dir, widths, args.workers)
+    except (RuntimeError, ValueError, OSError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    images = summary["manifest"]["images"]
+    for source in summary["built"]:
+        entry = images[source]
+        variants = [variant for variants in entry["variants"].values() for variant in variants]
+        print(f"✓ {source}: {entry['bytes']} bytes → {len(variants)} variants "
+              f"({', '.join(entry['variants'])}, smallest {min(v['bytes'] for v in variants)} bytes)")
+    print(f"  {len(summary['built'])} built, {summary['skipped']} unchanged")
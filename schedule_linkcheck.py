@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Link and Asset Integrity Checker for the Conference Schedule Generator
+Extracts every href/src/srcset from the generated schedule and the other
+site pages, and reports broken references before deploying.
+
+Usage:
+    python3 schedule_linkcheck.py [page.html ...] [--recordings slides/recordings.csv]
+
+Without pages, every *.html file in the site root is checked. A reference is
+broken when:
+    local file      it does not exist below the page's directory
+    #fragment       no element on the target page has that id
+    http(s) URL     it is not a syntactically valid URL (no network access)
+    "TODO"/"TBA"    it is a placeholder (recordings.csv cells included)
+
+Pages are parsed on a thread pool. The references found in each page are
+cached in .schedule_cache/links.json by path, mtime and size, so re-checks
+only re-parse pages that changed; existence checks are re-run every time and
+deduplicated across pages.
+"""
+
+import csv
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+SITE_ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(".schedule_cache", "links.json")
+# Bump whenever extraction changes, so cached page references are rebuilt
+CACHE_VERSION = 1
+
+LINK_ATTRIBUTES = {"href", "src", "poster", "data"}
+SKIPPED_SCHEMES = {"mailto", "tel", "javascript", "data", "blob"}
+PLACEHOLDERS = {"todo", "tba"}
+HOSTNAME = re.compile(r'^[A-Za-z0-9]([A-Za-z0-9\-]*[A-Za-z0-9])?(\.[A-Za-z0-9]([A-Za-z0-9\-]*[A-Za-z0-9])?)*$')
+
+# ============================================================================
+# EXTRACTION
+# ============================================================================
+
+class LinkExtractor(HTMLParser):
+    """Collects (line, attribute, url) references and element ids of a page."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.references: List[Tuple[int, str, str]] = []
+        self.ids: Set[str] = set()
+
+    def handle_starttag(self, tag, attrs):
+        line = self.getpos()[0]
+        for name, value in attrs:
+            if value is None:
+                continue
+            if name in ("id", "name") and tag != "meta":
+                self.ids.add(value)
+            elif name in LINK_ATTRIBUTES and not (tag == "object" and name != "data"):
+                self.references.append((line, name, value.strip()))
+            elif name == "srcset":
+                for candidate in value.split(","):
+                    if candidate.strip():
+                        self.references.append((line, name, candidate.split()[0]))
+
+def extract_page(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        extractor = LinkExtractor()
+        extractor.feed(f.read())
+        extractor.close()
+    return {"references": extractor.references, "ids": sorted(extractor.ids)}
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+
+def url_syntax_error(url: str) -> Optional[str]:
+    """Why an absolute http(s) URL is malformed, or None."""
+    if any(character.isspace() for character in url):
+        return "URL contains whitespace"
+    parts = urlsplit(url)
+    try:
+        hostname = parts.hostname
+        parts.port
+    except ValueError as exc:
+        return f"invalid URL ({exc})"
+    if not hostname or not HOSTNAME.match(hostname):
+        return "invalid host name"
+    return None
+
+def classify(page: str, url: str) -> Tuple[str, Optional[str]]:
+    """Return ('skip'|'remote'|'fragment'|'local'|'broken', detail)."""
+    if url.lower() in PLACEHOLDERS:
+        return "broken", f"placeholder link {url!r}"
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme in SKIPPED_SCHEMES:
+        return "skip", None
+    if scheme in ("http", "https") or url.startswith("//"):
+        error = url_syntax_error(url if scheme else "https:" + url)
+        return ("broken", error) if error else ("remote", None)
+    if scheme:
+        return "broken", f"unsupported scheme {scheme!r}"
+    if not parts.path:
+        return ("fragment", parts.fragment) if parts.fragment else ("skip", None)
+    target = os.path.normpath(os.path.join(os.path.dirname(page), unquote(parts.path)))
+    return "local", target
+
+class LinkChecker:
+    """Checks pages in parallel, caching extracted references per page mtime."""
+
+    def __init__(self, cache_path: Optional[str] = CACHE_PATH, workers: Optional[int] = None):
+        self.cache_path = cache_path
+        self.workers = workers
+        self.cache: Dict[str, Dict] = {}
+        self.parsed = 0
+        if cache_path:
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get("version") == CACHE_VERSION:
+                    self.cache = cache["pages"]
+            except (OSError, ValueError):
+                pass
+
+    def _page(self, path: str) -> Dict:
+        stat = os.stat(path)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cached = self.cache.get(path)
+        if cached and cached["stamp"] == stamp:
+            return cached
+        entry = dict(extract_page(path), stamp=stamp)
+        self.cache[path] = entry
+        self.parsed += 1
+        return entry
+
+    def save(self) -> None:
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "pages": self.cache}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def check(self, pages: List[str]) -> List[Dict]:
+        """Return one problem dict (page, line, url, reason) per broken reference."""
+        pages = [os.path.abspath(page) for page in pages]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            entries = dict(zip(pages, pool.map(self._page, pages)))
+
+            problems = []
+            pending: Dict[str, List[Tuple[str, int, str]]] = {}
+            for page, entry in entries.items():
+                for line, _, url in entry["references"]:
+                    kind, detail = classify(page, url)
+                    if kind == "broken":
+                        problems.append({"page": page, "line": line, "url": url, "reason": detail})
+                    elif kind == "fragment" and detail not in entry["ids"]:
+                        problems.append({"page": page, "line": line, "url": url,
+                                         "reason": f"no element with id {detail!r}"})
+                    elif kind == "local":
+                        pending.setdefault(detail, []).append((page, line, url))
+
+            # Each distinct target is checked once, however many pages use it
+            targets = list(pending)
+            for target, exists in zip(targets, pool.map(os.path.exists, targets)):
+                if not exists:
+                    for page, line, url in pending[target]:
+                        problems.append({"page": page, "line": line, "url": url,
+                                         "reason": "file not found"})
+        self.save()
+        return sorted(problems, key=lambda problem: (problem["page"], problem["line"]))
+
+# ============================================================================
+# RECORDINGS CSV
+# ============================================================================
+
+def check_recordings(path: str) -> List[Dict]:
+    """Report placeholder cells, missing slide files and malformed video URLs."""
+    problems = []
+    slides_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            for column, value in row.items():
+                value = (value or "").strip()
+                if value.lower() in PLACEHOLDERS:
+                    problems.append({"page": path, "line": line, "url": value,
+                                     "reason": f"placeholder in column {column!r}"})
+            slides = (row.get("slides_path") or "").strip()
+            if slides and slides.lower() not in PLACEHOLDERS \
+                    and not os.path.isfile(os.path.join(slides_dir, slides)):
+                problems.append({"page": path, "line": line, "url": slides, "reason": "file not found"})
+            video = (row.get("video_link") or "").strip()
+            if video and video.lower() not in PLACEHOLDERS:
+                error = url_syntax_error(video) if video.startswith(("http://", "https://")) \
+                    else "not an http(s) URL"
+                if error:
+                    problems.append({"page": path, "line": line, "url": video, "reason": error})
+    return problems
+
+def site_pages(root: str = SITE_ROOT) -> List[str]:
+    return sorted(os.path.join(root, name) for name in os.listdir(root) if name.endswith(".html"))
+
+def format_problem(problem: Dict) -> str:
+    return f"{os.path.relpath(problem['page'])}:{problem['line']}: {problem['url']} ({problem['reason']})"
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Check local links and assets of the site.")
+    parser.add_argument("pages", nargs="*", help="HTML pages (default: every *.html in the site root)")
+    parser.add_argument("--recordings", default=os.path.join(SITE_ROOT, "slides", "recordings.csv"),
+                        help="recordings CSV to check as well ('' to skip)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="checker threads")
+    args = parser.parse_args()
+
+    pages = args.pages or site_pages()
+    checker = LinkChecker(workers=args.workers)
+    problems = checker.check(pages)
+    if args.recordings and os.path.exists(args.recordings):
+        problems += check_recordings(args.recordings)
+
+    for problem in problems:
+        print(f"✗ {format_problem(problem)}")
+    print(f"{'✗' if problems else '✓'} {len(pages)} pages checked ({checker.parsed} re-parsed), "
+          f"{len(problems)} broken references")
+    sys.exit(1 if problems else 0)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Event Link Resolution for the Conference Schedule Generator
+Fills in slide and recording links for events from slides/recordings.csv
+(slides_path, video_link, presenter) instead of the hard-coded "TBA".
+
+The CSV is streamed once into a RecordingsIndex with four lookups:
+    slide       exact slide file name        (event "slides": "08_information_retrieval.pdf")
+    presenter   normalized presenter name    (event "presenter": "Richard Zanibbi")
+    title       normalized title from the slide file name
+    tokens      3-letter token prefixes -> rows, for fuzzy title matching
+
+Events are matched in that order. A fuzzy match needs at least
+FUZZY_THRESHOLD of the longer title's tokens, and FUZZY_MIN_TOKENS tokens,
+to match; a token matches another when either is a prefix of the other, so
+"doc" matches "document". An event title with a subtitle is also tried by
+its part before the colon, so "Learning on Graphs: GNNs in Document
+Analysis" matches 07_learning_on_graphs_and_specific_domains.pdf. Ties
+between different rows count as no match.
+"TODO" cells are treated as missing, and slide links are only used when the
+PDF exists locally.
+"""
+
+import csv
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional, Set, Tuple
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+RECORDINGS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "slides", "recordings.csv")
+PLACEHOLDERS = {"", "todo", "tba"}
+FUZZY_THRESHOLD = 0.5
+PREFIX_LENGTH = 3
+STOPWORDS = {"a", "an", "and", "the", "of", "on", "in", "for", "to", "with", "from", "by"}
+# A fuzzy match must share at least this many tokens (fewer only for one-word titles)
+FUZZY_MIN_TOKENS = 2
+
+# ============================================================================
+# NORMALIZATION
+# ============================================================================
+
+def normalize_text(text: str) -> str:
+    """Lower-case, accent-free, single-spaced words."""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return " ".join(re.findall(r'[a-z0-9]+', text.lower()))
+
+def normalize_presenter(name: str) -> str:
+    """Presenter name without affiliation, e.g. 'Dimosthenis Karatzas (CVC)'."""
+    return normalize_text(re.sub(r'\(.*?\)', '', name))
+
+def title_from_slides(filename: str) -> str:
+    """'07_learning_on_graphs.pdf' -> 'learning on graphs'."""
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    return normalize_text(re.sub(r'^\d+[_\-\s]*', '', stem).replace('_', ' '))
+
+def title_tokens(text: str) -> List[str]:
+    return [token for token in normalize_text(text).split()
+            if token not in STOPWORDS and not token.isdigit()]
+
+def _tokens_match(a: str, b: str) -> bool:
+    return a.startswith(b) or b.startswith(a)
+
+def _missing(value: Optional[str]) -> bool:
+    return value is None or value.strip().lower() in PLACEHOLDERS
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+class RecordingsIndex:
+    """Lookups over the rows of recordings.csv, built in one pass."""
+
+    def __init__(self, rows: List[Dict], slides_dir: str):
+        self.rows = rows
+        self.slides_dir = slides_dir
+        self.by_slide: Dict[str, int] = {}
+        self.by_presenter: Dict[str, List[int]] = {}
+        self.by_title: Dict[str, List[int]] = {}
+        self.by_prefix: Dict[str, Set[int]] = {}
+        self.row_tokens: List[List[str]] = []
+
+        for number, row in enumerate(rows):
+            slides = row.get('slides')
+            if slides:
+                self.by_slide[slides.lower()] = number
+                title = title_from_slides(slides)
+                self.by_title.setdefault(title, []).append(number)
+            if row.get('presenter'):
+                self.by_presenter.setdefault(normalize_presenter(row['presenter']), []).append(number)
+            tokens = title_tokens(title_from_slides(slides)) if slides else []
+            self.row_tokens.append(tokens)
+            for token in tokens:
+                self.by_prefix.setdefault(token[:PREFIX_LENGTH], set()).add(number)
+
+    @classmethod
+    def from_csv(cls, path: str = RECORDINGS_CSV) -> "RecordingsIndex":
+        """Stream recordings.csv once; placeholder cells become None."""
+        rows = []
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for line, record in enumerate(csv.DictReader(f), start=2):
+                rows.append({
+                    'line': line,
+                    'slides': None if _missing(record.get('slides_path')) else record['slides_path'].strip(),
+                    'video': None if _missing(record.get('video_link')) else record['video_link'].strip(),
+                    'presenter': None if _missing(record.get('presenter')) else record['presenter'].strip(),
+                })
+        return cls(rows, os.path.dirname(os.path.abspath(path)))
+
+    def fuzzy_scores(self, tokens: List[str]) -> Dict[int, float]:
+        """Token-overlap score per candidate row for title tokens."""
+        candidates: Set[int] = set()
+        for token in tokens:
+            prefix = token[:PREFIX_LENGTH]
+            if len(prefix) == PREFIX_LENGTH:
+                candidates |= self.by_prefix.get(prefix, set())
+
+        scores = {}
+        for number in candidates:
+            row_tokens = self.row_tokens[number]
+            matched = sum(1 for token in tokens if any(_tokens_match(token, other) for other in row_tokens))
+            if matched >= min(FUZZY_MIN_TOKENS, len(tokens)):
+                scores[number] = matched / max(len(tokens), len(row_tokens))
+        return scores
+
+    def fuzzy_title(self, title: str) -> Optional[int]:
+        """Best token-overlap match for a title, or None if weak or ambiguous.
+
+        The part before a colon is scored too, so a subtitle does not
+        dilute the match.
+        """
+        scores: Dict[int, float] = {}
+        variants = [title, title.split(':', 1)[0]] if ':' in title else [title]
+        for variant in variants:
+            for number, score in self.fuzzy_scores(title_tokens(variant)).items():
+                scores[number] = max(score, scores.get(number, 0.0))
+
+        best: Tuple[float, Optional[int]] = (0.0, None)
+        tied = False
+        for number, score in scores.items():
+            if score > best[0]:
+                best, tied = (score, number), False
+            elif score == best[0] and number != best[1]:
+                tied = True
+        if best[0] < FUZZY_THRESHOLD or tied:
+            return None
+        return best[1]
+
+    def match(self, event: Dict) -> Optional[int]:
+        """Row number for an event, trying slide, presenter, title, then fuzzy title."""
+        if event.get('slides'):
+            number = self.by_slide.get(os.path.basename(event['slides']).lower())
+            if number is not None:
+                return number
+        if event.get('presenter'):
+            numbers = self.by_presenter.get(normalize_presenter(event['presenter']), [])
+            if len(numbers) == 1:
+                return numbers[0]
+        numbers = self.by_title.get(normalize_text(event['title']), [])
+        if len(numbers) == 1:
+            return numbers[0]
+        return self.fuzzy_title(event['title'])
+
+    def slide_href(self, number: int, base: str = "slides/") -> Optional[str]:
+        """Relative link to a row's PDF, if it exists on disk."""
+        slides = self.rows[number]['slides']
+        if slides and os.path.isfile(os.path.join(self.slides_dir, slides)):
+            return base + slides
+        return None
+
+_INDEX_CACHE: Dict[str, Tuple[int, RecordingsIndex]] = {}
+
+def load_recordings_index(path: str = RECORDINGS_CSV) -> RecordingsIndex:
+    """RecordingsIndex for path, rebuilt only when the CSV's mtime changes."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _INDEX_CACHE.get(path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+    index = RecordingsIndex.from_csv(path)
+    _INDEX_CACHE[path] = (mtime_ns, index)
+    return index
+
+# ============================================================================
+# RESOLUTION
+# ============================================================================
+
+def _resolve_events(events: List[Dict], index: RecordingsIndex, used: Set[int],
+                    slides_base: str) -> List[Dict]:
+    resolved = []
+    for event in events:
+        number = index.match(event)
+        if number is None:
+            resolved.append(event)
+            continue
+        used.add(number)
+        event = dict(event)
+        href = index.slide_href(number, slides_base)
+        if href and _missing(event.get('link')):
+            event['link'] = href
+        if index.rows[number]['video'] and not event.get('video_link'):
+            event['video_link'] = index.rows[number]['video']
+        if index.rows[number]['presenter'] and not event.get('presenter'):
+            event['presenter'] = index.rows[number]['presenter']
+        resolved.append(event)
+    return resolved
+
+def resolve_links(metadata: Dict, index: RecordingsIndex,
+                  slides_base: str = "slides/") -> Tuple[Dict, Dict]:
+    """Return a copy of metadata with links filled in, plus a report.
+
+    The report lists CSV rows no event matched ('unmatched_rows') and rows
+    whose slide file is not on disk ('missing_slides').
+    """
+    used: Set[int] = set()
+    days = []
+    for day in metadata['days']:
+        day_copy = dict(day, events=_resolve_events(day.get('events', []), index, used, slides_base))
+        if 'tracks' in day:
+            day_copy['tracks'] = [dict(track, events=_resolve_events(track['events'], index, used, slides_base))
+                                  for track in day['tracks']]
+        days.append(day_copy)
+
+    report = {
+        'matched_rows': len(used),
+        'unmatched_rows': [row for number, row in enumerate(index.rows) if number not in used],
+        'missing_slides': [row for number, row in enumerate(index.rows)
+                           if row['slides'] and index.slide_href(number) is None],
+    }
+    return dict(metadata, days=days), report
+
+def describe_row(row: Dict) -> str:
+    return f"line {row['line']}: {row['slides'] or '(no slides)'} / {row['presenter'] or '(no presenter)'}"
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Venue Map Generation for the Conference Schedule Generator
+Builds the points-of-interest map from map_points.csv instead of the 1.2 MB
+Folium export in map.html: a thin HTML shell plus quantized GeoJSON and
+precomputed marker clusters that are only downloaded when needed.
+
+Usage:
+    python3 schedule_map.py [map_points.csv] [-d map]
+    python3 schedule_map.py --import-html map.html     # (re)create map_points.csv
+
+Outputs (in the map directory):
+    index.html              Leaflet shell, no inline data (~4 KB)
+    clusters/<zoom>.json    clusters for one zoom level, fetched on first visit
+    points/<x>-<y>.json     the points of one tile at POINT_TILE_ZOOM, fetched
+                            when that tile is in view at unclustered zooms
+    points/index.json       the tiles that hold points, so empty ones are
+                            never requested
+    points.geojson          every point, for other tools; the page never loads it
+
+Coordinates are rounded to COORD_PRECISION decimals (about 1 m). Cluster and
+point files hold {"c": [lat, lon, count, extra, ...], "i": [image, ...]},
+with coordinates in units of 10^-COORD_PRECISION degrees. For a single
+point (count 1), extra indexes its image name in "i", so a file carries
+everything needed to draw its markers; for a cluster, extra is the zoom at
+which it splits. Every JSON output also gets .gz (and .br) siblings for
+static servers that negotiate precompressed files.
+
+map.html is left untouched; point the iframe in index.html at map/index.html
+once the map directory is deployed.
+"""
+
+import csv
+import json
+import math
+import os
+from typing import Dict, List, Tuple
+
+import schedule_geneartor as generator
+from schedule_assets import write_compressed
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+SITE_ROOT = os.path.dirname(os.path.abspath(__file__))
+POINTS_CSV = os.path.join(SITE_ROOT, "map_points.csv")
+MAP_DIR = "map"
+
+MAP_TITLE = "SSDA - Points of Interest"
+MAP_CENTER = (42.3990981, 2.1522012)
+MAP_ZOOM = 13
+TILE_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+
+COORD_PRECISION = 5
+TILE_SIZE = 256
+CLUSTER_RADIUS = 120
+# At this zoom and above, points are drawn individually (as in map.html)
+DISABLE_CLUSTERING_AT = 16
+# Points are split into tiles of this zoom for the unclustered levels
+POINT_TILE_ZOOM = 14
+
+MAP_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{title}}</title>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css">
+    <style>
+        html, body, #map { height: 100%; margin: 0; }
+        .poi, .poi-cluster { border-radius: 50%; border: 2px solid white; box-shadow: 0 2px 6px rgba(0,0,0,0.3); }
+        .poi { overflow: hidden; background: white; }
+        .poi img { width: 100%; height: 100%; object-fit: cover; }
+        .poi-cluster { display: flex; align-items: center; justify-content: center;
+                       color: white; font: bold 12px sans-serif; }
+    </style>
+</head>
+<body>
+    <div id="map"></div>
+    <script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js" defer></script>
+    <script>
+    addEventListener("DOMContentLoaded", function () {
+        var config = {{config}};
+        var map = L.map("map", {center: config.center, zoom: config.zoom, attributionControl: false});
+        L.tileLayer(config.tiles, {maxZoom: 19}).addTo(map);
+        var layer = L.layerGroup().addTo(map), levels = {}, tiles = {}, occupied = null, generation = 0;
+        var scale = Math.pow(10, -config.precision);
+        function load(url) { return fetch(url).then(function (r) { return r.json(); }); }
+        function decode(data) {
+            var rows = [], c = data.c;
+            for (var i = 0; i < c.length; i += 4)
+                rows.push([c[i] * scale, c[i + 1] * scale, c[i + 2], c[i + 2] === 1 ? data.i[c[i + 3]] : c[i + 3]]);
+            return rows;
+        }
+        function level(z) { return levels[z] || (levels[z] = load("clusters/" + z + ".json").then(decode)); }
+        function tile(key) { return tiles[key] || (tiles[key] = load("points/" + key + ".json").then(decode)); }
+        function visibleTiles(bounds) {
+            occupied = occupied || load("points/index.json").then(function (data) {
+                var keys = {}; data.tiles.forEach(function (key) { keys[key] = true; }); return keys; });
+            var nw = map.project(bounds.getNorthWest(), config.tileZoom).divideBy(256).floor(),
+                se = map.project(bounds.getSouthEast(), config.tileZoom).divideBy(256).floor();
+            return occupied.then(function (keys) {
+                var wanted = [];
+                for (var x = nw.x; x <= se.x; x++)
+                    for (var y = nw.y; y <= se.y; y++)
+                        if (keys[x + "-" + y]) wanted.push(tile(x + "-" + y));
+                return Promise.all(wanted);
+            }).then(function (parts) { return [].concat.apply([], parts); });
+        }
+        function pointMarker(lat, lon, name) {
+            var image = config.imageBase + name;
+            return L.marker([lat, lon], {icon: L.divIcon({className: "", iconSize: [40, 40],
+                html: '<div class="poi" style="width:36px;height:36px"><img loading="lazy" src="' + image + '"></div>'})})
+                .bindTooltip('<img src="' + image + '" style="width:200px;max-height:150px">')
+                .on("click", function () { window.open(image, "_blank"); });
+        }
+        function clusterMarker(lat, lon, count, split) {
+            var color = count < 10 ? "#3498db" : (count < 100 ? "#e74c3c" : "#9b59b6");
+            return L.marker([lat, lon], {icon: L.divIcon({className: "", iconSize: [35, 35],
+                html: '<div class="poi-cluster" style="width:31px;height:31px;background:' + color + '">' + count + '</div>'})})
+                .on("click", function () { map.setView([lat, lon], split); });
+        }
+        function draw() {
+            var run = ++generation, z = map.getZoom(), bounds = map.getBounds().pad(0.2);
+            var ready = z >= config.unclusteredZoom ? visibleTiles(bounds) : level(z);
+            ready.then(function (rows) {
+                if (run !== generation) return;
+                layer.clearLayers();
+                rows.forEach(function (r) {
+                    if (!bounds.contains([r[0], r[1]])) return;
+                    layer.addLayer(r[2] === 1 ? pointMarker(r[0], r[1], r[3]) : clusterMarker(r[0], r[1], r[2], r[3]));
+                });
+            });
+        }
+        map.on("moveend", draw);
+        draw();
+    });
+    </script>
+</body>
+</html>
+'''
+
+COMPILED_MAP_TEMPLATE = generator.compile_template(MAP_TEMPLATE)
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+def import_folium_markers(html_path: str) -> List[Tuple[float, float, str]]:
+    """Extract (lat, lon, image) rows from a Folium FastMarkerCluster export."""
+    with open(html_path, "r", encoding="utf-8") as f:
+        text = f.read()
+    start = text.find("var data = ")
+    if start < 0:
+        raise ValueError(f"{html_path}: no marker data found (expected 'var data = [...]')")
+    data, _ = json.JSONDecoder().raw_decode(text, start + len("var data = "))
+    return [(float(row[0]), float(row[1]), str(row[2])) for row in data]
+
+def write_points_csv(rows: List[Tuple[float, float, str]], path: str = POINTS_CSV) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["lat", "lon", "image"])
+        writer.writerows(rows)
+
+def load_points(path: str = POINTS_CSV) -> List[Tuple[float, float, str]]:
+    """Read map_points.csv; raises ValueError naming the first bad line."""
+    points = []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                lat, lon = float(row["lat"]), float(row["lon"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"{path}:{line}: invalid coordinates") from None
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                raise ValueError(f"{path}:{line}: coordinates out of range")
+            points.append((lat, lon, (row.get("image") or "").strip()))
+    return points
+
+# ============================================================================
+# CLUSTERING
+# ============================================================================
+
+def project(lat: float, lon: float, zoom: int) -> Tuple[float, float]:
+    """Web Mercator pixel coordinates at a zoom level."""
+    scale = TILE_SIZE * 2 ** zoom
+    sin_lat = min(max(math.sin(math.radians(lat)), -0.9999), 0.9999)
+    return ((lon + 180) / 360 * scale,
+            (0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)) * scale)
+
+def cluster_level(items: List[Tuple], zoom: int, radius: int = CLUSTER_RADIUS) -> List[Tuple]:
+    """Greedily merge items (lat, lon, count, extra) closer than radius pixels.
+
+    Items are bucketed in a grid of radius-sized cells, so each item only
+    looks at its 3x3 neighbourhood. An item that absorbs nothing is kept as
+    is; a merged cluster sits at its members' weighted centroid and splits
+    at zoom + 1.
+    """
+    coords = [project(item[0], item[1], zoom) for item in items]
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    for index, (x, y) in enumerate(coords):
+        grid.setdefault((int(x // radius), int(y // radius)), []).append(index)
+
+    taken = bytearray(len(items))
+    limit = radius * radius
+    clusters = []
+    for index, (x, y) in enumerate(coords):
+        if taken[index]:
+            continue
+        taken[index] = 1
+        members = [index]
+        cell_x, cell_y = int(x // radius), int(y // radius)
+        for grid_x in (cell_x - 1, cell_x, cell_x + 1):
+            for grid_y in (cell_y - 1, cell_y, cell_y + 1):
+                for other in grid.get((grid_x, grid_y), ()):
+                    if not taken[other] and (coords[other][0] - x) ** 2 + (coords[other][1] - y) ** 2 <= limit:
+                        taken[other] = 1
+                        members.append(other)
+        if len(members) == 1:
+            clusters.append(items[index])
+            continue
+        count = sum(items[member][2] for member in members)
+        clusters.append((sum(items[member][0] * items[member][2] for member in members) / count,
+                         sum(items[member][1] * items[member][2] for member in members) / count,
+                         count, zoom + 1))
+    return clusters
+
+def build_clusters(points: List[Tuple[float, float, str]],
+                   max_zoom: int = DISABLE_CLUSTERING_AT - 1) -> Dict[int, List[Tuple]]:
+    """Clusters for every zoom from max_zoom down to 0, each built from the next."""
+    items = [(lat, lon, 1, index) for index, (lat, lon, _) in enumerate(points)]
+    levels = {}
+    for zoom in range(max_zoom, -1, -1):
+        items = cluster_level(items, zoom)
+        levels[zoom] = items
+    return levels
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def quantize(value: float) -> int:
+    return round(value * 10 ** COORD_PRECISION)
+
+def image_base(points: List[Tuple[float, float, str]]) -> str:
+    """Longest common URL directory of the images, stored once instead of per point."""
+    images = [image for _, _, image in points if image]
+    prefix = os.path.commonprefix(images) if images else ""
+    return prefix[:prefix.rfind("/") + 1]
+
+def tile_key(lat: float, lon: float, zoom: int = POINT_TILE_ZOOM) -> str:
+    """'x-y' of the map tile holding a point at zoom."""
+    x, y = project(lat, lon, zoom)
+    return f"{int(x // TILE_SIZE)}-{int(y // TILE_SIZE)}"
+
+def pack_rows(items: List[Tuple], points: List[Tuple[float, float, str]], base: str) -> Dict:
+    """{"c": flat rows, "i": images} for items (lat, lon, count, extra); see the module docstring."""
+    flat: List[int] = []
+    images: List[str] = []
+    for lat, lon, count, extra in items:
+        if count == 1:
+            images.append(points[extra][2][len(base):])
+            extra = len(images) - 1
+        flat += (quantize(lat), quantize(lon), count, extra)
+    return {"c": flat, "i": images}
+
+def _write_json(path: str, data) -> Dict[str, int]:
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(payload)
+    return dict(write_compressed(path, payload), raw=len(payload))
+
+def build_map(points: List[Tuple[float, float, str]], out_dir: str = MAP_DIR,
+              title: str = MAP_TITLE, center: Tuple[float, float] = MAP_CENTER,
+              zoom: int = MAP_ZOOM) -> Dict[str, Dict[str, int]]:
+    """Write the shell, GeoJSON and cluster files; return their sizes by path."""
+    clusters_dir = os.path.join(out_dir, "clusters")
+    points_dir = os.path.join(out_dir, "points")
+    os.makedirs(clusters_dir, exist_ok=True)
+    os.makedirs(points_dir, exist_ok=True)
+    base = image_base(points)
+    sizes = {}
+
+    geojson = {
+        "type": "FeatureCollection",
+        "features": [{"type": "Feature",
+                      "geometry": {"type": "Point",
+                                   "coordinates": [round(lon, COORD_PRECISION), round(lat, COORD_PRECISION)]},
+                      "properties": {"image": image[len(base):]}}
+                     for lat, lon, image in points],
+    }
+    sizes["points.geojson"] = _write_json(os.path.join(out_dir, "points.geojson"), geojson)
+
+    for level, items in build_clusters(points).items():
+        sizes[f"clusters/{level}.json"] = _write_json(os.path.join(clusters_dir, f"{level}.json"),
+                                                      dict(pack_rows(items, points, base), z=level))
+
+    tiles: Dict[str, List[Tuple]] = {}
+    for index, (lat, lon, _) in enumerate(points):
+        tiles.setdefault(tile_key(lat, lon), []).append((lat, lon, 1, index))
+    for key, items in sorted(tiles.items()):
+        sizes[f"points/{key}.json"] = _write_json(os.path.join(points_dir, f"{key}.json"),
+                                                  pack_rows(items, points, base))
+    sizes["points/index.json"] = _write_json(os.path.join(points_dir, "index.json"),
+                                             {"z": POINT_TILE_ZOOM, "tiles": sorted(tiles)})
+
+    config = {"center": list(center), "zoom": zoom, "tiles": TILE_URL, "imageBase": base,
+              "precision": COORD_PRECISION, "unclusteredZoom": DISABLE_CLUSTERING_AT,
+              "tileZoom": POINT_TILE_ZOOM}
+    page = generator.render_template(COMPILED_MAP_TEMPLATE, {
+        "title": title,
+        "config": json.dumps(config, ensure_ascii=False).replace("</", "<\\/"),
+    })
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(page)
+    sizes["index.html"] = {"raw": len(page.encode("utf-8"))}
+    return sizes
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the venue map from a points data file.")
+    parser.add_argument("points", nargs="?", default=POINTS_CSV, help="points CSV (lat, lon, image)")
+    parser.add_argument("-d", "--out-dir", default=MAP_DIR, help="directory for the map")
+    parser.add_argument("--title", default=MAP_TITLE)
+    parser.add_argument("--import-html", metavar="MAP_HTML",
+                        help="extract the markers of a Folium export into the points CSV and exit")
+    args = parser.parse_args()
+
+    if args.import_html:
+        try:
+            rows = import_folium_markers(args.import_html)
+            write_points_csv(rows, args.points)
+        except (OSError, ValueError) as exc:
+            parser.exit(1, f"✗ {exc}\n")
+        parser.exit(0, f"✓ {len(rows)} points from {args.import_html} written to {args.points}\n")
+
+    try:
+        points = load_points(args.points)
+        sizes = build_map(points, args.out_dir, args.title)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    levels = [size for name, size in sizes.items() if name.startswith("clusters/")]
+    tiles = [size for name, size in sizes.items() if name.startswith("points/") and name != "points/index.json"]
+    print(f"✓ {args.out_dir}/index.html ({sizes['index.html']['raw']} bytes)")
+    print(f"✓ {args.out_dir}/points.geojson: {len(points)} points, "
+          f"{sizes['points.geojson']['raw']} bytes ({sizes['points.geojson']['gzip']} gzipped)")
+    print(f"✓ {args.out_dir}/clusters/: {len(levels)} zoom levels, "
+          f"largest {max(size['gzip'] for size in levels)} bytes gzipped")
+    print(f"✓ {args.out_dir}/points/: {len(tiles)} tiles, "
+          f"largest {max(size['gzip'] for size in tiles)} bytes gzipped")
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Automatic Schedule Packer for the Conference Schedule Generator
+Assigns a day, room and start time to every session under room capacity,
+speaker availability, fixed anchors (lunch, coffee) and day bounds, and
+writes the result in the tracks format the generator renders.
+
+Usage:
+    python3 schedule_packer.py sessions.json [-o packed.json] [--seconds 2] [--seed 0]
+    python3 schedule_geneartor.py packed.json
+    python3 schedule_packer.py --synthetic 2000     # timing run on generated sessions
+
+Input (JSON, or YAML when PyYAML is installed):
+    {
+      "conference_title": "...", "conference_dates": "...",
+      "days": [{"day_name": "Monday", "date": "25th", "start_time": "09:30", "end_time": "19:00"}],
+      "rooms": [{"name": "Aula Magna", "capacity": 200}, {"name": "Lab 1", "capacity": 30}],
+      "anchors": [{"title": "Lunch", "start_time": "13:30", "duration_minutes": 60,
+                   "color": "lunch", "days": ["Monday"]}],
+      "speakers": {"Richard Zanibbi": [{"day": "Tuesday", "from": "09:30", "to": "13:00"}]},
+      "sessions": [{"title": "Information Retrieval", "duration_minutes": 90, "color": "session1",
+                    "presenter": "Richard Zanibbi", "attendance": 60}]
+    }
+
+Day bounds default to SCHEDULE_START_HOUR/SCHEDULE_END_HOUR. Anchors apply
+to every day unless they list "days", and block all rooms. Speakers listed
+under "speakers" are only available in their windows; everyone else is
+always available. A session may pin "day", "room" and "start_time".
+Sessions need a room whose capacity covers their "attendance".
+
+Time is cut into SLOT_MINUTES slots and every room and speaker keeps one
+integer bitmask of busy slots per day, so checking a placement is a handful
+of big-integer operations. Sessions are placed greedily, most constrained
+first, at the position that ends earliest (ties go to the smallest room
+that fits). Local search then repeatedly lifts each session out and
+re-inserts it wherever it ends earlier, and tries to fit sessions left over
+by ejecting one blocking session and re-placing both, until nothing improves
+or the time budget runs out.
+"""
+
+import json
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+import schedule_geneartor as generator
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+SLOT_MINUTES = 5
+DEFAULT_SECONDS = 2.0
+# Blocking sessions tried per left-over session in one ejection round
+EJECTION_CANDIDATES = 24
+# Session keys that only steer the packer and are not copied into events
+PACKER_KEYS = ('attendance', 'day')
+
+# ============================================================================
+# BITMASK HELPERS
+# ============================================================================
+
+def run_starts(mask: int, length: int) -> int:
+    """Bits i of mask such that bits i..i+length-1 are all set."""
+    result, covered = mask, 1
+    while covered < length:
+        step = min(covered, length - covered)
+        result &= result >> step
+        covered += step
+    return result
+
+def block(start: int, length: int) -> int:
+    return ((1 << length) - 1) << start
+
+def _slots(minutes: int, round_up: bool) -> int:
+    return -(-minutes // SLOT_MINUTES) if round_up else minutes // SLOT_MINUTES
+
+# ============================================================================
+# SPECIFICATION
+# ============================================================================
+
+def _time(value, where: str) -> int:
+    try:
+        return generator.time_to_minutes(value)
+    except (AttributeError, ValueError):
+        raise ValueError(f"{where}: expected HH:MM, got {value!r}") from None
+
+def _duration(item: Dict, where: str) -> int:
+    duration = item.get('duration_minutes')
+    if isinstance(duration, bool) or not isinstance(duration, int) or duration <= 0:
+        raise ValueError(f"{where}.duration_minutes: required positive integer")
+    return duration
+
+def _event_fields(item: Dict, where: str) -> None:
+    """Check the fields the renderer requires of every event (see validate_schedule)."""
+    if not isinstance(item.get('title'), str) or not item['title']:
+        raise ValueError(f"{where}.title: required non-empty string")
+    if not isinstance(item.get('color'), str):
+        raise ValueError(f"{where}.color: required string")
+
+def session_speakers(session: Dict) -> List[str]:
+    if session.get('speakers'):
+        return list(session['speakers'])
+    return [session['presenter']] if session.get('presenter') else []
+
+class Packer:
+    """Bitmask model of a program: days x rooms x slots, speakers and sessions."""
+
+    def __init__(self, spec: Dict):
+        self.spec = spec
+        self.days = spec.get('days') or []
+        self.rooms = spec.get('rooms') or []
+        self.sessions = spec.get('sessions') or []
+        if not self.days or not self.rooms:
+            raise ValueError("need at least one day and one room")
+        default_start = generator.minutes_to_time(generator.SCHEDULE_START_MINUTES)
+        default_end = generator.minutes_to_time(generator.SCHEDULE_END_MINUTES)
+
+        day_index = {}
+        self.day_start: List[int] = []
+        self.full: List[int] = []
+        for d, day in enumerate(self.days):
+            if not isinstance(day.get('day_name'), str):
+                raise ValueError(f"days[{d}].day_name: required string")
+            day_index[day['day_name']] = d
+            start = _time(day.get('start_time', default_start), f"days[{d}].start_time")
+            end = _time(day.get('end_time', default_end), f"days[{d}].end_time")
+            if end <= start:
+                raise ValueError(f"days[{d}]: end_time must be after start_time")
+            self.day_start.append(start)
+            self.full.append((1 << _slots(end - start, False)) - 1)
+        for r, room in enumerate(self.rooms):
+            if not isinstance(room.get('name'), str):
+                raise ValueError(f"rooms[{r}].name: required string")
+        room_index = {room['name']: r for r, room in enumerate(self.rooms)}
+        self.capacity = [room.get('capacity', 0) for room in self.rooms]
+
+        # Anchors block every room
+        self.anchors: List[List[Dict]] = [[] for _ in self.days]
+        blocked = [0] * len(self.days)
+        for a, anchor in enumerate(spec.get('anchors', ())):
+            where = f"anchors[{a}]"
+            _event_fields(anchor, where)
+            start = _time(anchor.get('start_time'), f"{where}.start_time")
+            duration = _duration(anchor, where)
+            for name in anchor.get('days') or [day['day_name'] for day in self.days]:
+                if name not in day_index:
+                    raise ValueError(f"{where}.days: unknown day {name!r}")
+                d = day_index[name]
+                first = _slots(start - self.day_start[d], False)
+                last = _slots(start + duration - self.day_start[d], True)
+                if first < 0:
+                    raise ValueError(f"{where}: starts before {name}'s start_time")
+                blocked[d] |= block(first, last - first)
+                self.anchors[d].append(anchor)
+        self.room_free = [[self.full[d] & ~blocked[d] for _ in self.rooms] for d in range(len(self.days))]
+
+        # Speaker availability: listed speakers only within their windows
+        self.available: Dict[str, List[int]] = {}
+        for name, windows in (spec.get('speakers') or {}).items():
+            masks = [0] * len(self.days)
+            for w, window in enumerate(windows):
+                where = f"speakers[{name!r}][{w}]"
+                if window.get('day') not in day_index:
+                    raise ValueError(f"{where}.day: unknown day {window.get('day')!r}")
+                d = day_index[window['day']]
+                first = max(0, _slots(_time(window.get('from'), f"{where}.from") - self.day_start[d], True))
+                last = _slots(_time(window.get('to'), f"{where}.to") - self.day_start[d], False)
+                if last > first:
+                    masks[d] |= block(first, last - first) & self.full[d]
+            self.available[name] = masks
+        self.busy: Dict[Tuple[str, int], int] = {}
+
+        # Per-session constraints
+        self.length: List[int] = []
+        self.speakers: List[List[str]] = []
+        self.candidate_rooms: List[List[int]] = []
+        self.pinned: List[Tuple[Optional[int], Optional[int], Optional[int]]] = []
+        for s, session in enumerate(self.sessions):
+            where = f"sessions[{s}]"
+            _event_fields(session, where)
+            self.length.append(_slots(_duration(session, where), True))
+            self.speakers.append(session_speakers(session))
+            attendance = session.get('attendance', 0)
+            rooms = sorted((r for r in range(len(self.rooms)) if self.capacity[r] >= attendance),
+                           key=lambda r: (self.capacity[r], r))
+            pin_day = pin_room = pin_start = None
+            if session.get('day') is not None:
+                if session['day'] not in day_index:
+                    raise ValueError(f"{where}.day: unknown day {session['day']!r}")
+                pin_day = day_index[session['day']]
+            if session.get('room') is not None:
+                if session['room'] not in room_index:
+                    raise ValueError(f"{where}.room: unknown room {session['room']!r}")
+                pin_room = room_index[session['room']]
+                rooms = [pin_room] if pin_room in rooms else []
+            if session.get('start_time') is not None:
+                if pin_day is None:
+                    raise ValueError(f"{where}.start_time: pinning a time needs a 'day'")
+                offset = _time(session['start_time'], f"{where}.start_time") - self.day_start[pin_day]
+                if offset < 0 or offset % SLOT_MINUTES:
+                    raise ValueError(f"{where}.start_time: must fall on a {SLOT_MINUTES}-minute "
+                                     f"slot within the day")
+                pin_start = offset // SLOT_MINUTES
+            self.candidate_rooms.append(rooms)
+            self.pinned.append((pin_day, pin_room, pin_start))
+
+        self.placement: List[Optional[Tuple[int, int, int]]] = [None] * len(self.sessions)
+
+    # ========================================================================
+    # PLACEMENT
+    # ========================================================================
+
+    def speaker_free(self, s: int, d: int) -> int:
+        """Slots of day d where every speaker of session s is available and idle."""
+        free = self.full[d]
+        for name in self.speakers[s]:
+            if name in self.available:
+                free &= self.available[name][d]
+            free &= ~self.busy.get((name, d), 0)
+        return free
+
+    def ever_available(self, s: int) -> bool:
+        """Whether s's speakers share a long enough window on an allowed day at all."""
+        pin_day = self.pinned[s][0]
+        for d in (range(len(self.days)) if pin_day is None else (pin_day,)):
+            free = self.full[d]
+            for name in self.speakers[s]:
+                if name in self.available:
+                    free &= self.available[name][d]
+            if run_starts(free, self.length[s]):
+                return True
+        return False
+
+    def cost(self, s: int, d: int, r: int, start: int) -> Tuple[int, int, int]:
+        """Earlier end first, then the tighter room, then the earlier day."""
+        return (start + self.length[s], self.capacity[r], d)
+
+    def best_position(self, s: int) -> Optional[Tuple[Tuple, int, int, int]]:
+        """(cost, day, room, start slot) of the best free position for s, or None."""
+        pin_day, _, pin_start = self.pinned[s]
+        length = self.length[s]
+        best = None
+        for d in (range(len(self.days)) if pin_day is None else (pin_day,)):
+            free = self.speaker_free(s, d)
+            if not free:
+                continue
+            for r in self.candidate_rooms[s]:
+                starts = run_starts(free & self.room_free[d][r], length)
+                if pin_start is not None:
+                    starts &= 1 << pin_start
+                if not starts:
+                    continue
+                start = (starts & -starts).bit_length() - 1
+                cost = self.cost(s, d, r, start)
+                if best is None or cost < best[0]:
+                    best = (cost, d, r, start)
+        return best
+
+    def place(self, s: int, d: int, r: int, start: int) -> None:
+        slots = block(start, self.length[s])
+        self.room_free[d][r] &= ~slots
+        for name in self.speakers[s]:
+            self.busy[(name, d)] = self.busy.get((name, d), 0) | slots
+        self.placement[s] = (d, r, start)
+
+    def remove(self, s: int) -> Tuple[int, int, int]:
+        d, r, start = self.placement[s]
+        slots = block(start, self.length[s])
+        self.room_free[d][r] |= slots
+        for name in self.speakers[s]:
+            self.busy[(name, d)] &= ~slots
+        self.placement[s] = None
+        return d, r, start
+
+    def _try_place(self, s: int) -> bool:
+        best = self.best_position(s)
+        if best is None:
+            return False
+        self.place(s, *best[1:])
+        return True
+
+    def greedy(self) -> None:
+        """Place sessions most-constrained first."""
+        def difficulty(s: int):
+            pinned = sum(value is not None for value in self.pinned[s])
+            return (-pinned, len(self.candidate_rooms[s]),
+                    -self.length[s] * (1 + len(self.speakers[s])), s)
+        for s in sorted(range(len(self.sessions)), key=difficulty):
+            self._try_place(s)
+
+    # ========================================================================
+    # LOCAL SEARCH
+    # ========================================================================
+
+    def relocate_pass(self, deadline: float) -> int:
+        """Move every session to its best position if that ends earlier."""
+        moved = 0
+        order = sorted((s for s, where in enumerate(self.placement) if where is not None),
+                       key=lambda s: -(self.placement[s][2] + self.length[s]))
+        for s in order:
+            if time.perf_counter() > deadline:
+                break
+            old = self.remove(s)
+            best = self.best_position(s)
+            if best is not None and best[0] < self.cost(s, *old):
+                self.place(s, *best[1:])
+                moved += 1
+            else:
+                self.place(s, *old)
+        return moved
+
+    def ejection_pass(self, rng: random.Random, deadline: float) -> int:
+        """Fit left-over sessions by moving one session that blocks them."""
+        fitted = 0
+        for u in [s for s, where in enumerate(self.placement) if where is None]:
+            if self._try_place(u):
+                fitted += 1
+                continue
+            if not self.candidate_rooms[u] or not self.ever_available(u):
+                continue
+            rooms = set(self.candidate_rooms[u])
+            blockers = [s for s, where in enumerate(self.placement)
+                        if where is not None and where[1] in rooms]
+            for v in rng.sample(blockers, min(EJECTION_CANDIDATES, len(blockers))):
+                if time.perf_counter() > deadline:
+                    return fitted
+                old = self.remove(v)
+                if self._try_place(u):
+                    if self._try_place(v):
+                        fitted += 1
+                        break
+                    self.remove(u)
+                self.place(v, *old)
+        return fitted
+
+    def improve(self, seconds: float, seed: int = 0) -> Dict[str, int]:
+        deadline = time.perf_counter() + seconds
+        rng = random.Random(seed)
+        stats = {'passes': 0, 'moved': 0, 'fitted': 0}
+        while time.perf_counter() < deadline:
+            moved = self.relocate_pass(deadline)
+            fitted = self.ejection_pass(rng, deadline)
+            stats['passes'] += 1
+            stats['moved'] += moved
+            stats['fitted'] += fitted
+            if not moved and not fitted:
+                break
+        return stats
+
+    def objective(self) -> int:
+        """Sum of session end offsets in minutes (lower packs tighter)."""
+        return sum((where[2] + self.length[s]) * SLOT_MINUTES
+                   for s, where in enumerate(self.placement) if where is not None)
+
+    # ========================================================================
+    # OUTPUT
+    # ========================================================================
+
+    def unplaced_reason(self, s: int) -> str:
+        if not self.candidate_rooms[s]:
+            return f"no room holds {self.sessions[s].get('attendance', 0)} attendees"
+        if self.ever_available(s):
+            return "no free slot for its rooms and speakers"
+        return "its speakers are never available together for that long"
+
+    def to_metadata(self) -> Dict:
+        """The packed program in the generator's tracks format."""
+        days = []
+        for d, day in enumerate(self.days):
+            start = generator.minutes_to_time(self.day_start[d])
+            anchors = sorted(self.anchors[d], key=lambda anchor: generator.time_to_minutes(anchor['start_time']))
+            events = [dict({key: value for key, value in anchor.items() if key != 'days'},
+                           link=anchor.get('link', 'TBA')) for anchor in anchors]
+            by_room: List[List[Tuple[int, int]]] = [[] for _ in self.rooms]
+            for s, where in enumerate(self.placement):
+                if where is not None and where[0] == d:
+                    by_room[where[1]].append((where[2], s))
+            tracks = []
+            for r, placed in enumerate(by_room):
+                if not placed:
+                    continue
+                track_events = []
+                for slot, s in sorted(placed):
+                    event = {key: value for key, value in self.sessions[s].items() if key not in PACKER_KEYS}
+                    event['start_time'] = generator.minutes_to_time(self.day_start[d] + slot * SLOT_MINUTES)
+                    event['room'] = self.rooms[r]['name']
+                    event.setdefault('link', 'TBA')
+                    track_events.append(event)
+                tracks.append({'name': self.rooms[r]['name'], 'room': self.rooms[r]['name'],
+                               'start_time': start, 'events': track_events})
+            days.append({'day_name': day['day_name'], 'date': day.get('date', ''),
+                         'start_time': start, 'events': events, 'tracks': tracks})
+        return {
+            'conference_title': self.spec.get('conference_title', 'Conference Schedule'),
+            'conference_dates': self.spec.get('conference_dates', ''),
+            'days': days,
+        }
+
+def pack_program(spec: Dict, seconds: float = DEFAULT_SECONDS, seed: int = 0) -> Tuple[Dict, Dict]:
+    """Pack spec; return (metadata, report)."""
+    started = time.perf_counter()
+    packer = Packer(spec)
+    packer.greedy()
+    greedy_seconds = time.perf_counter() - started
+    greedy_objective = packer.objective()
+    search = packer.improve(seconds, seed)
+    unplaced = [{'title': packer.sessions[s]['title'], 'reason': packer.unplaced_reason(s)}
+                for s, where in enumerate(packer.placement) if where is None]
+    report = {
+        'sessions': len(packer.sessions),
+        'placed': len(packer.sessions) - len(unplaced),
+        'unplaced': unplaced,
+        'greedy_seconds': round(greedy_seconds, 3),
+        'total_seconds': round(time.perf_counter() - started, 3),
+        'greedy_objective': greedy_objective,
+        'objective': packer.objective(),
+        'search': search,
+    }
+    return packer.to_metadata(), report
+
+# ============================================================================
+# SYNTHETIC INPUT
+# ============================================================================
+
+def synthetic_spec(sessions: int, days: int = 5, rooms: int = 48, speakers: int = 800,
+                   seed: int = 0) -> Dict:
+    """A large random program for timing the packer."""
+    rng = random.Random(seed)
+    names = [f"Speaker {index + 1}" for index in range(speakers)]
+    day_names = [f"Day {index + 1}" for index in range(days)]
+    return {
+        'conference_title': "Synthetic Conference",
+        'conference_dates': "",
+        'days': [{'day_name': name, 'date': str(index + 1), 'start_time': "09:00", 'end_time': "20:00"}
+                 for index, name in enumerate(day_names)],
+        'rooms': [{'name': f"Room {index + 1}", 'capacity': rng.choice((30, 60, 120, 250))}
+                  for index in range(rooms)],
+        'anchors': [
+            {'title': "Coffee", 'start_time': "11:00", 'duration_minutes': 30, 'color': "coffee"},
+            {'title': "Lunch", 'start_time': "13:30", 'duration_minutes': 60, 'color': "lunch"},
+            {'title': "Coffee", 'start_time': "17:00", 'duration_minutes': 30, 'color': "coffee"},
+        ],
+        'speakers': {name: [{'day': rng.choice(day_names), 'from': "09:00", 'to': "20:00"}
+                            for _ in range(2)]
+                     for name in rng.sample(names, speakers // 4)},
+        'sessions': [{'title': f"Session {index + 1}",
+                      'duration_minutes': rng.choice((20, 30, 45, 60, 90)),
+                      'color': rng.choice(list(generator.COLOR_CLASSES)),
+                      'speakers': rng.sample(names, rng.choice((1, 1, 2))),
+                      'attendance': rng.choice((20, 25, 50, 100, 200))}
+                     for index in range(sessions)],
+    }
+
+def load_spec(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(f"{path}: reading YAML needs PyYAML (pip install pyyaml)") from None
+            return yaml.safe_load(f)
+        return json.load(f)
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Assign days, rooms and times to sessions.")
+    parser.add_argument("spec", nargs="?", help="sessions file (JSON or YAML)")
+    parser.add_argument("-o", "--output", default="packed.json", help="packed schedule (JSON)")
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS, help="local search time budget")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--synthetic", type=int, metavar="N", help="pack N generated sessions instead")
+    args = parser.parse_args()
+    if not args.spec and not args.synthetic:
+        parser.error("give a sessions file or --synthetic N")
+
+    try:
+        spec = synthetic_spec(args.synthetic, seed=args.seed) if args.synthetic else load_spec(args.spec)
+        metadata, report = pack_program(spec, args.seconds, args.seed)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    print(f"✓ {report['placed']}/{report['sessions']} sessions placed in {report['total_seconds']} s "
+          f"(greedy {report['greedy_seconds']} s, {report['search']['passes']} search passes)")
+    print(f"  Objective {report['greedy_objective']} → {report['objective']} "
+          f"({report['search']['moved']} moves, {report['search']['fitted']} left-overs fitted)")
+    for item in report['unplaced']:
+        print(f"⚠ Unplaced: {item['title']!r} ({item['reason']})")
+    print(f"✓ Written: {args.output} (render with: python3 schedule_geneartor.py {args.output})")
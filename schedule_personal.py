@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Personalized Schedules for the Conference Schedule Generator
+Writes one schedule page per attendee with the sessions they signed up for
+highlighted (or, in filter mode, only those sessions shown).
+
+Usage:
+    python3 schedule_personal.py signups.json [schedule.json] [-d personal/] [--filter]
+
+Signups map attendees to event ids (see layout_event_ids, e.g.
+"tuesday-foundation-models"), either as JSON:
+
+    {"ana@example.org": ["tuesday-foundation-models", "wednesday-hiking"], ...}
+
+or as a CSV with attendee,event_id columns.
+
+Every event div is rendered once in a plain and a selected variant, and each
+day column is pre-joined once for attendees with nothing on that day. A page
+is then composed from those fragments using a selection bitmap, so the work
+grows with events plus attendees rather than with their product.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+import schedule_geneartor as generator
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+HIGHLIGHT_CSS = '''<style>
+.event.selected {
+  box-shadow: 0 0 0 2px #114e71, var(--shadow-md);
+  font-weight: var(--font-weight-bold);
+}
+
+.personal .event:not(.selected) {
+  opacity: 0.45;
+}
+    </style>'''
+
+PERSONAL_TEMPLATE = generator.compile_template(
+    generator.HTML_TEMPLATE.replace('<body>', '<body class="personal">', 1))
+
+# ============================================================================
+# SIGNUPS
+# ============================================================================
+
+def load_signups(path: str) -> Dict[str, List[str]]:
+    """Read attendee -> event ids from a JSON object or an attendee,event_id CSV."""
+    if path.lower().endswith('.csv'):
+        signups: Dict[str, List[str]] = {}
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                signups.setdefault(row['attendee'].strip(), []).append(row['event_id'].strip())
+        return signups
+    with open(path, "r", encoding="utf-8") as f:
+        signups = json.load(f)
+    if not isinstance(signups, dict):
+        raise ValueError(f"{path}: expected an object mapping attendees to event ids")
+    return signups
+
+def attendee_filename(attendee: str, disambiguate: bool = False) -> str:
+    """Filesystem-safe page name for an attendee.
+
+    With disambiguate (or when nothing of the name survives), a short hash
+    of the raw name is appended, so "a b" and "a_b" get different pages.
+    """
+    stem = re.sub(r'[^A-Za-z0-9._@-]+', '_', attendee).strip('._')
+    if disambiguate or not stem:
+        digest = hashlib.sha256(attendee.encode("utf-8")).hexdigest()[:8]
+        stem = f"{stem}-{digest}" if stem else digest
+    return stem + ".html"
+
+def attendee_filenames(attendees: Iterable[str]) -> Dict[str, str]:
+    """Page name per attendee; names that would collide (ignoring case) get a hash suffix."""
+    attendees = list(attendees)
+    counts: Dict[str, int] = {}
+    for attendee in attendees:
+        name = attendee_filename(attendee).lower()
+        counts[name] = counts.get(name, 0) + 1
+    return {attendee: attendee_filename(attendee, counts[attendee_filename(attendee).lower()] > 1)
+            for attendee in attendees}
+
+# ============================================================================
+# RENDERER
+# ============================================================================
+
+class PersonalRenderer:
+    """Pre-renders every fragment once and composes per-attendee pages from them."""
+
+    def __init__(self, metadata: Optional[Dict] = None, filter_mode: bool = False,
+                 stylesheet_href: Optional[str] = None):
+        metadata = metadata if metadata is not None else generator.SCHEDULE_METADATA
+        self.metadata = metadata
+        self.filter_mode = filter_mode
+        days = metadata['days']
+
+        layout = generator.compute_geometry(generator.compile_layout(days))
+        self.layout = layout
+        self.offsets = layout['day_offsets']
+        self.row_of_id = {event_id: row for row, event_id
+                          in enumerate(generator.layout_event_ids(layout, days))}
+
+        self.plain = generator.render_layout_event_divs(layout, 0, len(layout['events']))
+        self.selected = [div.replace('<div class="event ', '<div class="event selected ', 1)
+                         for div in self.plain]
+        self.bitmap = bytearray(len(self.plain))
+
+        # Columns for attendees with no sessions on that day
+        self.idle_columns = [
+            generator.render_day_column(day, '' if filter_mode else generator.EVENT_SEPARATOR.join(
+                self.plain[self.offsets[index]:self.offsets[index + 1]]))
+            for index, day in enumerate(days)
+        ]
+
+        self.fields = generator.page_fields(metadata, stylesheet_href)
+        self.fields['stylesheet'] += '\n    ' + HIGHLIGHT_CSS
+        self.fields['time_labels'] = generator.generate_time_labels()
+
+    def selection_rows(self, event_ids: Iterable[str], unknown: Optional[set] = None) -> List[int]:
+        """Map event ids to layout rows, collecting ids that do not exist."""
+        rows = []
+        for event_id in event_ids:
+            row = self.row_of_id.get(event_id)
+            if row is None:
+                if unknown is not None:
+                    unknown.add(event_id)
+            else:
+                rows.append(row)
+        return rows
+
+    def _day_column(self, index: int) -> str:
+        lo, hi = self.offsets[index], self.offsets[index + 1]
+        bitmap = self.bitmap
+        if self.filter_mode:
+            divs = [self.selected[row] for row in range(lo, hi) if bitmap[row]]
+        else:
+            divs = [self.selected[row] if bitmap[row] else self.plain[row] for row in range(lo, hi)]
+        return generator.render_day_column(self.metadata['days'][index],
+                                           generator.EVENT_SEPARATOR.join(divs))
+
+    def iter_page(self, rows: List[int]):
+        """Yield the chunks of one attendee's page for the selected layout rows."""
+        day_id = self.layout['day_id']
+        for row in rows:
+            self.bitmap[row] = 1
+        touched = {day_id[row] for row in rows}
+        columns = (self._day_column(index) if index in touched else column
+                   for index, column in enumerate(self.idle_columns))
+        values = dict(self.fields, day_columns=generator.iter_joined(columns, generator.DAY_COLUMN_SEPARATOR))
+        try:
+            yield from generator.iter_template(PERSONAL_TEMPLATE, values)
+        finally:
+            # Clear only the bits this attendee set
+            for row in rows:
+                self.bitmap[row] = 0
+
+    def write_pages(self, signups: Dict[str, List[str]], out_dir: str) -> Dict:
+        """Write one page per attendee into out_dir; return a summary."""
+        os.makedirs(out_dir, exist_ok=True)
+        unknown: set = set()
+        filenames = attendee_filenames(signups)
+        written = 0
+        for attendee, event_ids in signups.items():
+            rows = self.selection_rows(event_ids, unknown)
+            path = os.path.join(out_dir, filenames[attendee])
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(self.iter_page(rows))
+            written += 1
+        disambiguated = {attendee: name for attendee, name in filenames.items()
+                         if name != attendee_filename(attendee)}
+        return {'pages': written, 'unknown_event_ids': sorted(unknown), 'disambiguated': disambiguated}
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write one schedule page per attendee.")
+    parser.add_argument("signups", help="JSON or CSV file mapping attendees to event ids")
+    parser.add_argument("source", nargs="?", help="schedule file (default: SCHEDULE_METADATA)")
+    parser.add_argument("-d", "--out-dir", default="personal", help="directory for the pages")
+    parser.add_argument("--filter", action="store_true",
+                        help="show only selected sessions instead of highlighting them")
+    args = parser.parse_args()
+
+    try:
+        signups = load_signups(args.signups)
+        metadata = None
+        if args.source:
+            from schedule_sources import load_schedule
+            metadata = load_schedule(args.source)
+    except (OSError, ValueError, KeyError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    stylesheet = generator.write_stylesheet(args.out_dir)
+    summary = PersonalRenderer(metadata, args.filter, stylesheet).write_pages(signups, args.out_dir)
+    print(f"✓ {summary['pages']} personal schedules written to {args.out_dir}/")
+    for event_id in summary['unknown_event_ids']:
+        print(f"⚠ Unknown event id: {event_id}")
+    for attendee, filename in sorted(summary['disambiguated'].items()):
+        print(f"⚠ Page name shared with another attendee, hash added: {attendee!r} → {filename}")
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Atomic Publishing for the Conference Schedule Generator
+Writes generated outputs through temp files on a thread pool, fsyncs them
+and renames them into place together, then records a manifest of content
+hashes and a diff against the previous build for targeted cache purges.
+
+Usage:
+    python3 schedule_publish.py [schedule.json|schedule.yaml|schedule.csv] [-d .] [--classes] [-j WORKERS]
+
+Outputs (in the publish directory):
+    publish-manifest.json   hash and size per output, hash per day fragment
+    publish-diff.json       outputs and fragments added/changed/removed since
+                            the previous manifest; purge exactly these
+
+Day fragments are named <output>#<day slug>, e.g. schedule.html#monday-25th,
+and hash the rendered day column, so editing one day marks one fragment
+changed even though the whole page's hash changes too.
+
+Readers never see a half-written file: every output is staged as a temp
+file next to its target and only renamed once all of them are written and
+fsynced. Pages (.html) are renamed last, so a new page never references a
+stylesheet that is not there yet. Outputs whose bytes did not change are
+left untouched, keeping their modification times. Other files are never
+deleted, except .gz/.br siblings from an earlier build of an output that
+is now published without them.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union
+
+import schedule_geneartor as generator
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+MANIFEST_FILENAME = "publish-manifest.json"
+DIFF_FILENAME = "publish-diff.json"
+PUBLISH_VERSION = 1
+PAGE_EXTENSIONS = ('.html', '.htm')
+STALE_SIBLING_SUFFIXES = ('.gz', '.br')
+
+# bytes, text, or a callable that streams text into a file-like object
+Content = Union[bytes, str, Callable]
+
+# ============================================================================
+# ATOMIC WRITES
+# ============================================================================
+
+class _HashingWriter:
+    """Text stream that encodes into a binary file while hashing the bytes."""
+
+    def __init__(self, f):
+        self.f = f
+        self.digest = hashlib.sha256()
+        self.bytes = 0
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8")
+        self.digest.update(data)
+        self.f.write(data)
+        self.bytes += len(data)
+        return len(text)
+
+def _temp_path(path: str) -> str:
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+def _discard(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def fsync_directory(directory: str) -> None:
+    """Persist renames in directory (a no-op where directories cannot be opened)."""
+    try:
+        fd = os.open(directory or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def file_hash(path: str) -> Optional[str]:
+    """sha256 of a file, or None when it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+def stage(path: str, content: Content) -> Dict:
+    """Write content to a fsynced temp file next to path; return its entry.
+
+    The entry holds the temp path (None when path already has these exact
+    bytes), the content hash and the size. Nothing is visible at path
+    until the temp file is renamed.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp = _temp_path(path)
+    try:
+        with open(temp, "wb") as f:
+            writer = _HashingWriter(f)
+            if callable(content):
+                content(writer)
+            elif isinstance(content, str):
+                writer.write(content)
+            else:
+                writer.digest.update(content)
+                f.write(content)
+                writer.bytes = len(content)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        _discard(temp)
+        raise
+    digest = writer.digest.hexdigest()
+    if file_hash(path) == digest:
+        _discard(temp)
+        temp = None
+    return {'temp': temp, 'hash': digest, 'bytes': writer.bytes}
+
+def atomic_write(path: str, content: Content) -> Dict:
+    """Write one file atomically (see stage); return its hash and size."""
+    entry = stage(path, content)
+    if entry['temp']:
+        os.replace(entry['temp'], path)
+        fsync_directory(os.path.dirname(path))
+    return {'hash': entry['hash'], 'bytes': entry['bytes']}
+
+# ============================================================================
+# PUBLISHER
+# ============================================================================
+
+class Publisher:
+    """Stage outputs concurrently, then rename them into place together.
+
+    Use as a context manager: outputs added inside the block are written on
+    a thread pool, and leaving the block waits for all of them and commits
+    them, or removes every temp file if anything failed.
+    """
+
+    def __init__(self, root: str = ".", workers: Optional[int] = None):
+        self.root = root
+        self.workers = workers
+        self.manifest: Optional[Dict] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._jobs: Dict[str, object] = {}
+        self._fragments: Dict[str, Union[Dict[str, str], Callable]] = {}
+
+    def __enter__(self) -> "Publisher":
+        self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._pool.shutdown(wait=True)
+        entries = {}
+        failure = exc
+        for path, job in self._jobs.items():
+            try:
+                entries.update(job.result())
+            except Exception as error:  # keep collecting so every temp file is cleaned up
+                failure = failure or error
+        if failure is not None:
+            for entry in entries.values():
+                if entry['temp']:
+                    _discard(entry['temp'])
+            if exc is None:
+                raise failure
+            return
+        self.manifest = self.commit(entries)
+
+    def add(self, path: str, content: Content, compress: bool = False,
+            fragments: Optional[Dict[str, str]] = None) -> None:
+        """Queue one output, relative to root.
+
+        content is bytes, text or a callable streaming text into a writer.
+        With compress, .gz/.br siblings are published alongside it.
+        fragments maps fragment names to hashes, or is a callable returning
+        that map once content is written (see FragmentRecorder).
+        """
+        self._jobs[path] = self._pool.submit(self._produce, path, content, compress)
+        if fragments:
+            self._fragments[path] = fragments
+
+    def _produce(self, path: str, content: Content, compress: bool) -> Dict[str, Dict]:
+        target = os.path.join(self.root, path)
+        entries = {path: stage(target, content)}
+        if not compress:
+            return entries
+        import schedule_assets
+        try:
+            with open(entries[path]['temp'] or target, "rb") as f:
+                data = f.read()
+            for encoding, compressed in schedule_assets.compress_variants(data).items():
+                suffix = schedule_assets.ENCODING_SUFFIXES[encoding]
+                entries[path + suffix] = stage(target + suffix, compressed)
+        except BaseException:
+            for entry in entries.values():
+                if entry['temp']:
+                    _discard(entry['temp'])
+            raise
+        return entries
+
+    def commit(self, entries: Dict[str, Dict]) -> Dict:
+        """Rename staged outputs into place and write the manifest and diff."""
+        # Assets first and pages last, so no page references a missing asset
+        order = sorted(entries, key=lambda path: (path.lower().endswith(PAGE_EXTENSIONS), path))
+        directories = set()
+        for path in order:
+            if entries[path]['temp']:
+                target = os.path.join(self.root, path)
+                os.replace(entries[path]['temp'], target)
+                directories.add(os.path.dirname(target))
+        previous = load_manifest(self.root)
+        for path in previous.get('outputs', {}):
+            base, suffix = os.path.splitext(path)
+            if path not in entries and suffix in STALE_SIBLING_SUFFIXES and base in entries:
+                # A precompressed copy of a page that changed would be served instead of it
+                target = os.path.join(self.root, path)
+                _discard(target)
+                directories.add(os.path.dirname(target))
+        for directory in directories:
+            fsync_directory(directory)
+
+        outputs = {path: {'hash': entry['hash'], 'bytes': entry['bytes']}
+                   for path, entry in sorted(entries.items())}
+        fragments = {}
+        for path, names in self._fragments.items():
+            for name, digest in (names() if callable(names) else names).items():
+                fragments[f"{path}#{name}"] = digest
+        manifest = {'version': PUBLISH_VERSION, 'outputs': outputs, 'fragments': dict(sorted(fragments.items()))}
+        diff = {
+            'outputs': diff_hashes({path: info['hash'] for path, info in previous.get('outputs', {}).items()},
+                                   {path: info['hash'] for path, info in outputs.items()}),
+            'fragments': diff_hashes(previous.get('fragments', {}), manifest['fragments']),
+        }
+        manifest['written'] = sorted(path for path, entry in entries.items() if entry['temp'])
+        atomic_write(os.path.join(self.root, DIFF_FILENAME), _dump(diff))
+        atomic_write(os.path.join(self.root, MANIFEST_FILENAME), _dump(manifest))
+        return dict(manifest, diff=diff)
+
+# ============================================================================
+# MANIFEST AND DIFF
+# ============================================================================
+
+def _dump(data) -> str:
+    return json.dumps(data, indent=1, ensure_ascii=False, sort_keys=True) + "\n"
+
+def load_manifest(root: str) -> Dict:
+    try:
+        with open(os.path.join(root, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if manifest.get('version') == PUBLISH_VERSION else {}
+
+def diff_hashes(before: Dict[str, str], after: Dict[str, str]) -> Dict[str, List[str]]:
+    """Names added, changed and removed between two name -> hash maps."""
+    return {
+        'added': sorted(set(after) - set(before)),
+        'changed': sorted(name for name in set(after) & set(before) if after[name] != before[name]),
+        'removed': sorted(set(before) - set(after)),
+    }
+
+class FragmentRecorder:
+    """Fragment cache wrapper that hashes each day column a page write uses.
+
+    Pass it as the cache of write_full_html (or iter_day_columns): cached
+    and freshly rendered columns both pass through get/put, so the page is
+    rendered once and fragments() afterwards returns what it contains.
+    cache is the real fragment cache, or None to render without one.
+    """
+
+    def __init__(self, metadata: Dict, cache=None, classes: bool = False):
+        self.metadata = metadata
+        self.cache = cache
+        self.classes = classes
+        self.hashes: Dict[str, str] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        column = self.cache.get(key) if self.cache is not None else None
+        if column is not None:
+            self.hashes[key] = hashlib.sha256(column.encode("utf-8")).hexdigest()
+        return column
+
+    def put(self, key: str, column: str) -> None:
+        self.hashes[key] = hashlib.sha256(column.encode("utf-8")).hexdigest()
+        if self.cache is not None:
+            self.cache.put(key, column)
+
+    def fragments(self) -> Dict[str, str]:
+        """Hash of every day column written so far, keyed by day slug.
+
+        Repeated day names get -2, -3... suffixes.
+        """
+        fragments = {}
+        seen: Dict[str, int] = {}
+        salt = generator.fragment_key_salt(self.classes)
+        for day in self.metadata['days']:
+            digest = self.hashes.get(generator.day_fragment_key(day, salt))
+            if digest is None:
+                continue
+            base = generator.slugify(f"{day['day_name']} {day.get('date', '')}") or "day"
+            seen[base] = seen.get(base, 0) + 1
+            fragments[base if seen[base] == 1 else f"{base}-{seen[base]}"] = digest
+        return fragments
+
+def page_fragments(metadata: Dict, cache=None, classes: bool = False) -> Dict[str, str]:
+    """Hash of every rendered day column, keyed by day slug (see FragmentRecorder).
+
+    This renders the columns; to publish a page, record them while it is
+    written instead so they are not rendered twice.
+    """
+    recorder = FragmentRecorder(metadata, cache, classes)
+    for _ in generator.iter_day_columns(metadata['days'], recorder, classes):
+        pass
+    return recorder.fragments()
+
+def format_diff(diff: Dict[str, List[str]]) -> str:
+    """One-line human summary of a diff_hashes result."""
+    return ", ".join(f"{len(diff[key])} {key}" for key in ('added', 'changed', 'removed'))
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Publish schedule.html atomically with a hash manifest.")
+    parser.add_argument("source", nargs="?", help="schedule file (default: SCHEDULE_METADATA)")
+    parser.add_argument("-d", "--out-dir", default=".", help="publish directory")
+    parser.add_argument("--classes", action="store_true", help="render event geometry as CSS classes")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="writer threads")
+    args = parser.parse_args()
+
+    try:
+        metadata = generator.SCHEDULE_METADATA
+        if args.source:
+            from schedule_sources import load_schedule
+            metadata = load_schedule(args.source)
+        from schedule_cache import FragmentCache
+        recorder = FragmentRecorder(metadata, FragmentCache(generator.FRAGMENT_CACHE_DIR), args.classes)
+        css = generator.render_stylesheet()
+        stylesheet = generator.stylesheet_filename(css)
+        with Publisher(args.out_dir, args.workers) as publisher:
+            publisher.add(stylesheet, css)
+            publisher.add("schedule.html", lambda stream: generator.write_full_html(
+                stream, recorder, metadata, stylesheet, args.classes), fragments=recorder.fragments)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    manifest = publisher.manifest
+    for path, info in manifest['outputs'].items():
+        state = "written" if path in manifest['written'] else "unchanged"
+        print(f"✓ {path} ({info['bytes']} bytes, {state})")
+    print(f"  Outputs: {format_diff(manifest['diff']['outputs'])}")
+    print(f"  Day fragments: {format_diff(manifest['diff']['fragments'])}")
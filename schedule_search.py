@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Static Search Index for the Conference Schedule Generator
+Builds an inverted index over session titles, presenters and slide text, and
+writes it as small static JSON shards that the browser fetches on demand.
+
+Usage:
+    python3 schedule_search.py [schedule.json] [-d search] [-j WORKERS]
+
+Outputs (in the search directory):
+    index.json          format version, shard prefix length, shard list and
+                        the stopwords and term length limit of the indexer
+    docs.json           one [kind, title, url, context] row per document
+    terms/<ab>.json     postings of every term starting with "ab":
+                        {"term": [doc, score, doc, score, ...]}, best first
+    search.js           client: SSDASearch.query("graph neu").then(...)
+
+Documents are the program's sessions (title, presenter, day and time) and
+every page of every PDF below slides/, linked as slides/<file>#page=N.
+Presenters come from the events and from slides/recordings.csv. Title terms
+score TITLE_WEIGHT, presenter terms PRESENTER_WEIGHT and slide text 1 per
+occurrence. A query matches the documents containing all of its words; the
+last word also matches as a prefix, so results update while typing. Query
+words the indexer drops (stopwords, over-long words) are ignored, except
+that a lone last word is still tried as a prefix ("an" -> "analysis").
+
+Slide text is extracted with pypdf (pip install pypdf) on a process pool and
+cached in .schedule_cache/search/ by file hash, so only new or changed PDFs
+are parsed. Without pypdf the index covers sessions and slide titles only.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import schedule_geneartor as generator
+from schedule_links import RECORDINGS_CSV, load_recordings_index, normalize_text, resolve_links
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+SITE_ROOT = os.path.dirname(os.path.abspath(__file__))
+SLIDES_DIR = os.path.join(SITE_ROOT, "slides")
+SEARCH_DIR = "search"
+TEXT_CACHE_DIR = os.path.join(".schedule_cache", "search")
+# Bump whenever the index layout changes, so clients and caches notice
+INDEX_VERSION = 2
+
+PREFIX_LENGTH = 2
+TITLE_WEIGHT = 8
+PRESENTER_WEIGHT = 4
+MAX_TERM_LENGTH = 32
+SEARCH_STOPWORDS = {"a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+                    "it", "of", "on", "or", "that", "the", "this", "to", "we", "with"}
+
+SEARCH_SCRIPT = '''var SSDASearch = (function () {
+  var base = (document.currentScript && document.currentScript.src || "").replace(/[^\\/]*$/, "");
+  var cache = {};
+  function get(name) {
+    if (!cache[name]) cache[name] = fetch(base + name).then(function (r) { return r.ok ? r.json() : {}; });
+    return cache[name];
+  }
+  function words(text) {
+    return text.normalize("NFKD").replace(/[\\u0300-\\u036f]/g, "").toLowerCase().match(/[a-z0-9]+/g) || [];
+  }
+  function query(text) {
+    return get("index.json").then(function (index) {
+      var terms = words(text).filter(function (w) {
+        return w.length >= index.prefix && w.length <= index.maxLength;
+      });
+      // Stopwords have no postings; keep one only as the prefix of a word still being typed
+      var kept = terms.filter(function (w) { return index.stopwords.indexOf(w) < 0; });
+      terms = kept.length ? kept : terms.slice(-1);
+      if (!terms.length) return [];
+      return Promise.all(terms.map(function (term, i) {
+        var prefix = term.slice(0, index.prefix);
+        if (index.shards.indexOf(prefix) < 0) return {};
+        return get("terms/" + prefix + ".json").then(function (shard) {
+          var scores = {};
+          Object.keys(shard).forEach(function (t) {
+            if (t !== term && (i < terms.length - 1 || t.indexOf(term) !== 0)) return;
+            for (var p = shard[t], j = 0; j < p.length; j += 2) scores[p[j]] = Math.max(scores[p[j]] || 0, p[j + 1]);
+          });
+          return scores;
+        });
+      })).then(function (maps) {
+        return Promise.all([get("docs.json"), maps]);
+      });
+    }).then(function (result) {
+      if (!result.length) return [];
+      var docs = result[0], maps = result[1], hits = [];
+      Object.keys(maps[0]).forEach(function (doc) {
+        var score = 0;
+        for (var i = 0; i < maps.length; i++) { if (!(doc in maps[i])) return; score += maps[i][doc]; }
+        var d = docs[doc];
+        hits.push({kind: d[0], title: d[1], url: d[2], context: d[3], score: score});
+      });
+      return hits.sort(function (a, b) { return b.score - a.score; });
+    });
+  }
+  return {query: query};
+})();
+'''
+
+# ============================================================================
+# TEXT EXTRACTION
+# ============================================================================
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def pdf_pages(path: str) -> List[str]:
+    """Text of every page of a PDF (runs in a worker process)."""
+    import logging
+    from pypdf import PdfReader
+    # pypdf logs a warning per font it cannot fully decode; the text is still usable
+    logging.getLogger("pypdf").setLevel(logging.ERROR)
+    return [page.extract_text() or "" for page in PdfReader(path).pages]
+
+def find_pdfs(slides_dir: str = SLIDES_DIR) -> List[str]:
+    found = []
+    for current, _, names in os.walk(slides_dir):
+        found += [os.path.join(current, name) for name in names if name.lower().endswith(".pdf")]
+    return sorted(found)
+
+def extract_slides(paths: List[str], cache_dir: str = TEXT_CACHE_DIR,
+                   workers: Optional[int] = None) -> Tuple[Dict[str, List[str]], int]:
+    """Page texts per PDF path, plus how many PDFs had to be parsed.
+
+    Raises ImportError when a PDF is not cached and pypdf is missing.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    texts: Dict[str, List[str]] = {}
+    stale: Dict[str, str] = {}
+    for path in paths:
+        cache_path = os.path.join(cache_dir, f"{file_hash(path)}.json")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                texts[path] = json.load(f)
+        except (OSError, ValueError):
+            stale[path] = cache_path
+    if stale:
+        import pypdf  # noqa: F401  (fail here, not inside every worker)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for (path, cache_path), pages in zip(stale.items(), pool.map(pdf_pages, stale)):
+                texts[path] = pages
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(pages, f, ensure_ascii=False)
+                os.replace(tmp_path, cache_path)
+    return texts, len(stale)
+
+# ============================================================================
+# INDEXING
+# ============================================================================
+
+def terms(text: str) -> List[str]:
+    return [term for term in normalize_text(text).split()
+            if len(term) >= PREFIX_LENGTH and len(term) <= MAX_TERM_LENGTH and term not in SEARCH_STOPWORDS]
+
+def slide_title(path: str) -> str:
+    """'slides/08_information_retrieval.pdf' -> 'Information Retrieval'."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    words = re.sub(r'^\d+[_\-\s]*', '', stem).replace('_', ' ').replace('-', ' ').split()
+    return " ".join(word[:1].upper() + word[1:] for word in words)
+
+class SearchIndex:
+    """Documents plus term -> {doc: score} postings."""
+
+    def __init__(self):
+        self.docs: List[List[str]] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+
+    def add(self, kind: str, title: str, url: str, context: str,
+            fields: List[Tuple[str, int]]) -> int:
+        doc = len(self.docs)
+        self.docs.append([kind, title, url, context])
+        for text, weight in fields:
+            for term in terms(text):
+                scores = self.postings.setdefault(term, {})
+                scores[doc] = scores.get(doc, 0) + weight
+        return doc
+
+    def shards(self) -> Dict[str, Dict[str, List[int]]]:
+        """Postings grouped by term prefix, as flat [doc, score, ...] lists."""
+        shards: Dict[str, Dict[str, List[int]]] = {}
+        for term in sorted(self.postings):
+            ranked = sorted(self.postings[term].items(), key=lambda item: (-item[1], item[0]))
+            shards.setdefault(term[:PREFIX_LENGTH], {})[term] = [value for pair in ranked for value in pair]
+        return shards
+
+def index_sessions(index: SearchIndex, metadata: Dict) -> None:
+    days = metadata['days']
+    layout = generator.compile_layout(days)
+    for row, event in enumerate(layout['events']):
+        day = days[layout['day_id'][row]]
+        presenter = event.get('presenter') or ", ".join(event.get('speakers', ()))
+        link = event.get('link', '')
+        url = link if link and link not in ("TBA.html", "TBA") else "schedule.html"
+        context = f"{day['day_name']} {day['date']}, {generator.minutes_to_time(layout['start'][row])}"
+        if presenter:
+            context += f" · {presenter}"
+        index.add("session", event['title'], url, context,
+                  [(event['title'], TITLE_WEIGHT), (presenter, PRESENTER_WEIGHT)])
+
+def index_slides(index: SearchIndex, texts: Dict[str, List[str]], presenters: Dict[str, str],
+                 site_root: str = SITE_ROOT) -> None:
+    for path in sorted(texts):
+        url = os.path.relpath(path, site_root).replace(os.sep, "/")
+        title = slide_title(path)
+        presenter = presenters.get(os.path.basename(path).lower(), "")
+        for number, text in enumerate(texts[path] or [""], start=1):
+            context = f"Slides, page {number}" + (f" · {presenter}" if presenter else "")
+            fields = [(text, 1)]
+            if number == 1:
+                fields += [(title, TITLE_WEIGHT), (presenter, PRESENTER_WEIGHT)]
+            index.add("slides", title, f"{url}#page={number}", context, fields)
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def _write_json(path: str, data) -> int:
+    text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return len(text.encode("utf-8"))
+
+def build_search(metadata: Optional[Dict] = None, out_dir: str = SEARCH_DIR,
+                 slides_dir: str = SLIDES_DIR, recordings: Optional[str] = RECORDINGS_CSV,
+                 workers: Optional[int] = None) -> Dict:
+    """Build and write the index; return a summary of what was written."""
+    metadata = metadata if metadata is not None else generator.SCHEDULE_METADATA
+    presenters: Dict[str, str] = {}
+    if recordings and os.path.exists(recordings):
+        recordings_index = load_recordings_index(recordings)
+        metadata, _ = resolve_links(metadata, recordings_index)
+        presenters = {row['slides'].lower(): row['presenter'] for row in recordings_index.rows
+                      if row['slides'] and row['presenter']}
+
+    pdfs = find_pdfs(slides_dir)
+    warning = None
+    try:
+        texts, parsed = extract_slides(pdfs, workers=workers)
+    except ImportError:
+        texts, parsed = {path: [] for path in pdfs}, 0
+        warning = "pypdf is not installed; slide text is not indexed (pip install pypdf)"
+
+    index = SearchIndex()
+    index_sessions(index, metadata)
+    index_slides(index, texts, presenters, os.path.dirname(os.path.abspath(slides_dir)))
+
+    terms_dir = os.path.join(out_dir, "terms")
+    os.makedirs(terms_dir, exist_ok=True)
+    shards = index.shards()
+    sizes = [_write_json(os.path.join(terms_dir, f"{prefix}.json"), shard) for prefix, shard in shards.items()]
+    for name in os.listdir(terms_dir):
+        if name.endswith(".json") and name[:-len(".json")] not in shards:
+            os.remove(os.path.join(terms_dir, name))
+    docs_bytes = _write_json(os.path.join(out_dir, "docs.json"), index.docs)
+    _write_json(os.path.join(out_dir, "index.json"),
+                {"version": INDEX_VERSION, "prefix": PREFIX_LENGTH, "shards": sorted(shards),
+                 "maxLength": MAX_TERM_LENGTH, "stopwords": sorted(SEARCH_STOPWORDS)})
+    with open(os.path.join(out_dir, "search.js"), "w", encoding="utf-8") as f:
+        f.write(SEARCH_SCRIPT)
+
+    return {"docs": len(index.docs), "terms": len(index.postings), "shards": len(shards),
+            "largest_shard": max(sizes, default=0), "docs_bytes": docs_bytes,
+            "pdfs": len(pdfs), "parsed": parsed, "warning": warning}
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the static client-side search index.")
+    parser.add_argument("source", nargs="?", help="schedule file (default: SCHEDULE_METADATA)")
+    parser.add_argument("-d", "--out-dir", default=SEARCH_DIR, help="directory for the index")
+    parser.add_argument("--recordings", default=RECORDINGS_CSV, help="recordings CSV ('' to skip)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="PDF extraction processes")
+    args = parser.parse_args()
+
+    try:
+        metadata = None
+        if args.source:
+            from schedule_sources import load_schedule
+            metadata = load_schedule(args.source)
+        summary = build_search(metadata, args.out_dir, recordings=args.recordings, workers=args.workers)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    if summary["warning"]:
+        print(f"⚠ {summary['warning']}")
+    print(f"✓ {args.out_dir}/: {summary['docs']} documents, {summary['terms']} terms in "
+          f"{summary['shards']} shards (largest {summary['largest_shard']} bytes, "
+          f"docs.json {summary['docs_bytes']} bytes)")
+    print(f"  {summary['pdfs']} PDFs, {summary['parsed']} re-extracted")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+External Schedule Sources for the Conference Schedule Generator
+Loads SCHEDULE_METADATA-shaped data from JSON, YAML or CSV files, validates it,
+and keeps a compiled pickle snapshot next to the fragment cache so repeated
+builds skip parsing and validation while the source is unchanged.
+
+JSON/YAML files hold the same structure as SCHEDULE_METADATA. CSV files hold
+one event per row, grouped into days (and tracks) in file order:
+
+    day_name,date,start_time,title,duration_minutes,color,link,track,room,presenter
+    Monday,25th,09:30,Visita CVC,90,monday,TBA,,,
+    Monday,25th,,Transport to Vall de Núria,60,transport,TBA,,,
+
+Optional CSV columns: conference_title, conference_dates (read from the
+first row that sets them), event_start (explicit start time), track, room,
+presenter, font_weight, font_size.
+
+Snapshots are reused when the source's mtime and size match; if only the
+mtime changed, the content hash decides.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import pickle
+from typing import Dict, List
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+SNAPSHOT_DIR = os.path.join(".schedule_cache", "sources")
+# Bump whenever parsing or validation changes, so old snapshots are rebuilt
+SNAPSHOT_VERSION = 1
+
+DEFAULT_CONFERENCE_TITLE = "Conference Schedule"
+DEFAULT_LINK = "TBA"
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+
+def _is_time(value) -> bool:
+    if not isinstance(value, str) or value.count(':') != 1:
+        return False
+    hours, minutes = value.split(':')
+    return hours.isdigit() and minutes.isdigit() and int(minutes) < 60
+
+def _validate_events(events, where: str, errors: List[str]) -> None:
+    if not isinstance(events, list):
+        errors.append(f"{where}.events: expected a list")
+        return
+    for index, event in enumerate(events):
+        at = f"{where}.events[{index}]"
+        if not isinstance(event, dict):
+            errors.append(f"{at}: expected an object")
+            continue
+        if not isinstance(event.get('title'), str) or not event['title']:
+            errors.append(f"{at}.title: required non-empty string")
+        duration = event.get('duration_minutes')
+        if isinstance(duration, bool) or not isinstance(duration, int) or duration <= 0:
+            errors.append(f"{at}.duration_minutes: required positive integer")
+        if not isinstance(event.get('color'), str):
+            errors.append(f"{at}.color: required string")
+        for key in ('link', 'room', 'presenter', 'font_weight', 'font_size'):
+            if key in event and not isinstance(event[key], str):
+                errors.append(f"{at}.{key}: expected a string")
+        if 'start_time' in event and not _is_time(event['start_time']):
+            errors.append(f"{at}.start_time: expected HH:MM")
+        for key in ('speakers', 'attendees'):
+            if key in event and not (isinstance(event[key], list)
+                                     and all(isinstance(name, str) for name in event[key])):
+                errors.append(f"{at}.{key}: expected a list of strings")
+
+def validate_schedule(metadata) -> List[str]:
+    """Check metadata against the SCHEDULE_METADATA schema; return error messages."""
+    errors: List[str] = []
+    if not isinstance(metadata, dict):
+        return ["schedule: expected an object"]
+    for key in ('conference_title', 'conference_dates'):
+        if not isinstance(metadata.get(key), str):
+            errors.append(f"{key}: required string")
+    days = metadata.get('days')
+    if not isinstance(days, list):
+        return errors + ["days: required list"]
+
+    for index, day in enumerate(days):
+        where = f"days[{index}]"
+        if not isinstance(day, dict):
+            errors.append(f"{where}: expected an object")
+            continue
+        for key in ('day_name', 'date'):
+            if not isinstance(day.get(key), str):
+                errors.append(f"{where}.{key}: required string")
+        if 'start_time' in day and not _is_time(day['start_time']):
+            errors.append(f"{where}.start_time: expected HH:MM")
+        if 'events' not in day and 'tracks' not in day:
+            errors.append(f"{where}: needs 'events' or 'tracks'")
+        if 'events' in day:
+            _validate_events(day['events'], where, errors)
+        tracks = day.get('tracks', [])
+        if not isinstance(tracks, list):
+            errors.append(f"{where}.tracks: expected a list")
+            continue
+        for track_index, track in enumerate(tracks):
+            at = f"{where}.tracks[{track_index}]"
+            if not isinstance(track, dict):
+                errors.append(f"{at}: expected an object")
+                continue
+            for key in ('name', 'room'):
+                if key in track and not isinstance(track[key], str):
+                    errors.append(f"{at}.{key}: expected a string")
+            if 'start_time' in track and not _is_time(track['start_time']):
+                errors.append(f"{at}.start_time: expected HH:MM")
+            _validate_events(track.get('events'), at, errors)
+    return errors
+
+def normalize_schedule(metadata: Dict) -> Dict:
+    """Fill in optional fields the renderer relies on (in place)."""
+    for day in metadata['days']:
+        event_lists = [day.get('events', [])] + [track['events'] for track in day.get('tracks', [])]
+        for events in event_lists:
+            for event in events:
+                event.setdefault('link', DEFAULT_LINK)
+    return metadata
+
+# ============================================================================
+# PARSERS
+# ============================================================================
+
+def parse_json(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def parse_yaml(path: str) -> Dict:
+    try:
+        import yaml
+    except ImportError:
+        raise ValueError(f"{path}: YAML schedules need PyYAML (pip install pyyaml)") from None
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            return yaml.safe_load(f)
+        except yaml.YAMLError as exc:
+            mark = getattr(exc, 'problem_mark', None)
+            where = f"{path}:{mark.line + 1}:{mark.column + 1}" if mark else path
+            problem = getattr(exc, 'problem', None) or str(exc)
+            raise ValueError(f"{where}: invalid YAML: {problem}") from None
+
+def parse_csv(path: str) -> Dict:
+    """Group one-event-per-row CSV data into days and tracks, in file order."""
+    metadata = {"conference_title": None, "conference_dates": None, "days": []}
+    days: Dict[tuple, Dict] = {}
+    tracks: Dict[tuple, Dict] = {}
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            row = {key: (value or '').strip() for key, value in row.items() if key}
+            for key in ('conference_title', 'conference_dates'):
+                if row.get(key) and metadata[key] is None:
+                    metadata[key] = row[key]
+
+            day_key = (row.get('day_name', ''), row.get('date', ''))
+            day = days.get(day_key)
+            if day is None:
+                day = days[day_key] = {"day_name": day_key[0], "date": day_key[1], "events": []}
+                metadata['days'].append(day)
+            if row.get('start_time') and 'start_time' not in day:
+                day['start_time'] = row['start_time']
+
+            events = day['events']
+            if row.get('track'):
+                track = tracks.get(day_key + (row['track'],))
+                if track is None:
+                    track = tracks[day_key + (row['track'],)] = {"name": row['track'], "events": []}
+                    day.setdefault('tracks', []).append(track)
+                events = track['events']
+
+            try:
+                duration = int(row.get('duration_minutes', ''))
+            except ValueError:
+                raise ValueError(f"{path}:{line}: duration_minutes must be an integer") from None
+            event = {
+                "title": row.get('title', ''),
+                "duration_minutes": duration,
+                "color": row.get('color', ''),
+                "link": row.get('link') or DEFAULT_LINK,
+            }
+            if row.get('event_start'):
+                event['start_time'] = row['event_start']
+            for key in ('room', 'presenter', 'font_weight', 'font_size'):
+                if row.get(key):
+                    event[key] = row[key]
+            events.append(event)
+
+    metadata['conference_title'] = metadata['conference_title'] or DEFAULT_CONFERENCE_TITLE
+    metadata['conference_dates'] = metadata['conference_dates'] or ""
+    return metadata
+
+PARSERS = {
+    '.json': parse_json,
+    '.yaml': parse_yaml,
+    '.yml': parse_yaml,
+    '.csv': parse_csv,
+}
+
+# ============================================================================
+# LOADING WITH COMPILED SNAPSHOTS
+# ============================================================================
+
+def _snapshot_path(path: str, snapshot_dir: str) -> str:
+    name = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()[:32]
+    return os.path.join(snapshot_dir, name + ".pickle")
+
+def _read_snapshot(snapshot_path: str):
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+def _write_snapshot(snapshot_path: str, snapshot: Dict) -> None:
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, snapshot_path)
+
+def parse_schedule(path: str) -> Dict:
+    """Parse and validate a schedule source, without any snapshot caching."""
+    parser = PARSERS.get(os.path.splitext(path)[1].lower())
+    if parser is None:
+        raise ValueError(f"{path}: unsupported schedule format (use {', '.join(sorted(PARSERS))})")
+    metadata = parser(path)
+    errors = validate_schedule(metadata)
+    if errors:
+        raise ValueError(f"{path}: invalid schedule:\n  " + "\n  ".join(errors))
+    return normalize_schedule(metadata)
+
+def load_schedule(path: str, snapshot_dir: str = SNAPSHOT_DIR) -> Dict:
+    """Load a schedule source, reusing its compiled snapshot when unchanged.
+
+    Raises ValueError for unsupported formats or data that fails validation.
+    Pass snapshot_dir=None to always parse.
+    """
+    if snapshot_dir is None:
+        return parse_schedule(path)
+
+    stat = os.stat(path)
+    snapshot_path = _snapshot_path(path, snapshot_dir)
+    snapshot = _read_snapshot(snapshot_path)
+    if snapshot and (snapshot['mtime_ns'], snapshot['size']) == (stat.st_mtime_ns, stat.st_size):
+        return snapshot['metadata']
+
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    if snapshot and snapshot['sha256'] == digest:
+        metadata = snapshot['metadata']
+    else:
+        metadata = parse_schedule(path)
+
+    _write_snapshot(snapshot_path, {
+        'version': SNAPSHOT_VERSION,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': digest,
+        'metadata': metadata,
+    })
+    return metadata
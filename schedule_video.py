@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Recording Facades for the Conference Schedule Generator
+Writes recordings.html, one card per recording in slides/recordings.csv, where
+each video is a click-to-load facade: a small local thumbnail and a play
+button linking to YouTube. A tiny inline script swaps in the real player
+(youtube-nocookie.com) only when a card is clicked, so no third-party
+script or iframe loads with the page.
+
+Usage:
+    python3 schedule_video.py [schedule.json] [--recordings CSV] [-o recordings.html]
+                              [--thumbnails slides/thumbnails] [-j WORKERS]
+
+Thumbnails come from local files in slides/thumbnails/, named after the
+video id (N6ylFGJIZiA.jpg) or the slide file (08_information_retrieval.png).
+They are resized in bulk into img/video/ by the responsive image pipeline
+(schedule_images.py), which only rebuilds changed files. Recordings without
+a thumbnail, or builds without Pillow, get a plain CSS poster instead.
+
+Cards follow the program order when a recording matches an event (see
+schedule_links.py); the remaining recordings follow in CSV order.
+"""
+
+import html
+import os
+import re
+from typing import Dict, List, Optional
+
+import schedule_geneartor as generator
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+SITE_ROOT = os.path.dirname(os.path.abspath(__file__))
+THUMBNAILS_DIR = os.path.join("slides", "thumbnails")
+THUMBNAIL_OUTPUT_DIR = os.path.join("img", "video")
+THUMBNAIL_WIDTHS = (320, 480, 640)
+THUMBNAIL_SIZES = "(max-width: 400px) 100vw, 320px"
+RECORDINGS_FILENAME = "recordings.html"
+WATCH_URL = "https://www.youtube.com/watch?v="
+
+YOUTUBE_ID = re.compile(r'(?:youtu\.be/|youtube(?:-nocookie)?\.com/(?:watch\?(?:.*&)?v=|embed/|shorts/|live/))'
+                        r'([A-Za-z0-9_-]{11})')
+
+FACADE_SCRIPT = '''document.addEventListener("click", function (e) {
+    var a = e.target.closest && e.target.closest("a.video-facade");
+    if (!a || e.button || e.ctrlKey || e.metaKey || e.shiftKey) return;
+    e.preventDefault();
+    var f = document.createElement("iframe");
+    f.src = "https://www.youtube-nocookie.com/embed/" + a.dataset.video + "?autoplay=1";
+    f.title = a.getAttribute("aria-label");
+    f.allow = "autoplay; encrypted-media; picture-in-picture";
+    f.allowFullscreen = true;
+    f.className = "video-frame";
+    a.replaceWith(f);
+});'''
+
+FACADE_CSS = '''.video-facade, .video-frame {
+  display: block;
+  position: relative;
+  width: 100%;
+  aspect-ratio: 16 / 9;
+  border: 0;
+  border-radius: 8px;
+  overflow: hidden;
+  background: linear-gradient(135deg, #114e71, #2a8c9e);
+}
+
+.video-facade img {
+  width: 100%;
+  height: 100%;
+  object-fit: cover;
+}
+
+.video-play {
+  position: absolute;
+  top: 50%;
+  left: 50%;
+  width: 64px;
+  height: 44px;
+  margin: -22px 0 0 -32px;
+  border-radius: 12px;
+  background: rgba(0, 0, 0, 0.7);
+}
+
+.video-play::after {
+  content: "";
+  position: absolute;
+  top: 12px;
+  left: 26px;
+  border-style: solid;
+  border-width: 10px 0 10px 16px;
+  border-color: transparent transparent transparent white;
+}
+
+.video-facade:hover .video-play {
+  background: #c00;
+}'''
+
+RECORDINGS_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{title}} - Recordings</title>
+    <style>
+body {
+  margin: 0 auto;
+  max-width: 1100px;
+  padding: 24px;
+  font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+  color: #1d2a33;
+}
+
+.recordings {
+  display: grid;
+  grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
+  gap: 24px;
+}
+
+.recording h2 {
+  margin: 10px 0 2px;
+  font-size: 1.05rem;
+}
+
+.recording p {
+  margin: 0;
+  color: #566;
+  font-size: 0.9rem;
+}
+
+{{facade_css}}
+    </style>
+</head>
+<body>
+    <h1>{{title}} - Recordings</h1>
+    <div class="recordings">
+{{cards}}
+    </div>
+    <script>
+{{script}}
+    </script>
+</body>
+</html>
+'''
+
+COMPILED_RECORDINGS_TEMPLATE = generator.compile_template(RECORDINGS_TEMPLATE)
+
+# ============================================================================
+# RECORDINGS
+# ============================================================================
+
+def youtube_id(url: str) -> Optional[str]:
+    """The 11-character video id of a YouTube URL, or None."""
+    match = YOUTUBE_ID.search(url or "")
+    return match.group(1) if match else None
+
+def find_thumbnail(video_id: str, slides: Optional[str], root: str = SITE_ROOT,
+                   thumbnails_dir: str = THUMBNAILS_DIR) -> Optional[str]:
+    """Root-relative path of a recording's local thumbnail, if one exists."""
+    from schedule_images import IMAGE_EXTENSIONS
+    stems = [video_id] + ([os.path.splitext(slides)[0]] if slides else [])
+    for stem in stems:
+        for extension in IMAGE_EXTENSIONS:
+            path = os.path.join(thumbnails_dir, stem + extension)
+            if os.path.isfile(os.path.join(root, path)):
+                return path
+    return None
+
+def recording_entries(metadata: Dict, index, root: str = SITE_ROOT,
+                      thumbnails_dir: str = THUMBNAILS_DIR) -> List[Dict]:
+    """One entry per YouTube recording: id, url, title, presenter and thumbnail source."""
+    from schedule_search import slide_title
+    titles: Dict[int, str] = {}
+    order: List[int] = []
+    for day in metadata['days']:
+        for track in generator.iter_day_tracks(day):
+            for event in track['events']:
+                number = index.match(event)
+                if number is not None and number not in titles:
+                    titles[number] = event['title']
+                    order.append(number)
+    order += [number for number in range(len(index.rows)) if number not in titles]
+
+    entries = []
+    for number in order:
+        row = index.rows[number]
+        video_id = youtube_id(row['video'])
+        if video_id is None:
+            continue
+        title = titles.get(number) or (slide_title(row['slides']) if row['slides'] else row['presenter'])
+        entries.append({
+            'video_id': video_id,
+            'url': row['video'],
+            'title': title or video_id,
+            'presenter': row['presenter'],
+            'thumbnail': find_thumbnail(video_id, row['slides'], root, thumbnails_dir),
+        })
+    return entries
+
+def build_thumbnails(entries: List[Dict], root: str = SITE_ROOT,
+                     thumbnails_dir: str = THUMBNAILS_DIR, workers: Optional[int] = None) -> Dict:
+    """Resize every local thumbnail (see schedule_images.build_images); return the manifest images."""
+    if not any(entry['thumbnail'] for entry in entries):
+        return {}
+    from schedule_images import build_images
+    summary = build_images(root, [thumbnails_dir], os.path.join(root, THUMBNAIL_OUTPUT_DIR),
+                           THUMBNAIL_WIDTHS, workers)
+    return summary['manifest']['images']
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def facade_html(entry: Dict, images: Dict, base: str = THUMBNAIL_OUTPUT_DIR + "/") -> str:
+    """Click-to-load facade for one recording; links to YouTube without JavaScript."""
+    from schedule_images import picture_html
+    label = html.escape(f"Play: {entry['title']}")
+    thumbnail = entry['thumbnail'] and images.get(entry['thumbnail'].replace(os.sep, "/"))
+    poster = picture_html(entry['thumbnail'], thumbnail, "", THUMBNAIL_SIZES, base.replace(os.sep, "/")) \
+        if thumbnail else ""
+    return (f'<a class="video-facade" href="{WATCH_URL}{entry["video_id"]}" data-video="{entry["video_id"]}" '
+            f'aria-label="{label}">{poster}<span class="video-play"></span></a>')
+
+def recording_card(entry: Dict, images: Dict) -> str:
+    presenter = f"<p>{html.escape(entry['presenter'])}</p>" if entry['presenter'] else ""
+    return (f'        <div class="recording">{facade_html(entry, images)}'
+            f'<h2>{html.escape(entry["title"])}</h2>{presenter}</div>')
+
+def iter_recordings_html(metadata: Dict, entries: List[Dict], images: Dict):
+    """Yield recordings.html as string chunks."""
+    values = {
+        'title': metadata['conference_title'],
+        'facade_css': FACADE_CSS,
+        'cards': generator.iter_joined((recording_card(entry, images) for entry in entries), "\n"),
+        'script': FACADE_SCRIPT,
+    }
+    return generator.iter_template(COMPILED_RECORDINGS_TEMPLATE, values)
+
+def write_recordings_html(stream, metadata: Dict, entries: List[Dict], images: Dict) -> int:
+    """Stream recordings.html to a text file-like object; return characters written."""
+    written = 0
+    for chunk in iter_recordings_html(metadata, entries, images):
+        stream.write(chunk)
+        written += len(chunk)
+    return written
+
+def prepare_recordings(metadata: Dict, recordings: str, root: str = SITE_ROOT,
+                       thumbnails_dir: str = THUMBNAILS_DIR, workers: Optional[int] = None):
+    """Entries and thumbnail images for recordings.html; returns (entries, images, warning)."""
+    from schedule_links import load_recordings_index
+    entries = recording_entries(metadata, load_recordings_index(recordings), root, thumbnails_dir)
+    try:
+        return entries, build_thumbnails(entries, root, thumbnails_dir, workers), None
+    except RuntimeError as exc:
+        return entries, {}, f"{exc}; using plain posters"
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    from schedule_links import RECORDINGS_CSV
+
+    parser = argparse.ArgumentParser(description="Write recordings.html with click-to-load video facades.")
+    parser.add_argument("source", nargs="?", help="schedule file (default: SCHEDULE_METADATA)")
+    parser.add_argument("--recordings", metavar="CSV", default=RECORDINGS_CSV, help="slides/video index")
+    parser.add_argument("--thumbnails", default=THUMBNAILS_DIR,
+                        help=f"local thumbnail directory, relative to the site (default: {THUMBNAILS_DIR})")
+    parser.add_argument("-o", "--output", default=RECORDINGS_FILENAME, help="output page")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="resize processes")
+    args = parser.parse_args()
+
+    try:
+        metadata = generator.SCHEDULE_METADATA
+        if args.source:
+            from schedule_sources import load_schedule
+            metadata = load_schedule(args.source)
+        entries, images, warning = prepare_recordings(metadata, args.recordings, SITE_ROOT,
+                                                      args.thumbnails, args.workers)
+        from schedule_publish import atomic_write
+        written = atomic_write(args.output, lambda stream: write_recordings_html(stream, metadata,
+                                                                                 entries, images))
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+
+    if warning:
+        print(f"⚠ {warning}")
+    with_thumbnails = sum(1 for entry in entries if entry['thumbnail'] and entry['thumbnail'] in images)
+    print(f"✓ {args.output} ({written['bytes']} bytes): {len(entries)} recordings, "
+          f"{with_thumbnails} with thumbnails")
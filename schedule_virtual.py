@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Virtualized Output Mode for the Conference Schedule Generator
+Writes the computed layout as one compact typed-array payload plus a small
+script that renders only the days and time window currently on screen,
+instead of one absolutely positioned <div class="event"> per event.
+
+Usage:
+    python3 schedule_virtual.py [schedule.json] [-o schedule.virtual.html]
+    python3 schedule_geneartor.py --virtual      # same page as schedule.html
+
+The payload is embedded as <script type="application/json">:
+    days        [day_name, date] per day
+    offsets     day d owns rows offsets[d]:offsets[d + 1] (see compile_layout)
+    colors      color classes
+    strings     interned titles, links, recording links and inline styles
+    columns     [name, type, byte offset] of every column in data
+    data        base64 of the little-endian integer columns start, duration,
+                top (0.1 px), height (0.01 px), color, lane, lanes, title,
+                link, video, style (string ids; -1 when an event has no
+                recording or style), each stored as the narrowest of
+                Int8/Int16/Int32 that fits its values
+
+Positions are rounded in Python exactly as render_layout_event_divs rounds
+them, so the rendered events are byte-identical to schedule.html's.
+
+The browser wraps each column in a typed array view once, without copying.
+On scroll it keeps only the visible day columns (plus one on each side) in
+the DOM, and within them only the events overlapping the visible time band,
+so DOM size stays constant however many weeks the program spans. The page reuses the regular
+stylesheet, so events look the same as in schedule.html.
+"""
+
+import base64
+import json
+import sys
+from array import array
+from typing import Dict, List, Optional
+
+import schedule_geneartor as generator
+
+# ============================================================================
+# CONSTANTS AND CONFIGURATION
+# ============================================================================
+
+PAYLOAD_VERSION = 1
+COLUMNS = ('start', 'duration', 'top', 'height', 'color', 'lane', 'lanes', 'title', 'link', 'video', 'style')
+# (array typecode, JavaScript typed array) from narrowest to widest
+INT_TYPES = (('b', 'Int8Array'), ('h', 'Int16Array'), ('i', 'Int32Array'))
+DAY_WIDTH_PX = 190
+AXIS_WIDTH_PX = 70
+HEADER_HEIGHT_PX = 48
+# Events are re-rendered when scrolling crosses a band of this height
+BAND_PX = 400
+
+VIRTUAL_CSS = '''<style>
+        .vs-viewport { height: calc(100vh - 220px); min-height: 420px; overflow: auto; position: relative; }
+        .vs-canvas { position: relative; }
+        .vs-axis { position: sticky; left: 0; width: {{axis_width}}px; height: 100%; z-index: 11;
+                   background: var(--color-surface); }
+        .vs-axis .time-label { position: absolute; left: 0; right: 0; height: 20px; margin: 0; }
+        .vs-day { position: absolute; top: 0; width: {{column_width}}px; }
+        .vs-day .day-header { height: {{header_height}}px; box-sizing: border-box; margin: 0;
+                              white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+        .vs-day .events-container { margin-top: 8px; }
+    </style>'''
+
+VIRTUAL_SCRIPT = '''<script>
+    (function () {
+        var data = JSON.parse(document.getElementById("schedule-data").textContent);
+        var types = {Int8Array: Int8Array, Int16Array: Int16Array, Int32Array: Int32Array};
+        var raw = atob(data.data), bytes = new Uint8Array(raw.length), col = {};
+        for (var i = 0; i < raw.length; i++) bytes[i] = raw.charCodeAt(i);
+        data.columns.forEach(function (c) { col[c[0]] = new types[c[1]](bytes.buffer, c[2], data.rows); });
+        var strings = data.strings, days = data.days, offsets = data.offsets, px = data.px;
+        var viewport = document.getElementById("vs-viewport"), canvas = document.getElementById("vs-canvas");
+        var axis = data.axisWidth, dayWidth = data.dayWidth, bodyTop = data.headerHeight + 8;
+        canvas.style.width = axis + days.length * dayWidth + "px";
+        canvas.style.height = bodyTop + data.height + "px";
+
+        function hhmm(m) { return ("0" + Math.floor(m / 60)).slice(-2) + ":" + ("0" + m % 60).slice(-2); }
+        var labels = [];
+        for (var m = data.origin; m <= data.end; m += 30) {
+            labels.push('<div class="time-label" style="top:' + (bodyTop + (m - data.origin) * px - 10).toFixed(1) +
+                        'px">' + hhmm(m) + '</div>');
+        }
+        document.getElementById("vs-axis").innerHTML = labels.join("");
+
+        function renderDay(d, lo, hi) {
+            var html = ['<div class="day-header">', days[d][0], ' ', days[d][1], '</div><div class="events-container">'];
+            for (var r = offsets[d]; r < offsets[d + 1]; r++) {
+                var top = col.top[r] / 10, height = col.height[r] / 100;
+                if (top + height < lo || top > hi) continue;
+                var style = "top: " + top.toFixed(1) + "px; height: " + height.toFixed(2) + "px";
+                if (col.lanes[r] > 1) {
+                    var width = 100 / col.lanes[r];
+                    style += "; left: " + (col.lane[r] * width).toFixed(3) + "%; right: auto; width: " + width.toFixed(3) + "%";
+                }
+                if (col.style[r] >= 0) style += "; " + strings[col.style[r]];
+                html.push('<div class="event ', data.colors[col.color[r]], '" style="', style, ';"><a href="',
+                          strings[col.link[r]], '">', strings[col.title[r]], '</a>');
+                if (col.video[r] >= 0) html.push('<a class="event-video" href="', strings[col.video[r]], '">\\u25b6 Recording</a>');
+                html.push('<div class="event-time">', hhmm(col.start[r]), ' \\u2013 ',
+                          hhmm(col.start[r] + col.duration[r]), '</div></div>');
+            }
+            html.push('</div>');
+            return html.join("");
+        }
+
+        var shown = {}, pending = false;
+        function update() {
+            pending = false;
+            var x = viewport.scrollLeft - axis, band = Math.floor(Math.max(0, viewport.scrollTop - bodyTop) / data.band);
+            var first = Math.max(0, Math.floor(x / dayWidth) - 1);
+            var last = Math.min(days.length - 1, Math.floor((x + viewport.clientWidth) / dayWidth) + 1);
+            var lo = (band - 1) * data.band, hi = (band + 1) * data.band + viewport.clientHeight;
+            Object.keys(shown).forEach(function (d) {
+                if (d < first || d > last) { canvas.removeChild(shown[d].element); delete shown[d]; }
+            });
+            for (var d = first; d <= last; d++) {
+                var entry = shown[d];
+                if (entry && entry.band === band) continue;
+                if (!entry) {
+                    entry = shown[d] = {element: document.createElement("div")};
+                    entry.element.className = "day-column vs-day";
+                    entry.element.style.left = axis + d * dayWidth + "px";
+                    canvas.appendChild(entry.element);
+                }
+                entry.band = band;
+                entry.element.innerHTML = renderDay(d, lo, hi);
+            }
+        }
+        function schedule() { if (!pending) { pending = true; requestAnimationFrame(update); } }
+        viewport.addEventListener("scroll", schedule, {passive: true});
+        addEventListener("resize", schedule);
+        update();
+    })();
+    </script>'''
+
+VIRTUAL_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{title}}</title>
+    {{stylesheet}}
+    {{virtual_css}}
+</head>
+<body>
+    <div class="header">
+        <h1>{{title}}</h1>
+        <p>{{dates}}</p>
+    </div>
+
+    <div class="schedule-container vs-viewport" id="vs-viewport">
+        <div class="vs-canvas" id="vs-canvas"><div class="vs-axis" id="vs-axis"></div></div>
+    </div>
+    <script id="schedule-data" type="application/json">{{payload}}</script>
+    {{script}}
+</body>
+</html>
+'''
+
+COMPILED_VIRTUAL_TEMPLATE = generator.compile_template(VIRTUAL_TEMPLATE)
+COMPILED_VIRTUAL_CSS = generator.compile_template(VIRTUAL_CSS)
+
+# ============================================================================
+# PAYLOAD
+# ============================================================================
+
+def event_style(event: Dict) -> Optional[str]:
+    """The optional inline styling render_layout_event_divs adds, or None."""
+    parts = []
+    if event.get('font_weight'):
+        parts.append(f"font-weight: {event['font_weight']}")
+    if event.get('font_size'):
+        parts.append(f"font-size: {event['font_size']}")
+    return "; ".join(parts) or None
+
+def narrowest_type(values) -> tuple:
+    """(typecode, JavaScript typed array) of the smallest signed type holding values."""
+    low, high = min(values, default=0), max(values, default=0)
+    for typecode, js_type in INT_TYPES:
+        bound = 1 << (8 * array(typecode).itemsize - 1)
+        if -bound <= low and high < bound:
+            return typecode, js_type
+    raise ValueError(f"layout value out of range: {low}..{high}")
+
+def layout_payload(metadata: Dict) -> Dict:
+    """Compile the program into the compact payload described above."""
+    days = metadata['days']
+    with generator.PROFILER.span('layout'):
+        layout = generator.compute_geometry(generator.compile_layout(days))
+
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(text: Optional[str]) -> int:
+        if text is None:
+            return -1
+        sid = string_ids.get(text)
+        if sid is None:
+            sid = string_ids[text] = len(strings)
+            strings.append(text)
+        return sid
+
+    # Same rounding as render_layout_event_divs, as integers
+    top = array('i', [int(f"{value:.1f}".replace('.', '')) for value in layout['top_px']])
+    height = array('i', [int(f"{value:.2f}".replace('.', '')) for value in layout['height_px']])
+    title, link, video, style = array('i'), array('i'), array('i'), array('i')
+    for event in layout['events']:
+        title.append(intern(event['title']))
+        link.append(intern(event['link']))
+        video.append(intern(event.get('video_link') or None))
+        style.append(intern(event_style(event)))
+
+    data = bytearray()
+    columns = []
+    for name, values in zip(COLUMNS, (layout['start'], layout['duration'], top, height, layout['color_id'],
+                                      layout['lane'], layout['lanes'], title, link, video, style)):
+        typecode, js_type = narrowest_type(values)
+        packed = array(typecode, values)
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        # Typed array views must start at a multiple of their element size
+        data += bytes(-len(data) % 4)
+        columns.append([name, js_type, len(data)])
+        data += packed.tobytes()
+    generator.PROFILER.count('events_rendered', len(layout['events']))
+
+    return {
+        'version': PAYLOAD_VERSION,
+        'origin': generator.SCHEDULE_START_MINUTES,
+        'end': generator.SCHEDULE_END_MINUTES,
+        'px': generator.PX_PER_MINUTE,
+        'height': generator.TOTAL_HEIGHT_PX,
+        'dayWidth': DAY_WIDTH_PX,
+        'axisWidth': AXIS_WIDTH_PX,
+        'headerHeight': HEADER_HEIGHT_PX,
+        'band': BAND_PX,
+        'days': [[day['day_name'], day['date']] for day in days],
+        'offsets': list(layout['day_offsets']),
+        'colors': layout['colors'],
+        'strings': strings,
+        'rows': len(layout['events']),
+        'columns': columns,
+        'data': base64.b64encode(bytes(data)).decode('ascii'),
+    }
+
+# ============================================================================
+# PAGE
+# ============================================================================
+
+def iter_virtual_html(metadata: Optional[Dict] = None, stylesheet_href: Optional[str] = None):
+    """Yield the virtualized page as string chunks (see iter_full_html)."""
+    if metadata is None:
+        metadata = generator.SCHEDULE_METADATA
+    payload = json.dumps(layout_payload(metadata), ensure_ascii=False, separators=(',', ':'))
+    values = generator.page_fields(metadata, stylesheet_href)
+    values['virtual_css'] = generator.render_template(COMPILED_VIRTUAL_CSS, {
+        'axis_width': str(AXIS_WIDTH_PX),
+        'column_width': str(DAY_WIDTH_PX - 8),
+        'header_height': str(HEADER_HEIGHT_PX),
+    })
+    values['payload'] = payload.replace('</', '<\\/')
+    values['script'] = VIRTUAL_SCRIPT
+    return generator.iter_template(COMPILED_VIRTUAL_TEMPLATE, values)
+
+def write_virtual_html(stream, metadata: Optional[Dict] = None,
+                       stylesheet_href: Optional[str] = None) -> int:
+    """Stream the virtualized page to stream; return the characters written."""
+    written = 0
+    with generator.PROFILER.span('write_virtual_html'):
+        for chunk in iter_virtual_html(metadata, stylesheet_href):
+            stream.write(chunk)
+            written += len(chunk)
+    generator.PROFILER.count('characters_written', written)
+    return written
+
+def generate_virtual_html(metadata: Optional[Dict] = None,
+                          stylesheet_href: Optional[str] = None) -> str:
+    return ''.join(iter_virtual_html(metadata, stylesheet_href))
+
+# ============================================================================
+# MAIN - EXECUTION
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write the schedule as a payload plus virtualized renderer.")
+    parser.add_argument("source", nargs="?", help="schedule file (default: SCHEDULE_METADATA)")
+    parser.add_argument("-o", "--output", default="schedule.virtual.html", help="output page")
+    args = parser.parse_args()
+
+    try:
+        metadata = None
+        if args.source:
+            from schedule_sources import load_schedule
+            metadata = load_schedule(args.source)
+        stylesheet = generator.write_stylesheet(".")
+        with open(args.output, "w", encoding="utf-8") as f:
+            written = write_virtual_html(f, metadata, stylesheet)
+    except (OSError, ValueError) as exc:
+        parser.exit(1, f"✗ {exc}\n")
+    print(f"✓ {args.output} ({written} bytes) + {stylesheet}")
@@ -0,0 +1,36 @@
+import pytest
+
+from schedule_links import RECORDINGS_CSV, RecordingsIndex, STOPWORDS, resolve_links
+
+@pytest.fixture(scope="module")
+def index():
+    return RecordingsIndex.from_csv(RECORDINGS_CSV)
+
+def slides_for(index, title):
+    number = index.match({'title': title})
+    return None if number is None else index.rows[number]['slides']
+
+def test_stopwords_are_generic_english():
+    assert not {"lab", "session", "trends", "co", "includes"} & STOPWORDS
+
+def test_subtitle_does_not_dilute_the_match(index):
+    assert slides_for(index, "Learning on Graphs: GNNs in Document Analysis") \
+        == "07_learning_on_graphs_and_specific_domains.pdf"
+
+def test_abbreviated_title_matches(index):
+    assert slides_for(index, "Trends on Trustworthy Doc Analysis") == "03_trustworthy_document_analysis.pdf"
+
+@pytest.mark.parametrize("title", [
+    "Lab Session - GNNs (includes coffee)",
+    "Lab Session - Agentic GraphRAG",
+    "Knowledge Graph Embeddings and Knowledge Representation",
+    # Two historical_* rows fit equally well
+    "Trends on Historical Doc Analysis",
+])
+def test_weak_or_ambiguous_titles_do_not_match(index, title):
+    assert slides_for(index, title) is None
+
+def test_program_matches_the_recordings(index):
+    import schedule_geneartor as generator
+    _, report = resolve_links(generator.SCHEDULE_METADATA, index)
+    assert report['matched_rows'] == 2
@@ -0,0 +1,62 @@
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import schedule_geneartor as generator
+from schedule_search import build_search
+
+# Loads search.js with fetch() reading the index from disk, runs each query
+# and prints the matching titles per query as JSON.
+NODE_RUNNER = '''
+const fs = require("fs"), path = require("path");
+const dir = process.argv[1], queries = JSON.parse(process.argv[2]);
+global.document = {};
+global.fetch = (name) => Promise.resolve({ok: true, json: () => JSON.parse(fs.readFileSync(path.join(dir, name)))});
+eval(fs.readFileSync(path.join(dir, "search.js"), "utf8") + "; global.SSDASearch = SSDASearch;");
+Promise.all(queries.map((q) => SSDASearch.query(q))).then((results) => {
+  console.log(JSON.stringify(results.map((hits) => hits.map((hit) => hit.title))));
+});
+'''
+
+@pytest.fixture(scope="module")
+def search_dir(tmp_path_factory):
+    root = tmp_path_factory.mktemp("search")
+    slides = root / "slides"
+    slides.mkdir()
+    cwd = root / "cwd"
+    cwd.mkdir()
+    # The slide text cache is created in the working directory
+    previous = os.getcwd()
+    os.chdir(cwd)
+    try:
+        build_search(generator.SCHEDULE_METADATA, str(root / "search"), str(slides), recordings=None)
+    finally:
+        os.chdir(previous)
+    return root / "search"
+
+def run_queries(search_dir, queries):
+    if shutil.which("node") is None:
+        pytest.skip("node is not installed")
+    output = subprocess.run(["node", "-e", NODE_RUNNER, str(search_dir), json.dumps(queries)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+def test_index_describes_dropped_terms(search_dir):
+    index = json.loads((search_dir / "index.json").read_text())
+    assert "and" in index["stopwords"]
+    assert index["maxLength"] > 0
+
+def test_query_with_stopwords_finds_the_event(search_dir):
+    with_stopword, without, leading, title = run_queries(
+        search_dir, ["vision and language", "vision language", "the hiking", "Learning on Graphs"])
+    assert "Vision and Language" in with_stopword
+    assert with_stopword == without
+    assert "Hiking" in leading
+    assert "Learning on Graphs: GNNs in Document Analysis" in title
+
+def test_lone_stopword_is_still_a_prefix(search_dir):
+    (hits,) = run_queries(search_dir, ["an"])
+    assert any("Analysis" in hit for hit in hits)